@@ -0,0 +1,129 @@
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def data_source(id: int) -> dict:
+    return {"id": id, "oddrn": f"//ds/{id}", "name": f"ds_{id}", "active": True}
+
+
+def search_item(id: int) -> dict:
+    return {
+        "id": id,
+        "oddrn": f"//s3/buckets/bench/keys/dataset_{id}",
+        "external_name": f"dataset_{id}",
+        "entity_classes": [{"id": 1, "name": "DATA_SET"}],
+        "data_source": data_source(id % 10),
+        "created_at": "2022-06-01T10:00:00Z",
+        "updated_at": "2022-06-01T10:00:00Z",
+    }
+
+
+def relative(id: int) -> dict:
+    return {"id": id, "entity_classes": [], "external_name": f"dataset_{id}"}
+
+
+def data_entity(id: int, entities: int) -> dict:
+    """Data entity with lineage chain 1 -> 2 -> ... -> entities"""
+    return {
+        **search_item(id),
+        "entity_classes": [{"id": 1, "name": "DATA_SET", "types": []}],
+        "type": {"id": 1, "name": "TABLE"},
+        "tags": [{"id": 1, "name": "bench"}],
+        "metadata_field_values": [],
+        "source_list": [relative(id - 1)] if id > 1 else [],
+        "target_list": [relative(id + 1)] if id < entities else [],
+    }
+
+
+class FakePlatform:
+    """ODD platform stand-in serving search, data entities and data sources
+
+    Args:
+        entities (int): number of data entities in catalog
+        latency (float): seconds added to each response
+        port (int): port to listen, random free port by default
+    """
+
+    def __init__(self, entities: int = 10_000, latency: float = 0.0, port: int = 0):
+        self.entities = entities
+        self.latency = latency
+        self.__server = ThreadingHTTPServer(("127.0.0.1", port), self.__handler())
+        self.__server.daemon_threads = True
+        self.__thread = threading.Thread(target=self.__server.serve_forever)
+        self.__thread.daemon = True
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "FakePlatform":
+        self.__thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def __handler(self):
+        platform = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                if self.path == "/api/search":
+                    return self.reply({"search_id": "bench"})
+                self.reply({}, 404)
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: int(v[0]) for k, v in parse_qs(url.query).items()}
+
+                if re.fullmatch(r"/api/search/\w+/results", url.path):
+                    return self.reply(platform.page(query["page"], query["size"]))
+
+                match = re.fullmatch(r"/api/dataentities/(\d+)", url.path)
+                if match and 0 < int(match.group(1)) <= platform.entities:
+                    return self.reply(
+                        data_entity(int(match.group(1)), platform.entities)
+                    )
+
+                if url.path == "/api/datasources":
+                    return self.reply({"items": [data_source(i) for i in range(10)]})
+
+                self.reply({}, 404)
+
+            def reply(self, body: dict, status: int = 200):
+                if platform.latency:
+                    time.sleep(platform.latency)
+
+                content = json.dumps(body).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def page(self, page: int, size: int) -> dict:
+        start = (page - 1) * size + 1
+        ids = range(start, min(start + size, self.entities + 1))
+
+        return {
+            "items": [search_item(id) for id in ids],
+            "page_info": {
+                "total": self.entities,
+                "has_next": ids.stop <= self.entities,
+            },
+        }
@@ -0,0 +1,100 @@
+import io
+import logging
+from typing import Dict
+
+import numpy as np
+import pandas as pd
+
+try:
+    import boto3
+    from moto.server import ThreadedMotoServer
+except ImportError as e:
+    raise ImportError(
+        "Benchmarks need moto server, install dev dependencies: poetry install"
+    ) from e
+
+BUCKET = "bench"
+
+
+def generate_dataframe(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "amount": rng.normal(100, 20, rows),
+            "quantity": rng.integers(0, 1000, rows),
+            "country": rng.choice(["UA", "PL", "DE", "US"], rows),
+            "comment": rng.choice(["new", "returned", "paid", None], rows),
+        }
+    )
+
+
+class FakeS3:
+    """S3 compatible stand-in with generated datasets
+
+    Datasets are written to bucket "bench":
+        csv/data.csv - one csv file
+        parquet/data.parquet - one parquet file
+        partitioned/year=Y/part.parquet - hive partitioned parquet dataset
+
+    Args:
+        rows (int): number of rows in each dataset
+        files (int): number of partitions of partitioned dataset
+        port (int): port to listen
+    """
+
+    def __init__(self, rows: int = 1_000_000, files: int = 8, port: int = 5055):
+        self.rows = rows
+        self.files = files
+        self.port = port
+        self.__server = ThreadedMotoServer(port=port)
+
+    @property
+    def endpoint_url(self) -> str:
+        return f"http://127.0.0.1:{self.port}"
+
+    def __enter__(self) -> "FakeS3":
+        logging.getLogger("werkzeug").setLevel(logging.ERROR)
+        self.__server.start()
+        self.__upload(self.__datasets())
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.__server.stop()
+
+    def oddrn(self, key: str) -> str:
+        """Oddrn of dataset, folders of key are joined with ":" as in s3 adapter"""
+        return f"//s3/cloud/aws/buckets/{BUCKET}/keys/{key.replace('/', ':')}"
+
+    def __datasets(self) -> Dict[str, bytes]:
+        df = generate_dataframe(self.rows)
+        datasets = {
+            "csv/data.csv": df.to_csv(index=False).encode(),
+            "parquet/data.parquet": self.__to_parquet(df),
+        }
+
+        for i, part in enumerate(np.array_split(df, self.files)):
+            datasets[f"partitioned/year={2000 + i}/part.parquet"] = self.__to_parquet(
+                part
+            )
+
+        return datasets
+
+    def __upload(self, datasets: Dict[str, bytes]) -> None:
+        s3 = boto3.client(
+            "s3",
+            endpoint_url=self.endpoint_url,
+            region_name="us-east-1",
+            aws_access_key_id="bench",
+            aws_secret_access_key="bench",
+        )
+        s3.create_bucket(Bucket=BUCKET)
+
+        for key, body in datasets.items():
+            s3.put_object(Bucket=BUCKET, Key=key, Body=body)
+
+    @staticmethod
+    def __to_parquet(df: pd.DataFrame) -> bytes:
+        buffer = io.BytesIO()
+        df.to_parquet(buffer, engine="pyarrow", index=False, row_group_size=100_000)
+        return buffer.getvalue()
@@ -0,0 +1,223 @@
+"""Benchmarks of odd-ml against local stand-ins for ODD platform and S3
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --entities 50000 --latency 0.005 --output results.json
+    python -m benchmarks.run --baseline results.json --tolerance 0.2
+
+With --baseline exits with code 1 if any result is worse than baseline
+by more than tolerance.
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+from typing import Callable, Dict, List, Optional
+
+from prettytable import PrettyTable
+
+from benchmarks.fake_platform import FakePlatform
+from benchmarks.fake_s3 import FakeS3
+from odd_ml.client import Client
+from odd_ml.dataset_storage.s3_storage import S3Storage
+from odd_ml.domain import AwsConfig
+from odd_ml.http.http_client import SearchConfig
+from odd_ml.profiler import StreamingProfiler
+
+Result = Dict[str, object]
+
+
+def result(name: str, value: float, unit: str, higher_is_better: bool) -> Result:
+    return {
+        "name": name,
+        "value": round(value, 3),
+        "unit": unit,
+        "higher_is_better": higher_is_better,
+    }
+
+
+def timed(func: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def percentile(values: List[float], q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1]
+
+
+def bench_import(runs: int = 5) -> List[Result]:
+    """Startup time of fresh interpreter importing odd_ml, best of runs"""
+
+    def startup(code: str) -> float:
+        return min(
+            timed(lambda: subprocess.run([sys.executable, "-c", code], check=True))
+            for _ in range(runs)
+        )
+
+    baseline = startup("pass")
+    client = startup("from odd_ml import Client; Client('http://platform')")
+    profiler = startup("from odd_ml.profiler import PandasProfiler, StreamingProfiler")
+
+    return [
+        result("import odd_ml client", (client - baseline) * 1000, "ms", False),
+        result("import odd_ml profilers", (profiler - baseline) * 1000, "ms", False),
+    ]
+
+
+def bench_search(client: Client, entities: int, page_size: int) -> List[Result]:
+    config = SearchConfig(size=page_size)
+
+    items = timed(lambda: sum(1 for _ in client.iter_data_entities(config)))
+    frame = timed(lambda: client.get_data_entities_frame(config, all_pages=True))
+
+    return [
+        result("search pagination, models", entities / items, "items/s", True),
+        result("search pagination, frame", entities / frame, "items/s", True),
+    ]
+
+
+def bench_entities(client: Client, requests: int) -> List[Result]:
+    latencies = [
+        timed(lambda: client.get_data_entity_by_id(id)) * 1000
+        for id in range(1, requests + 1)
+    ]
+    ids = range(1, requests + 1)
+    parallel = timed(lambda: client.get_data_entities_by_ids(ids))
+    lineage = timed(lambda: client.get_lineage(requests // 2, depth=10))
+
+    return [
+        result("entity fetch p50", percentile(latencies, 50), "ms", False),
+        result("entity fetch p95", percentile(latencies, 95), "ms", False),
+        result("entity fetch p99", percentile(latencies, 99), "ms", False),
+        result("entity fetch, parallel", requests / parallel, "entities/s", True),
+        result("lineage, 10 hops both ways", lineage * 1000, "ms", False),
+    ]
+
+
+def dataset(s3: FakeS3, key: str) -> SimpleNamespace:
+    return SimpleNamespace(id=1, oddrn=s3.oddrn(key), entity_class_names=["DATA_SET"])
+
+
+def bench_datasets(s3: FakeS3, client: Client) -> List[Result]:
+    results = []
+
+    for key in ("csv/data.csv", "parquet/data.parquet", "partitioned"):
+        entity = dataset(s3, key)
+        seconds = timed(lambda: client.get_dataframe(entity))
+        results.append(result(f"read {key}", s3.rows / seconds, "rows/s", True))
+
+    entity = dataset(s3, "partitioned")
+    seconds = timed(lambda: sum(len(c) for c in client.iter_dataframe_chunks(entity)))
+    results.append(
+        result("read partitioned, chunks", s3.rows / seconds, "rows/s", True)
+    )
+
+    return results
+
+
+def bench_profiling(s3: FakeS3, client: Client) -> List[Result]:
+    df = client.get_dataframe(dataset(s3, "parquet/data.parquet"))
+
+    with StreamingProfiler() as profiler:
+        seconds = timed(lambda: profiler.profile(df))
+
+    return [result("streaming profile", seconds, "s", False)]
+
+
+def compare(
+    results: List[Result], baseline: List[Result], tolerance: float
+) -> List[str]:
+    """Names of results worse than baseline by more than tolerance"""
+    previous = {r["name"]: r["value"] for r in baseline}
+    regressions = []
+
+    for r in results:
+        if not previous.get(r["name"]):
+            continue
+
+        change = r["value"] / previous[r["name"]] - 1
+        if not r["higher_is_better"]:
+            change = -change
+
+        if change < -tolerance:
+            regressions.append(r["name"])
+
+    return regressions
+
+
+def show(results: List[Result], baseline: Optional[List[Result]]) -> None:
+    previous = {r["name"]: r["value"] for r in baseline or []}
+
+    table = PrettyTable()
+    table.align = "l"
+    table.field_names = ["Benchmark", "Value", "Unit", "Baseline"]
+    table.add_rows(
+        [
+            [r["name"], r["value"], r["unit"], previous.get(r["name"], "")]
+            for r in results
+        ]
+    )
+    print(table)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=10_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--files", type=int, default=8)
+    parser.add_argument("--s3-port", type=int, default=5055)
+    parser.add_argument("--output", help="save results to json file")
+    parser.add_argument("--baseline", help="compare with results saved before")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = bench_import()
+
+    with FakePlatform(args.entities, args.latency) as platform:
+        client = Client(platform.url)
+        results += bench_search(client, args.entities, args.page_size)
+        results += bench_entities(client, args.requests)
+        client.close()
+
+    with FakeS3(args.rows, args.files, args.s3_port) as s3:
+        storage = S3Storage(
+            AwsConfig(
+                aws_access_key_id="bench",
+                aws_secret_access_key="bench",
+                aws_region="us-east-1",
+                aws_endpoint_url=s3.endpoint_url,
+            )
+        )
+        client = Client("http://platform", storage)
+        results += bench_datasets(s3, client)
+        results += bench_profiling(s3, client)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+
+    show(results, baseline)
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if baseline is not None:
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1 +1,17 @@
-from odd_ml.client import Client
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from odd_ml.client import Client
+
+__all__ = ["Client"]
+
+
+def __getattr__(name: str):
+    # Client is imported on first access, so "import odd_ml" stays cheap
+    if name == "Client":
+        from odd_ml.client import Client
+
+        globals()["Client"] = Client
+        return Client
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
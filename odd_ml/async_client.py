@@ -0,0 +1,156 @@
+import asyncio
+from functools import partial
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+from odd_ml.dataset_storage.dataset_storage import DatasetStorage, PartitionFilter
+from odd_ml.domain.data_entities import DataEntities, DataEntity
+from odd_ml.domain.data_source import GetDataSourcesResult
+from odd_ml.helpers.dataframe_filters import Filters
+from odd_ml.http.async_http_client import AsyncHttpClient
+from odd_ml.http.http_client import HttpConfig, SearchConfig
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class AsyncClient:
+    """Asyncio client for retrieving data from odd-platform
+
+    Example:
+        async with AsyncClient('http://localhost:8080') as client:
+            entities = await asyncio.gather(
+                *(client.get_data_entity_by_id(id) for id in ids)
+            )
+    """
+
+    def __init__(
+        self,
+        platform_url,
+        storage: Optional[DatasetStorage] = None,
+        http_config: Optional[HttpConfig] = None,
+        max_concurrency: int = 10,
+    ):
+        """Creating client
+
+        Args:
+            platform_url (str): url to odd-platform
+            storage (DatasetStorage): using for getting dataframe from datasets
+            http_config (HttpConfig, optional): connection pool, timeouts and retries settings
+            max_concurrency (int): max number of requests to odd-platform in flight
+        """
+        self.__storage = storage
+        self.__http = AsyncHttpClient(platform_url, http_config, max_concurrency)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def close(self):
+        """Close connections to odd-platform"""
+        await self.__http.close()
+
+    @property
+    def storage(self):
+        return self.__storage
+
+    @storage.setter
+    def storage(self, storage: DatasetStorage):
+        if not isinstance(storage, DatasetStorage):
+            raise Exception("Storage must be an instance of DatasetStorage")
+
+        self.__storage = storage
+
+    async def get_data_entities(
+        self,
+        search_config: Optional[SearchConfig] = None,
+    ) -> DataEntities:
+        """Getting list of data entities
+
+        Args:
+            search_config: SearchConfig
+        Returns:
+            SearchResult
+        """
+        if search_config is None:
+            search_config = SearchConfig()
+
+        return await self.__http.search(search_config)
+
+    async def get_data_sources(
+        self, page: int = 1, size: int = 100
+    ) -> GetDataSourcesResult:
+        """List of DataSources
+
+        Returns:
+            GetDataSourcesResult
+        """
+        return await self.__http.get_data_sources(page, size)
+
+    async def get_data_entity_by_id(self, id: int) -> DataEntity:
+        """Getting data entity id
+
+        Args:
+            id (int): id of data entity
+
+        Returns:
+            DataEntity
+        """
+        return await self.__http.get_data_entity_by_id(id)
+
+    async def get_data_entities_by_ids(
+        self, ids: Iterable[int]
+    ) -> Dict[int, Union[DataEntity, Exception]]:
+        """Getting many data entities concurrently
+
+        Args:
+            ids (list of int): ids of data entities, duplicates are fetched once
+
+        Returns:
+            dict: data entity or raised exception by id, in order of given ids
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        results = await asyncio.gather(
+            *(self.__http.get_data_entity_by_id(id) for id in unique_ids),
+            return_exceptions=True,
+        )
+
+        return dict(zip(unique_ids, results))
+
+    async def get_dataframe(
+        self,
+        data_entity: DataEntity,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> "pd.DataFrame":
+        """Getting DataFrame from DataEntity
+
+        Storage is blocking, so dataset is read in default executor
+        without blocking event loop.
+
+        Args:
+            data_entity (DataEntity): data entity
+            partition_filter (callable, optional): gets partition values of file,
+                returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form
+
+        Returns:
+            pandas.DataFrame: pandas DataFrame
+        """
+        if self.__storage is None:
+            raise Exception("Storage is not set")
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            partial(
+                self.__storage.get_dataframe,
+                data_entity=data_entity,
+                partition_filter=partition_filter,
+                columns=columns,
+                filters=filters,
+            ),
+        )
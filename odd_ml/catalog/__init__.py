@@ -0,0 +1 @@
+from odd_ml.catalog.catalog_index import CatalogEntry, CatalogIndex
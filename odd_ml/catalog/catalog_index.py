@@ -0,0 +1,305 @@
+import bisect
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from pydantic import BaseModel
+
+from odd_ml.helpers.asci_renderer import PAGE_SIZE, show_table
+
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Lowercase words of text, snake_case and dotted names are split too"""
+    return TOKEN_PATTERN.findall(text.lower()) if text else []
+
+
+def record_from_item(
+    item: Dict[str, Any], tags: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Index record from raw search result item"""
+    data_source = item.get("data_source") or {}
+
+    return {
+        "id": item["id"],
+        "oddrn": item["oddrn"],
+        "name": item.get("internal_name") or item["external_name"],
+        "entity_classes": [c["name"] for c in item.get("entity_classes") or []],
+        "data_source_id": data_source.get("id"),
+        "tags": tags or [],
+        "updated_at": item.get("updated_at"),
+    }
+
+
+class CatalogEntry(BaseModel):
+    id: int
+    oddrn: str
+    name: str
+    entity_classes: List[str] = []
+    data_source_id: Optional[int]
+    tags: List[str] = []
+    updated_at: Optional[str]
+
+
+class CatalogIndex:
+    """Local index of data entities for fast offline lookups
+
+    Entries are kept in memory with inverted indexes by name words, tags,
+    entity classes and data sources, and persisted to json file between sessions.
+    Index is filled by Client.sync_catalog, only changed entities are updated
+    on next syncs.
+
+    Example:
+        client = Client('http://localhost:8080', catalog=CatalogIndex())
+        client.sync_catalog()
+        client.find_data_entities("orders", tag="finance")
+
+    Args:
+        path (str): file for persisted index, None to keep index only in memory
+        max_age (float): seconds after last sync when index is considered stale
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = "~/.cache/odd_ml/catalog.json",
+        max_age: float = 3600,
+    ) -> None:
+        self.__path = Path(path).expanduser() if path else None
+        self.__max_age = max_age
+        self.__lock = threading.RLock()
+
+        self.__entries: Dict[int, Dict[str, Any]] = {}
+        self.__data_sources: Dict[int, str] = {}
+        self.__synced_at: Optional[float] = None
+
+        self.__by_oddrn: Dict[str, int] = {}
+        self.__by_token: Dict[str, Set[int]] = {}
+        self.__by_tag: Dict[str, Set[int]] = {}
+        self.__by_class: Dict[str, Set[int]] = {}
+        self.__by_data_source: Dict[int, Set[int]] = {}
+        self.__tokens: List[str] = []
+
+        if self.__path is not None and self.__path.exists():
+            self.__load()
+
+    @property
+    def synced_at(self) -> Optional[float]:
+        return self.__synced_at
+
+    @property
+    def is_stale(self) -> bool:
+        return (
+            self.__synced_at is None or time.time() - self.__synced_at > self.__max_age
+        )
+
+    @property
+    def data_sources(self) -> Dict[int, str]:
+        """Names of synced data sources by id"""
+        return dict(self.__data_sources)
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def updated_at(self, id: int) -> Optional[str]:
+        """updated_at of indexed entity, None if entity is not indexed"""
+        entry = self.__entries.get(id)
+        return entry["updated_at"] if entry else None
+
+    def update(
+        self,
+        records: Iterable[Dict[str, Any]],
+        data_sources: Optional[Dict[int, str]] = None,
+        present_ids: Optional[Iterable[int]] = None,
+    ) -> None:
+        """Add or replace entries and mark index as synced
+
+        Args:
+            records (iterable of dict): new or changed entries in CatalogEntry format
+            data_sources (dict, optional): names of data sources by id
+            present_ids (iterable of int, optional): ids of all data entities
+                on platform, other entries are removed
+        """
+        with self.__lock:
+            for record in records:
+                self.__remove(record["id"])
+                self.__add(record)
+
+            if present_ids is not None:
+                for id in set(self.__entries) - set(present_ids):
+                    self.__remove(id)
+
+            if data_sources is not None:
+                self.__data_sources = dict(data_sources)
+
+            self.__tokens = sorted(self.__by_token)
+            self.__synced_at = time.time()
+            self.__save()
+
+    def get(self, id: int) -> Optional[CatalogEntry]:
+        entry = self.__entries.get(id)
+        return CatalogEntry.construct(**entry) if entry else None
+
+    def get_by_oddrn(self, oddrn: str) -> Optional[CatalogEntry]:
+        id = self.__by_oddrn.get(oddrn)
+        return self.get(id) if id is not None else None
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        data_source_id: Optional[int] = None,
+        entity_class: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[CatalogEntry]:
+        """Find entries matching all given conditions
+
+        Every word of query must be a prefix of some word of entry name or oddrn,
+        so partially typed names are matched too.
+
+        Args:
+            query (str, optional): words of name or oddrn
+            tag (str, optional): tag name
+            data_source_id (int, optional): id of data source
+            entity_class (str, optional): entity class name, i.e. DATA_SET
+            limit (int, optional): max number of entries
+
+        Returns:
+            list of CatalogEntry: found entries ordered by id
+        """
+        with self.__lock:
+            candidates: List[Set[int]] = []
+
+            for token in tokenize(query):
+                candidates.append(self.__prefix_ids(token))
+            if tag is not None:
+                candidates.append(self.__by_tag.get(tag.lower(), set()))
+            if data_source_id is not None:
+                candidates.append(self.__by_data_source.get(data_source_id, set()))
+            if entity_class is not None:
+                candidates.append(self.__by_class.get(entity_class.upper(), set()))
+
+            if candidates:
+                candidates.sort(key=len)
+                ids = set(candidates[0]).intersection(*candidates[1:])
+            else:
+                ids = set(self.__entries)
+
+            ids = sorted(ids)[:limit]
+            return [CatalogEntry.construct(**self.__entries[id]) for id in ids]
+
+    def clear(self) -> None:
+        with self.__lock:
+            for id in list(self.__entries):
+                self.__remove(id)
+            self.__data_sources = {}
+            self.__tokens = []
+            self.__synced_at = None
+            self.__save()
+
+    def show_table(
+        self,
+        entries: Optional[List[CatalogEntry]] = None,
+        page: int = 1,
+        page_size: Optional[int] = PAGE_SIZE,
+        as_html: Optional[bool] = None,
+    ):
+        entries = entries if entries is not None else self.search()
+        rows = (
+            [e.id, e.name, ", ".join(e.entity_classes), ", ".join(e.tags)]
+            for e in entries
+        )
+
+        show_table(
+            ["Id", "Name", "Classes", "Tags"],
+            rows,
+            title="Catalog",
+            page=page,
+            page_size=page_size,
+            total=len(entries),
+            as_html=as_html,
+        )
+
+    def __prefix_ids(self, prefix: str) -> Set[int]:
+        ids: Set[int] = set()
+        position = bisect.bisect_left(self.__tokens, prefix)
+
+        while position < len(self.__tokens):
+            token = self.__tokens[position]
+            if not token.startswith(prefix):
+                break
+            ids |= self.__by_token[token]
+            position += 1
+
+        return ids
+
+    def __add(self, record: Dict[str, Any]) -> None:
+        id = record["id"]
+        self.__entries[id] = record
+        self.__by_oddrn[record["oddrn"]] = id
+
+        for token in set(tokenize(record["name"]) + tokenize(record["oddrn"])):
+            self.__by_token.setdefault(token, set()).add(id)
+        for tag in record["tags"]:
+            self.__by_tag.setdefault(tag.lower(), set()).add(id)
+        for entity_class in record["entity_classes"]:
+            self.__by_class.setdefault(entity_class.upper(), set()).add(id)
+        if record["data_source_id"] is not None:
+            self.__by_data_source.setdefault(record["data_source_id"], set()).add(id)
+
+    def __remove(self, id: int) -> None:
+        record = self.__entries.pop(id, None)
+        if record is None:
+            return
+
+        self.__by_oddrn.pop(record["oddrn"], None)
+
+        for token in set(tokenize(record["name"]) + tokenize(record["oddrn"])):
+            self.__discard(self.__by_token, token, id)
+        for tag in record["tags"]:
+            self.__discard(self.__by_tag, tag.lower(), id)
+        for entity_class in record["entity_classes"]:
+            self.__discard(self.__by_class, entity_class.upper(), id)
+        if record["data_source_id"] is not None:
+            self.__discard(self.__by_data_source, record["data_source_id"], id)
+
+    @staticmethod
+    def __discard(index: Dict[Any, Set[int]], key: Any, id: int) -> None:
+        ids = index.get(key)
+        if ids is not None:
+            ids.discard(id)
+            if not ids:
+                del index[key]
+
+    def __save(self) -> None:
+        if self.__path is None:
+            return
+
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.__path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        data = {
+            "synced_at": self.__synced_at,
+            "data_sources": list(self.__data_sources.items()),
+            "entries": list(self.__entries.values()),
+        }
+
+        with open(tmp_path, "w") as file:
+            json.dump(data, file)
+
+        os.replace(tmp_path, self.__path)
+
+    def __load(self) -> None:
+        with open(self.__path) as file:
+            data = json.load(file)
+
+        for record in data["entries"]:
+            self.__add(record)
+
+        self.__data_sources = {id: name for id, name in data["data_sources"]}
+        self.__tokens = sorted(self.__by_token)
+        self.__synced_at = data["synced_at"]
@@ -1,31 +1,68 @@
+import dataclasses
+import hashlib
 import logging
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Union
 
-import pandas as pd
-
-from odd_ml.dataset_storage.dataset_storage import DatasetStorage
-from odd_ml.domain.data_entities import DataEntities, DataEntity
+from odd_ml.catalog import CatalogEntry, CatalogIndex
+from odd_ml.catalog.catalog_index import record_from_item
+from odd_ml.dataset_storage.dataset_storage import DatasetStorage, PartitionFilter
+from odd_ml.domain.data_entities import DataEntities, DataEntity, SearchResultItem
 from odd_ml.domain.data_source import GetDataSourcesResult
+from odd_ml.domain.dataset_structure import DatasetStructure
+from odd_ml.domain.lineage import Direction, LineageGraph
 from odd_ml.errors import ProfilerError
-from odd_ml.http.http_client import HttpClient, SearchConfig
-from odd_ml.profiler import PandasProfiler
+from odd_ml.helpers.arrow_tables import DTYPE_BACKENDS, table_to_dataframe
+from odd_ml.helpers.asci_renderer import PAGE_SIZE
+from odd_ml.helpers.column_types import ColumnTypes
+from odd_ml.helpers.dataframe_filters import Filters
+from odd_ml.http.http_client import HttpClient, HttpConfig, SearchConfig
+from odd_ml.http.response_cache import ResponseCache
+from odd_ml.profiler import ProfileCache, Profiler
 from odd_ml.renderer import IFrameRenderer
+from odd_ml.utils import instrumentation
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+    from odd_ml.profiler import StreamingProfiler
 
 
 class Client:
     """Client for retrieving data from odd-platform"""
 
-    def __init__(self, platform_url, storage: Optional[DatasetStorage] = None):
+    def __init__(
+        self,
+        platform_url,
+        storage: Optional[DatasetStorage] = None,
+        http_config: Optional[HttpConfig] = None,
+        cache: Optional[ResponseCache] = None,
+        profiler: Optional[Profiler] = None,
+        profile_cache: Optional[ProfileCache] = None,
+        catalog: Optional[CatalogIndex] = None,
+    ):
         """Creating client
 
         Args:
             platform_url (str): url to odd-platform
             storage (DatasetStorage): using for getting dataframe from datasets
+            http_config (HttpConfig, optional): connection pool, timeouts and retries settings
+            cache (ResponseCache, optional): on-disk cache for data entities and data sources
+            profiler (Profiler, optional): profiler for show_profile, PandasProfiler by default
+            profile_cache (ProfileCache, optional): on-disk cache for get_profile results
+            catalog (CatalogIndex, optional): local index for find_data_entities
         """
         self.__renderer = IFrameRenderer(platform_url)
         self.__storage = storage
-        self.__http = HttpClient(platform_url)
-        self.__profiler = PandasProfiler()
+        self.__http = HttpClient(platform_url, http_config, cache)
+        self.__profiler = profiler
+        self.__profile_cache = profile_cache
+        self.__catalog = catalog
+
+    def close(self):
+        """Close connections to odd-platform"""
+        self.__http.close()
 
     # TODO: add more id for filter (i.e: namespace_id: id, ...)
     @property
@@ -55,6 +92,182 @@ class Client:
 
         return self.__http.search(search_config)
 
+    def get_data_entities_frame(
+        self,
+        search_config: Optional[SearchConfig] = None,
+        all_pages: bool = False,
+    ) -> "pd.DataFrame":
+        """Getting data entities as a table
+
+        Search results are decoded straight into a DataFrame without
+        building SearchResultItem models, which is faster for large pages.
+
+        Args:
+            search_config: SearchConfig
+            all_pages (bool): read all pages starting from search_config.page
+        Returns:
+            pandas.DataFrame: one row per data entity
+        """
+        if search_config is None:
+            search_config = SearchConfig()
+
+        if all_pages:
+            pages = self.__http.iter_search_pages(search_config, raw=True)
+        else:
+            pages = [self.__http.search(search_config, raw=True)]
+
+        items = [item for page in pages for item in page.get("items") or []]
+
+        return DataEntities.items_to_dataframe(items)
+
+    def iter_data_entities(
+        self,
+        search_config: Optional[SearchConfig] = None,
+    ) -> Iterator[SearchResultItem]:
+        """Iterating over all found data entities page by page
+
+        Args:
+            search_config: SearchConfig, page is a starting page and size is a page size
+        Yields:
+            SearchResultItem
+        """
+        if search_config is None:
+            search_config = SearchConfig()
+
+        return self.__http.iter_search(search_config)
+
+    def show_data_entities(
+        self,
+        search_config: Optional[SearchConfig] = None,
+        page: int = 1,
+        page_size: int = PAGE_SIZE,
+        as_html: Optional[bool] = None,
+    ) -> None:
+        """Show page of found data entities as a table
+
+        Search results are streamed from the search page holding the first shown
+        row, so only pages needed for shown rows are requested. In Jupyter
+        up to MAX_HTML_ROWS rows are shown as html table paged in browser.
+
+        Args:
+            search_config: SearchConfig, size is a number of entities requested
+                at once, page is ignored
+            page (int): shown page starting from 1
+            page_size (int): rows per page
+            as_html (bool, optional): render html table, by default only in Jupyter
+        """
+        if search_config is None:
+            search_config = SearchConfig()
+
+        size = max(search_config.size, page_size)
+        first_page = (page - 1) * page_size // size + 1
+        items = self.iter_data_entities(
+            dataclasses.replace(search_config, page=first_page, size=size)
+        )
+
+        DataEntities.show_items(
+            items,
+            page,
+            page_size,
+            offset=(first_page - 1) * size,
+            as_html=as_html,
+        )
+
+    def sync_catalog(self, with_tags: bool = False, page_size: int = 500) -> int:
+        """Synchronize local catalog index with platform
+
+        All search pages are read without building models. Entities whose
+        updated_at is not changed since previous sync are not reindexed and keep
+        their tags, removed entities are dropped from index.
+
+        Args:
+            with_tags (bool): fetch new and changed data entities to index their tags
+            page_size (int): number of data entities requested at once
+
+        Returns:
+            int: number of added or updated entries
+        """
+        if self.__catalog is None:
+            raise Exception("Catalog is not set")
+
+        catalog = self.__catalog
+        items = {}
+        changed = []
+
+        pages = self.__http.iter_search_pages(SearchConfig(size=page_size), raw=True)
+        for page in pages:
+            for item in page.get("items") or []:
+                items[item["id"]] = item
+                updated_at = catalog.updated_at(item["id"])
+                if updated_at is None or updated_at != item.get("updated_at"):
+                    changed.append(item["id"])
+
+        tags = {}
+        failed = set()
+        if with_tags:
+            for id, entity in self.get_data_entities_by_ids(changed).items():
+                if isinstance(entity, Exception):
+                    logging.warning(f"Could not get tags of data entity {id}: {entity}")
+                    failed.add(id)
+                else:
+                    tags[id] = [tag.name for tag in entity.tags]
+
+        records = []
+        for id in changed:
+            if id in failed:
+                # indexed without updated_at, so tags are fetched again on next sync
+                entry = catalog.get(id)
+                record = record_from_item(items[id], entry.tags if entry else None)
+                record["updated_at"] = None
+            else:
+                record = record_from_item(items[id], tags.get(id))
+            records.append(record)
+
+        catalog.update(records, self.__all_data_sources(), present_ids=items)
+
+        return len(changed)
+
+    def find_data_entities(
+        self,
+        query: Optional[str] = None,
+        tag: Optional[str] = None,
+        data_source_id: Optional[int] = None,
+        entity_class: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[CatalogEntry]:
+        """Find data entities in local catalog index
+
+        Index is synchronized with platform first if it is stale.
+
+        Args:
+            query (str, optional): words or word prefixes of name or oddrn
+            tag (str, optional): tag name, indexed by sync_catalog(with_tags=True)
+            data_source_id (int, optional): id of data source
+            entity_class (str, optional): entity class name, i.e. DATA_SET
+            limit (int, optional): max number of entries
+
+        Returns:
+            list of CatalogEntry
+        """
+        if self.__catalog is None:
+            raise Exception("Catalog is not set")
+
+        if self.__catalog.is_stale:
+            self.sync_catalog()
+
+        return self.__catalog.search(query, tag, data_source_id, entity_class, limit)
+
+    def __all_data_sources(self, size: int = 100) -> Dict[int, str]:
+        data_sources = {}
+        page = 1
+
+        while True:
+            items = self.__http.get_data_sources(page, size).items
+            data_sources.update((ds.id, ds.name) for ds in items)
+            if len(items) < size:
+                return data_sources
+            page += 1
+
     def get_data_sources(self, page: int = 1, size: int = 100) -> GetDataSourcesResult:
         """List of DataSources
 
@@ -74,16 +287,130 @@ class Client:
         """
         return self.__http.get_data_entity_by_id(id)
 
-    def get_dataframe(self, data_entity: DataEntity) -> pd.DataFrame:
+    def get_data_entities_by_ids(
+        self, ids: Iterable[int], max_workers: int = 10
+    ) -> Dict[int, Union[DataEntity, Exception]]:
+        """Getting many data entities in parallel
+
+        Note:
+            Use max_workers not greater than HttpConfig.pool_maxsize,
+            otherwise requests will wait for free connection.
+
+        Args:
+            ids (list of int): ids of data entities, duplicates are fetched once
+            max_workers (int): number of simultaneous requests
+
+        Returns:
+            dict: data entity or raised exception by id, in order of given ids
+        """
+        unique_ids = list(dict.fromkeys(ids))
+
+        def fetch(id: int) -> Union[DataEntity, Exception]:
+            try:
+                return self.__http.get_data_entity_by_id(id)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(unique_ids, executor.map(fetch, unique_ids)))
+
+    def get_lineage(
+        self,
+        data_entity_id: int,
+        depth: int = 1,
+        direction: Direction = "both",
+        max_workers: int = 10,
+    ) -> LineageGraph:
+        """Getting lineage of data entity for several hops
+
+        Graph is expanded breadth-first, all data entities of the next hop are
+        fetched in parallel, each data entity is fetched once.
+
+        Args:
+            data_entity_id (int): id of data entity
+            depth (int): max number of hops from data entity
+            direction (str): "upstream", "downstream" or "both"
+            max_workers (int): number of simultaneous requests
+
+        Returns:
+            LineageGraph: fetched data entities and edges between them
+        """
+        if direction not in ("upstream", "downstream", "both"):
+            raise ValueError(f"Unknown lineage direction {direction}")
+
+        graph = LineageGraph(root_id=data_entity_id)
+        graph.nodes[data_entity_id] = self.__http.get_data_entity_by_id(data_entity_id)
+
+        if direction in ("upstream", "both"):
+            self.__expand_lineage(graph, "source_list", depth, max_workers)
+        if direction in ("downstream", "both"):
+            self.__expand_lineage(graph, "target_list", depth, max_workers)
+
+        return graph
+
+    def __expand_lineage(
+        self, graph: LineageGraph, relatives: str, depth: int, max_workers: int
+    ) -> None:
+        """Follow source_list or target_list of nodes hop by hop"""
+        visited = {graph.root_id}
+        frontier = [graph.root_id]
+
+        for _ in range(depth):
+            next_frontier = []
+
+            for id in frontier:
+                for relative in getattr(graph.nodes[id], relatives) or []:
+                    if relatives == "source_list":
+                        graph.add_edge(relative.id, id)
+                    else:
+                        graph.add_edge(id, relative.id)
+
+                    if relative.id not in visited:
+                        visited.add(relative.id)
+                        next_frontier.append(relative.id)
+
+            missing = [id for id in next_frontier if id not in graph.nodes]
+            fetched = self.get_data_entities_by_ids(missing, max_workers)
+
+            for id, entity in fetched.items():
+                if isinstance(entity, Exception):
+                    logging.warning(f"Could not get data entity {id}: {entity}")
+                else:
+                    graph.nodes[id] = entity
+
+            frontier = [id for id in next_frontier if id in graph.nodes]
+            if not frontier:
+                break
+
+    def get_dataframe(
+        self,
+        data_entity: DataEntity,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        dtype_backend: str = "numpy",
+        use_structure: bool = False,
+    ) -> "pd.DataFrame":
         """Getting DataFrame from DataEntity
 
         Read from DataEntity metadata attribute
 
         Note:
-            If artifact's Uri is folder, reads first file from directory
+            If artifact's Uri is folder, reads all files from directory in parallel,
+            Hive-style partitions (key=value folders) are added as columns
 
         Args:
             data_entity (DataEntity): data entity
+            partition_filter (callable, optional): gets partition values of file,
+                i.e {"year": "2022"}, returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form,
+                i.e [("year", ">=", 2021), ("country", "==", "UA")]
+            dtype_backend (str): "numpy" for default pandas dtypes, "pyarrow" to
+                read with Arrow readers and keep strings as string[pyarrow]
+            use_structure (bool): parse csv and jsonl files with column types from
+                latest dataset structure in platform instead of inferring them,
+                i.e. categories, fixed width integers and datetimes
 
         Returns:
             pandas.DataFrame: pandas DataFrame
@@ -91,13 +418,124 @@ class Client:
         if self.__storage is None:
             raise Exception("Storage is not set")
 
-        try:
-            return self.__storage.get_dataframe(data_entity=data_entity)
-        except Exception:
-            raise
+        if dtype_backend == "numpy":
+            return self.__storage.get_dataframe(
+                data_entity=data_entity,
+                partition_filter=partition_filter,
+                columns=columns,
+                filters=filters,
+                **self.__column_types(data_entity, use_structure),
+            )
+
+        if dtype_backend not in DTYPE_BACKENDS:
+            raise ValueError(f"Unknown dtype backend {dtype_backend}")
+        if use_structure:
+            raise ValueError("use_structure is supported only by numpy dtype backend")
+
+        table = self.get_table(data_entity, partition_filter, columns, filters)
+        return table_to_dataframe(table, dtype_backend)
+
+    def get_table(
+        self,
+        data_entity: DataEntity,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> "pa.Table":
+        """Getting Arrow table from DataEntity
+
+        Files are read by multithreaded Arrow readers without conversion to
+        pandas, partitions are added as string columns.
+
+        Args:
+            data_entity (DataEntity): data entity
+            partition_filter (callable, optional): gets partition values of file,
+                returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form
+
+        Returns:
+            pyarrow.Table: Arrow table
+        """
+        if self.__storage is None:
+            raise Exception("Storage is not set")
+
+        return self.__storage.get_table(
+            data_entity=data_entity,
+            partition_filter=partition_filter,
+            columns=columns,
+            filters=filters,
+        )
+
+    def iter_dataframe_chunks(
+        self,
+        data_entity: DataEntity,
+        chunksize: int = 100_000,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        use_structure: bool = False,
+    ) -> Iterator["pd.DataFrame"]:
+        """Iterating over DataFrame chunks of DataEntity
+
+        Allows processing datasets which do not fit into memory.
+
+        Args:
+            data_entity (DataEntity): data entity
+            chunksize (int): max number of rows in chunk
+            partition_filter (callable, optional): gets partition values of file,
+                i.e {"year": "2022"}, returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form
+            use_structure (bool): parse csv and jsonl files with column types from
+                latest dataset structure in platform
+
+        Yields:
+            pandas.DataFrame: pandas DataFrame with at most chunksize rows
+        """
+        if self.__storage is None:
+            raise Exception("Storage is not set")
+
+        return self.__storage.iter_dataframe_chunks(
+            data_entity=data_entity,
+            chunksize=chunksize,
+            partition_filter=partition_filter,
+            columns=columns,
+            filters=filters,
+            **self.__column_types(data_entity, use_structure),
+        )
+
+    def get_dataset_structure(
+        self, data_entity_id: int, version_id: Optional[int] = None
+    ) -> DatasetStructure:
+        """Getting structure of dataset, the one shown by show_structure
 
-    def show_profile(self, data_frame: pd.DataFrame):
+        Args:
+            data_entity_id (int): id of dataset
+            version_id (int, optional): id of structure version, latest by default
+
+        Returns:
+            DatasetStructure: fields with types, use column_types() for reading
+        """
+        return self.__http.get_dataset_structure(data_entity_id, version_id)
+
+    def __column_types(
+        self, data_entity: DataEntity, use_structure: bool
+    ) -> Dict[str, ColumnTypes]:
+        """Column types passed to storage, only if requested as custom storages
+        may not support them"""
+        if not use_structure:
+            return {}
+
+        structure = self.get_dataset_structure(data_entity.id)
+        return {"column_types": structure.column_types()}
+
+    def show_profile(self, data_frame: "pd.DataFrame"):
         """Get profile of DataEntity"""
+        if self.__profiler is None:
+            from odd_ml.profiler import PandasProfiler
+
+            self.__profiler = PandasProfiler()
 
         try:
             return self.__profiler.profile_to_notebook(data_frame)
@@ -108,6 +546,93 @@ class Client:
             except Exception as e:
                 raise ProfilerError("Could not get profile") from e
 
+    def get_profile(
+        self,
+        data_entity: DataEntity,
+        chunksize: int = 100_000,
+        profiler: Optional["StreamingProfiler"] = None,
+    ) -> Dict[str, Any]:
+        """Get structured profile of DataEntity
+
+        Dataset is profiled chunk by chunk. If profile_cache is set, profile is
+        returned from cache while dataset is not changed.
+
+        Note:
+            Version of dataset is taken from storage (i.e S3 ETags). If storage can't
+            provide it, dataset is read once more to compute content fingerprint.
+
+        Args:
+            data_entity (DataEntity): data entity
+            chunksize (int): max number of rows profiled at once
+            profiler (StreamingProfiler, optional): profiler settings
+
+        Returns:
+            dict: rows count and statistics of each column
+        """
+        if self.__storage is None:
+            raise Exception("Storage is not set")
+
+        if profiler is None:
+            from odd_ml.profiler import StreamingProfiler
+
+            profiler = StreamingProfiler()
+
+        if self.__profile_cache is None:
+            return profiler.profile_chunks(
+                self.__storage.iter_dataframe_chunks(data_entity, chunksize)
+            )
+
+        version = self.__dataset_version(data_entity, chunksize)
+        profile = self.__profile_cache.get(data_entity.id, version)
+        instrumentation.count(
+            "profiler.cache_misses" if profile is None else "profiler.cache_hits"
+        )
+
+        if profile is None:
+            profile = profiler.profile_chunks(
+                self.__storage.iter_dataframe_chunks(data_entity, chunksize)
+            )
+            self.__profile_cache.set(data_entity.id, version, profile)
+
+        return profile
+
+    def __dataset_version(self, data_entity: DataEntity, chunksize: int) -> str:
+        """Storage version of dataset or fingerprint of its content"""
+        import pandas as pd
+
+        version = self.__storage.get_version(data_entity)
+        if version is not None:
+            return version
+
+        fingerprint = hashlib.sha256()
+        for chunk in self.__storage.iter_dataframe_chunks(data_entity, chunksize):
+            fingerprint.update(pd.util.hash_pandas_object(chunk).values.tobytes())
+
+        return fingerprint.hexdigest()
+
+    def stats(self, reset: bool = False) -> Dict[str, Any]:
+        """Counters and timings of requests, dataset reads and profiling
+
+        Measurements are recorded only while instrumentation is enabled,
+        see odd_ml.utils.instrumentation.
+
+        Example:
+            instrumentation.enable()
+            client.get_dataframe(data_entity)
+            client.stats()["timings"]["storage.read"]
+
+        Args:
+            reset (bool): clear recorded measurements after reading them
+
+        Returns:
+            dict: {"counters": {name: value}, "timings": {name: summary}}
+        """
+        stats = instrumentation.stats()
+        if reset:
+            instrumentation.reset()
+
+        return stats
+
     def show_overview(self, data_entity_id: int):
         """Show details of DataEntity"""
         return self.__renderer.show_overview(data_entity_id)
@@ -0,0 +1,246 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import pandas as pd
+import pyarrow as pa
+from pyarrow import feather
+
+from odd_ml.dataset_storage.dataset_storage import DatasetStorage, PartitionFilter
+from odd_ml.helpers.column_types import ColumnTypes
+from odd_ml.helpers.dataframe_filters import Filters
+from odd_ml.utils import instrumentation
+
+
+def _types(column_types: Optional[ColumnTypes]) -> Dict[str, ColumnTypes]:
+    """Column types are passed only if set, storages may not support them"""
+    return {} if column_types is None else {"column_types": column_types}
+
+
+class CachedStorage(DatasetStorage):
+    """Local cache of datasets read by another storage
+
+    Datasets are stored as uncompressed Feather (Arrow IPC) files keyed by
+    dataset version (i.e S3 ETags), so they are memory-mapped on reload
+    instead of being downloaded and parsed again. Least recently used files
+    are removed when cache exceeds max_bytes.
+
+    Note:
+        Datasets are cached only if wrapped storage implements get_version.
+        Chunked reads are served from cache, but are not cached themselves.
+
+    Example:
+        storage = CachedStorage(S3Storage(config), max_bytes=20 * 1024**3)
+
+    Args:
+        storage (DatasetStorage): storage to read datasets from on cache miss
+        cache_dir (str): directory for cached datasets
+        max_bytes (int): disk budget of cache directory
+    """
+
+    def __init__(
+        self,
+        storage: DatasetStorage,
+        cache_dir: str = "~/.cache/odd_ml/datasets",
+        max_bytes: int = 10 * 1024**3,
+    ) -> None:
+        self.__storage = storage
+        self.__dir = Path(cache_dir).expanduser()
+        self.__max_bytes = max_bytes
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+
+        self.__dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def storage(self) -> DatasetStorage:
+        return self.__storage
+
+    def stats(self) -> Dict[str, int]:
+        files = list(self.__dir.glob("*.feather"))
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "entries": len(files),
+            "bytes": sum(f.stat().st_size for f in files),
+        }
+
+    def get_dataframe(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> pd.DataFrame:
+        path = self.__cache_path(
+            data_entity, partition_filter, columns, filters, column_types
+        )
+
+        if path is not None and path.exists():
+            return self.__read_cached(path).to_pandas(split_blocks=True)
+
+        if path is not None:
+            instrumentation.count("storage.cache_misses")
+            with self.__lock:
+                self.__misses += 1
+
+        dataframe = self.__storage.get_dataframe(
+            data_entity,
+            partition_filter=partition_filter,
+            columns=columns,
+            filters=filters,
+            **_types(column_types),
+        )
+
+        if path is not None:
+            self.__write_cached(path, dataframe)
+
+        return dataframe
+
+    def get_table(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pa.Table:
+        path = self.__cache_path(
+            data_entity, partition_filter, columns, filters, table=True
+        )
+
+        if path is not None and path.exists():
+            return self.__read_cached(path)
+
+        if path is not None:
+            instrumentation.count("storage.cache_misses")
+            with self.__lock:
+                self.__misses += 1
+
+        table = self.__storage.get_table(
+            data_entity,
+            partition_filter=partition_filter,
+            columns=columns,
+            filters=filters,
+        )
+
+        if path is not None:
+            self.__write_cached(path, table)
+
+        return table
+
+    def iter_dataframe_chunks(
+        self,
+        data_entity: Any,
+        chunksize: int = 100_000,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> Iterator[pd.DataFrame]:
+        path = self.__cache_path(
+            data_entity, partition_filter, columns, filters, column_types
+        )
+
+        if path is not None and path.exists():
+            table = self.__read_cached(path)
+            for batch in table.to_batches(max_chunksize=chunksize):
+                yield batch.to_pandas(split_blocks=True)
+            return
+
+        yield from self.__storage.iter_dataframe_chunks(
+            data_entity,
+            chunksize=chunksize,
+            partition_filter=partition_filter,
+            columns=columns,
+            filters=filters,
+            **_types(column_types),
+        )
+
+    def get_version(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter] = None,
+        filters: Optional[Filters] = None,
+    ) -> Optional[str]:
+        return self.__storage.get_version(data_entity, partition_filter, filters)
+
+    def clear(self) -> None:
+        with self.__lock:
+            for file in self.__dir.glob("*.feather"):
+                file.unlink(missing_ok=True)
+
+    def __cache_path(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter],
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+        column_types: Optional[ColumnTypes] = None,
+        table: bool = False,
+    ) -> Optional[Path]:
+        """Cache file of dataset version, Arrow tables are cached apart from
+        dataframes as their types differ"""
+        version = self.__storage.get_version(data_entity, partition_filter, filters)
+        if version is None:
+            return None
+
+        key_parts = [data_entity.oddrn, version, columns, filters]
+        if column_types is not None:
+            key_parts.append(repr(column_types))
+        if table:
+            key_parts.append("table")
+        key = json.dumps(key_parts, default=str).encode()
+
+        return self.__dir / f"{hashlib.sha256(key).hexdigest()}.feather"
+
+    def __read_cached(self, path: Path) -> pa.Table:
+        instrumentation.count("storage.cache_hits")
+        with self.__lock:
+            self.__hits += 1
+            _touch(path)
+
+        return feather.read_table(path, memory_map=True)
+
+    def __write_cached(self, path: Path, data: Union[pd.DataFrame, pa.Table]) -> None:
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+
+        if isinstance(data, pd.DataFrame):
+            data = data.reset_index(drop=True)
+
+        try:
+            feather.write_feather(data, tmp_path, compression="uncompressed")
+        except (pa.ArrowException, ValueError) as e:
+            logging.warning(f"Could not cache dataset: {e}")
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        with self.__lock:
+            os.replace(tmp_path, path)
+            _touch(path)
+            self.__evict()
+
+    def __evict(self) -> None:
+        files = sorted(self.__dir.glob("*.feather"), key=lambda f: f.stat().st_mtime)
+        total = sum(f.stat().st_size for f in files)
+
+        for file in files:
+            if total <= self.__max_bytes:
+                break
+
+            total -= file.stat().st_size
+            file.unlink(missing_ok=True)
+
+
+def _touch(path: Path) -> None:
+    """Modification time is used as last access time for eviction, it's set
+    from clock with nanoseconds as file system timestamps are coarser"""
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
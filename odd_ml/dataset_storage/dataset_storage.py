@@ -1,10 +1,71 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional
 
-import pandas as pd
+from odd_ml.helpers.column_types import ColumnTypes
+from odd_ml.helpers.dataframe_filters import Filters
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+PartitionFilter = Callable[[Dict[str, str]], bool]
 
 
 class DatasetStorage(ABC):
     @abstractmethod
-    def get_dataframe(self, data_entity: Any) -> pd.DataFrame:
+    def get_dataframe(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> "pd.DataFrame":
+        raise NotImplementedError
+
+    @abstractmethod
+    def iter_dataframe_chunks(
+        self,
+        data_entity: Any,
+        chunksize: int = 100_000,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> Iterator["pd.DataFrame"]:
         raise NotImplementedError
+
+    def get_table(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> "pa.Table":
+        """Read dataset as Arrow table
+
+        Converted from get_dataframe result, storages reading Arrow
+        natively override it.
+        """
+        import pyarrow as pa
+
+        dataframe = self.get_dataframe(
+            data_entity,
+            partition_filter=partition_filter,
+            columns=columns,
+            filters=filters,
+        )
+        return pa.Table.from_pandas(dataframe, preserve_index=False)
+
+    def get_version(
+        self,
+        data_entity: Any,
+        partition_filter: Optional[PartitionFilter] = None,
+        filters: Optional[Filters] = None,
+    ) -> Optional[str]:
+        """Fingerprint of dataset files, changes when any of them is modified
+
+        Returns:
+            str or None if storage can't detect changes
+        """
+        return None
@@ -0,0 +1,353 @@
+import io
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from odd_ml.helpers.arrow_tables import table_to_dataframe
+from odd_ml.helpers.column_types import ColumnTypes
+from odd_ml.helpers.dataframe_filters import Filters
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+# path of local uncompressed file or binary file object
+Source = Union[str, BinaryIO]
+Reader = Callable[[Source, Optional[List[str]], Optional[Filters]], "pd.DataFrame"]
+TableReader = Callable[[Source, Optional[List[str]], Optional[Filters]], "pa.Table"]
+ChunksReader = Callable[
+    [Source, Optional[List[str]], Optional[Filters], int], Iterator["pd.DataFrame"]
+]
+
+# names are the same as fsspec.compression uses
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz", ".zst": "zstd"}
+COMPRESSION_MAGIC = {
+    "gzip": b"\x1f\x8b",
+    "bz2": b"BZh",
+    "xz": b"\xfd7zXZ\x00",
+    "zstd": b"\x28\xb5\x2f\xfd",
+}
+
+# bytes read from start of file to detect its format
+SNIFF_BYTES = 64
+
+
+@dataclass
+class FileFormat:
+    """Reader of dataset files of one format
+
+    Readers get path of local uncompressed file or binary file object, columns
+    to read (all if None) and filters, which reader may use to skip data.
+    Rows are filtered again after reading unless filter_pushdown is set.
+
+    Example:
+        register_file_format(
+            FileFormat(
+                name="avro",
+                extensions=(".avro",),
+                magic=(b"Obj\\x01",),
+                read=lambda source, columns, filters: read_avro(source, columns),
+            )
+        )
+
+    Attributes:
+        name (str): format name, registering format with the same name replaces it
+        extensions (tuple of str): file name suffixes, i.e. (".csv",)
+        magic (tuple of bytes): possible first bytes of file, formats without
+            magic are detected only by extension
+        read (callable, optional): reads file to DataFrame,
+            converted from read_table result if not set
+        read_table (callable, optional): reads file to pyarrow.Table,
+            converted from read result if not set
+        iter_chunks (callable, optional): reads file by chunks of at most
+            chunksize rows, rows of filtered files are parsed by chunks
+            to bound memory. Whole file is read and split if not set
+        random_access (bool): reader seeks in file, so compressed files are
+            decompressed to memory first
+        filter_pushdown (bool): reader returns only rows matching filters
+        typed (bool): read and iter_chunks accept column_types keyword with
+            dtypes known before reading, formats storing types in file ignore it
+    """
+
+    name: str
+    extensions: Tuple[str, ...]
+    magic: Tuple[bytes, ...] = ()
+    read: Optional[Reader] = None
+    read_table: Optional[TableReader] = None
+    iter_chunks: Optional[ChunksReader] = None
+    random_access: bool = False
+    filter_pushdown: bool = False
+    typed: bool = False
+
+    def __post_init__(self) -> None:
+        if self.read is None and self.read_table is None:
+            raise ValueError(f"Format {self.name} must have read or read_table")
+
+    def to_dataframe(
+        self,
+        source: Source,
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+        column_types: Optional[ColumnTypes] = None,
+    ) -> "pd.DataFrame":
+        if self.read is not None:
+            return self.read(source, columns, filters, **self.__types(column_types))
+
+        return table_to_dataframe(self.read_table(source, columns, filters))
+
+    def to_table(
+        self, source: Source, columns: Optional[List[str]], filters: Optional[Filters]
+    ) -> "pa.Table":
+        if self.read_table is not None:
+            return self.read_table(source, columns, filters)
+
+        import pyarrow as pa
+
+        dataframe = self.read(source, columns, filters)
+        return pa.Table.from_pandas(dataframe, preserve_index=False)
+
+    def chunks(
+        self,
+        source: Source,
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+        chunksize: int,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> Iterator["pd.DataFrame"]:
+        types = self.__types(column_types)
+
+        if self.iter_chunks is not None:
+            yield from self.iter_chunks(source, columns, filters, chunksize, **types)
+        elif self.read_table is not None:
+            table = self.read_table(source, columns, filters)
+            for batch in table.to_batches(max_chunksize=chunksize):
+                yield batch.to_pandas(split_blocks=True)
+        else:
+            dataframe = self.read(source, columns, filters, **types)
+            for start in range(0, len(dataframe), chunksize):
+                yield dataframe.iloc[start : start + chunksize]
+
+    def __types(self, column_types: Optional[ColumnTypes]) -> Dict[str, ColumnTypes]:
+        if column_types is None or not self.typed:
+            return {}
+        return {"column_types": column_types}
+
+
+def _read_csv(source, columns, filters, column_types=None):
+    import pandas as pd
+
+    if column_types is None:
+        return pd.read_csv(source, usecols=columns)
+
+    dataframe = pd.read_csv(source, usecols=columns, dtype=column_types.text_dtypes)
+    return column_types.convert(dataframe)
+
+
+def _read_csv_table(source, columns, filters):
+    from pyarrow import csv
+
+    convert_options = csv.ConvertOptions(include_columns=columns)
+    return csv.read_csv(source, convert_options=convert_options)
+
+
+def _read_csv_chunks(source, columns, filters, chunksize, column_types=None):
+    import pandas as pd
+
+    if column_types is None:
+        column_types = ColumnTypes()
+
+    with pd.read_csv(
+        source, usecols=columns, chunksize=chunksize, dtype=column_types.text_dtypes
+    ) as reader:
+        for chunk in reader:
+            yield column_types.convert(chunk)
+
+
+def _read_jsonl(source, columns, filters, column_types=None):
+    import pandas as pd
+
+    if column_types is None:
+        column_types = ColumnTypes()
+
+    dataframe = pd.read_json(
+        source, lines=True, dtype=column_types.parser_dtypes or True
+    )
+    dataframe = column_types.convert(dataframe)
+    return dataframe if columns is None else dataframe[columns]
+
+
+def _read_jsonl_table(source, columns, filters):
+    from pyarrow import json
+
+    table = json.read_json(source)
+    return table if columns is None else table.select(columns)
+
+
+def _read_jsonl_chunks(source, columns, filters, chunksize, column_types=None):
+    import pandas as pd
+
+    if column_types is None:
+        column_types = ColumnTypes()
+
+    with pd.read_json(
+        source,
+        lines=True,
+        chunksize=chunksize,
+        dtype=column_types.parser_dtypes or True,
+    ) as reader:
+        for chunk in reader:
+            chunk = column_types.convert(chunk)
+            yield chunk if columns is None else chunk[columns]
+
+
+def _read_parquet_table(source, columns, filters):
+    import pyarrow.parquet as pq
+
+    return pq.read_table(
+        source,
+        columns=columns,
+        filters=filters or None,
+        memory_map=isinstance(source, str),
+    )
+
+
+def _read_parquet_chunks(source, columns, filters, chunksize):
+    from fastparquet import ParquetFile
+
+    # row groups are skipped by statistics
+    row_groups = ParquetFile(source).iter_row_groups(
+        columns=columns, filters=filters or None
+    )
+    for row_group in row_groups:
+        for start in range(0, len(row_group), chunksize):
+            yield row_group.iloc[start : start + chunksize]
+
+
+def _read_arrow_table(source, columns, filters):
+    from pyarrow import feather
+
+    return feather.read_table(
+        source, columns=columns, memory_map=isinstance(source, str)
+    )
+
+
+def _read_orc_table(source, columns, filters):
+    from pyarrow import orc
+
+    return orc.ORCFile(source).read(columns=columns)
+
+
+FILE_FORMATS: Dict[str, FileFormat] = {
+    file_format.name: file_format
+    for file_format in [
+        FileFormat(
+            name="csv",
+            extensions=(".csv",),
+            read=_read_csv,
+            read_table=_read_csv_table,
+            iter_chunks=_read_csv_chunks,
+            typed=True,
+        ),
+        FileFormat(
+            name="jsonl",
+            extensions=(".jsonl", ".ndjson"),
+            read=_read_jsonl,
+            read_table=_read_jsonl_table,
+            iter_chunks=_read_jsonl_chunks,
+            typed=True,
+        ),
+        FileFormat(
+            name="parquet",
+            extensions=(".parquet", ".parq"),
+            magic=(b"PAR1",),
+            read_table=_read_parquet_table,
+            iter_chunks=_read_parquet_chunks,
+            random_access=True,
+            filter_pushdown=True,
+        ),
+        FileFormat(
+            name="arrow",
+            extensions=(".feather", ".arrow"),
+            magic=(b"ARROW1", b"FEA1"),
+            read_table=_read_arrow_table,
+            random_access=True,
+        ),
+        FileFormat(
+            name="orc",
+            extensions=(".orc",),
+            magic=(b"ORC",),
+            read_table=_read_orc_table,
+            random_access=True,
+        ),
+    ]
+}
+
+
+def register_file_format(file_format: FileFormat) -> None:
+    """Register reader of additional format, formats registered later take
+    precedence when extensions or magic bytes overlap"""
+    FILE_FORMATS.pop(file_format.name, None)
+    FILE_FORMATS[file_format.name] = file_format
+
+
+def supported_extensions() -> Tuple[str, ...]:
+    return tuple(ext for fmt in FILE_FORMATS.values() for ext in fmt.extensions)
+
+
+def compression_by_extension(path: str) -> Optional[str]:
+    for extension, compression in COMPRESSION_EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return compression
+    return None
+
+
+def compression_by_magic(head: bytes) -> Optional[str]:
+    for compression, magic in COMPRESSION_MAGIC.items():
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def format_by_extension(path: str) -> Optional[FileFormat]:
+    """Format of file by its name, compression suffix is ignored,
+    i.e. csv for orders.csv.gz"""
+    name = path.lower()
+    if compression_by_extension(name) is not None:
+        name = name.rsplit(".", 1)[0]
+
+    for file_format in reversed(FILE_FORMATS.values()):
+        if name.endswith(file_format.extensions):
+            return file_format
+    return None
+
+
+def format_by_magic(head: bytes) -> Optional[FileFormat]:
+    for file_format in reversed(FILE_FORMATS.values()):
+        if file_format.magic and head.startswith(file_format.magic):
+            return file_format
+    return None
+
+
+def decompress(file: BinaryIO, compression: str) -> BinaryIO:
+    """Wrap file to decompress it on the fly while reading"""
+    from fsspec.compression import compr
+
+    if compression not in compr:
+        package = "zstandard" if compression == "zstd" else compression
+        raise ValueError(f"Install {package} to read {compression} compressed files")
+
+    return compr[compression](file, mode="rb")
+
+
+def buffer(stream: BinaryIO) -> BinaryIO:
+    """Read decompressed stream to memory for formats which seek in file"""
+    return io.BytesIO(stream.read())
@@ -0,0 +1,521 @@
+import functools
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import fsspec
+import pandas as pd
+import pyarrow as pa
+from fsspec import AbstractFileSystem
+
+from odd_ml.dataset_storage.dataset_storage import DatasetStorage, PartitionFilter
+from odd_ml.dataset_storage.file_formats import (
+    SNIFF_BYTES,
+    FileFormat,
+    Source,
+    buffer,
+    compression_by_extension,
+    compression_by_magic,
+    decompress,
+    format_by_extension,
+    format_by_magic,
+    supported_extensions,
+)
+from odd_ml.domain.data_entity import DataEntity
+from odd_ml.errors import WrongDataEntityTypeError
+from odd_ml.helpers import (
+    Filters,
+    bind_partitions,
+    filter_columns,
+    filter_dataframe,
+    filter_table,
+    hive_partitions,
+    match_partitions,
+)
+from odd_ml.helpers.arrow_tables import append_partitions, concat_tables
+from odd_ml.helpers.column_types import ColumnTypes
+from odd_ml.helpers.oddrn_to_uri import OddrnMapper, oddrn_to_uri
+from odd_ml.utils import TtlCache, instrumentation
+
+# rows parsed at once from csv or jsonl file, when rows must be filtered
+CSV_FILTER_CHUNKSIZE = 100_000
+
+# file details which change when file is modified, depending on filesystem
+VERSION_KEYS = ("ETag", "LastModified", "md5Hash", "generation", "mtime", "size")
+
+# dataset file path and its partition values
+File = Tuple[str, Dict[str, str]]
+
+
+def _protocols(fs: AbstractFileSystem) -> Tuple[str, ...]:
+    return (fs.protocol,) if isinstance(fs.protocol, str) else tuple(fs.protocol)
+
+
+def _concat(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """Concatenate dataframes of files or chunks, categorical columns with
+    different categories are recoded to their union to stay categorical"""
+    union = {}
+    for column, dtype in frames[0].dtypes.items():
+        dtypes = [frame[column].dtype for frame in frames if column in frame]
+        if all(isinstance(d, pd.CategoricalDtype) for d in dtypes):
+            union[column] = functools.reduce(
+                lambda left, right: left.union(right), [d.categories for d in dtypes]
+            )
+
+    if union:
+        # shallow copies, so frames of callers are not modified
+        frames = [frame.copy(deep=False) for frame in frames]
+        for frame in frames:
+            for column, categories in union.items():
+                if column in frame:
+                    frame[column] = frame[column].cat.set_categories(categories)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+class FsspecStorage(DatasetStorage):
+    """Load datasets from any filesystem supported by fsspec
+
+    Oddrn of data entity is converted to uri by mapper registered for oddrn
+    scheme, i.e. //s3/... to s3://bucket/key, //local/... to file:///path.
+    Filesystem is chosen by uri protocol and reused for all reads.
+
+    File format is detected by extension, or by first bytes of file if
+    extension is unknown. Gzip, bz2, xz and zstd compressed files are
+    decompressed on the fly while reading. See register_file_format to read
+    formats besides csv, jsonl, parquet, feather and orc.
+
+    Parquet and Arrow files on local disks and mounted network shares are
+    memory-mapped, so their columns are not copied into process memory.
+
+    Example:
+        storage = FsspecStorage(storage_options={"gs": {"token": "cloud"}})
+        client = Client('http://localhost:8080', storage)
+
+    Args:
+        filesystems (dict, optional): ready filesystems by uri protocol
+        storage_options (dict, optional): arguments for creating filesystem by protocol
+        mappers (dict, optional): oddrn to uri converters by oddrn scheme,
+            registered ones by default, see register_oddrn_mapper
+        max_workers (int): number of files of one dataset read simultaneously
+        listings_ttl (float): seconds to reuse listing of dataset files
+        memory_map (bool): memory-map local parquet and arrow files
+    """
+
+    def __init__(
+        self,
+        filesystems: Optional[Dict[str, AbstractFileSystem]] = None,
+        storage_options: Optional[Dict[str, Dict[str, Any]]] = None,
+        mappers: Optional[Dict[str, OddrnMapper]] = None,
+        max_workers: int = 8,
+        listings_ttl: float = 60.0,
+        memory_map: bool = True,
+    ) -> None:
+        self.__filesystems = dict(filesystems or {})
+        self.__storage_options = storage_options or {}
+        self.__mappers = mappers
+        self.__max_workers = max_workers
+        self.__memory_map = memory_map
+        self.__listings: TtlCache[Dict[str, Dict[str, Any]]] = TtlCache(listings_ttl)
+        self.__lock = threading.Lock()
+
+    def get_dataframe(
+        self,
+        data_entity: DataEntity,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> pd.DataFrame:
+        """Read dataset file or all files under dataset's folder
+
+        Args:
+            data_entity (DataEntity): dataset
+            partition_filter (callable, optional): gets Hive-style partition values
+                of file, i.e {"year": "2022"}, returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form,
+                i.e [("year", ">=", 2021), ("country", "==", "UA")]. Used to skip
+                partitions and parquet row groups by statistics
+            column_types (ColumnTypes, optional): dtypes for parsing csv and jsonl
+                files without type inference, see DatasetStructure.column_types
+
+        Returns:
+            pandas.DataFrame: files concatenated with partition values as columns
+        """
+        uri = self.get_uri(data_entity)
+        fs, path = self.__resolve(uri)
+        files = self.__list_files(fs, path, partition_filter, filters)
+
+        def read(file: File) -> pd.DataFrame:
+            file_path, partitions = file
+            with instrumentation.timer("storage.read_file", uri=file_path):
+                return self.__read_file(
+                    fs, file_path, partitions, columns, filters, column_types
+                )
+
+        with instrumentation.timer("storage.read", uri=uri):
+            if len(files) == 1:
+                dataframe = read(files[0])
+            else:
+                with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+                    frames = list(executor.map(read, files))
+                dataframe = _concat(frames)
+
+        self.__count_read(fs, path, files, len(dataframe))
+        return dataframe
+
+    def get_table(
+        self,
+        data_entity: DataEntity,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+    ) -> pa.Table:
+        """Read dataset as Arrow table with multithreaded Arrow readers
+
+        Strings are kept in Arrow memory instead of python objects, partition
+        values are added as string columns.
+
+        Args:
+            data_entity (DataEntity): dataset
+            partition_filter (callable, optional): gets Hive-style partition values
+                of file, i.e {"year": "2022"}, returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form
+
+        Returns:
+            pyarrow.Table: files concatenated with partition values as columns
+        """
+        uri = self.get_uri(data_entity)
+        fs, path = self.__resolve(uri)
+        files = self.__list_files(fs, path, partition_filter, filters)
+
+        def read(file: File) -> pa.Table:
+            file_path, partitions = file
+            with instrumentation.timer("storage.read_file", uri=file_path):
+                return self.__read_table(fs, file_path, partitions, columns, filters)
+
+        with instrumentation.timer("storage.read", uri=uri):
+            if len(files) == 1:
+                table = read(files[0])
+            else:
+                with ThreadPoolExecutor(max_workers=self.__max_workers) as executor:
+                    table = concat_tables(list(executor.map(read, files)))
+
+        self.__count_read(fs, path, files, table.num_rows)
+        return table
+
+    def iter_dataframe_chunks(
+        self,
+        data_entity: DataEntity,
+        chunksize: int = 100_000,
+        partition_filter: Optional[PartitionFilter] = None,
+        columns: Optional[List[str]] = None,
+        filters: Optional[Filters] = None,
+        column_types: Optional[ColumnTypes] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Read dataset by chunks of at most chunksize rows
+
+        Csv files are parsed by chunks, parquet files are read by row groups.
+
+        Args:
+            data_entity (DataEntity): dataset
+            chunksize (int): max number of rows in chunk
+            partition_filter (callable, optional): gets Hive-style partition values
+                of file, i.e {"year": "2022"}, returns False if file must be skipped
+            columns (list of str, optional): columns to read, all by default
+            filters (Filters, optional): rows to read in disjunctive normal form
+            column_types (ColumnTypes, optional): dtypes for parsing csv and jsonl
+
+        Yields:
+            pandas.DataFrame: chunk with partition values as columns
+        """
+        fs, path = self.__resolve(self.get_uri(data_entity))
+        files = self.__list_files(fs, path, partition_filter, filters)
+
+        for file_path, partitions in files:
+            self.__count_read(fs, path, [(file_path, partitions)], 0)
+
+            for chunk in self.__read_file_chunks(
+                fs, file_path, chunksize, partitions, columns, filters, column_types
+            ):
+                instrumentation.count("storage.rows", len(chunk))
+                yield chunk
+
+    def get_version(
+        self,
+        data_entity: DataEntity,
+        partition_filter: Optional[PartitionFilter] = None,
+        filters: Optional[Filters] = None,
+    ) -> Optional[str]:
+        """Hash of ETags, modification dates and sizes of dataset files"""
+        fs, path = self.__resolve(self.get_uri(data_entity))
+        objects = self.__list_objects(fs, path)
+
+        digest = hashlib.sha256()
+        for file_path, _ in self.__list_files(fs, path, partition_filter, filters):
+            obj = objects[file_path]
+            details = [str(obj[key]) for key in VERSION_KEYS if key in obj]
+            digest.update(":".join([file_path, *details]).encode())
+
+        return digest.hexdigest()
+
+    def get_uri(self, data_entity: DataEntity) -> str:
+        """Uri of dataset file or folder"""
+        if "DATA_SET" not in data_entity.entity_class_names:
+            raise WrongDataEntityTypeError
+
+        return oddrn_to_uri(data_entity.oddrn, self.__mappers)
+
+    def get_filesystem(self, protocol: str) -> AbstractFileSystem:
+        """Filesystem for uri protocol, created once on first use"""
+        with self.__lock:
+            fs = self.__filesystems.get(protocol)
+            if fs is None:
+                options = self.__storage_options.get(protocol, {})
+                fs = fsspec.filesystem(protocol, **options)
+                self.__filesystems[protocol] = fs
+
+        return fs
+
+    def __resolve(self, uri: str) -> Tuple[AbstractFileSystem, str]:
+        protocol = uri.split("://", 1)[0] if "://" in uri else "file"
+        fs = self.get_filesystem(protocol)
+
+        return fs, fs._strip_protocol(uri).rstrip("/")
+
+    def __is_local(self, fs: AbstractFileSystem) -> bool:
+        return self.__memory_map and "file" in _protocols(fs)
+
+    def __count_read(
+        self, fs: AbstractFileSystem, path: str, files: List[File], rows: int
+    ) -> None:
+        """Count files, their sizes and rows read from dataset"""
+        if not instrumentation.enabled:
+            return
+
+        objects = self.__list_objects(fs, path)
+        instrumentation.count("storage.files", len(files), uri=path)
+        instrumentation.count(
+            "storage.bytes", sum(objects[f].get("size", 0) for f, _ in files), uri=path
+        )
+        if rows:
+            instrumentation.count("storage.rows", rows, uri=path)
+
+    def __list_objects(
+        self, fs: AbstractFileSystem, path: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """Details of file or of all files under folder by path"""
+        key = f"{_protocols(fs)[0]}://{path}"
+        objects = self.__listings.get(key)
+        if objects is not None:
+            return objects
+
+        if "s3" in _protocols(fs):
+            # file and folder are resolved by one listing of keys starting with path
+            parent, _, name = path.rpartition("/")
+            objects = {
+                file_path: obj
+                for file_path, obj in fs.find(parent, prefix=name, detail=True).items()
+                if file_path == path or file_path.startswith(f"{path}/")
+            }
+        elif not fs.exists(path):
+            objects = {}
+        elif fs.isfile(path):
+            objects = {path: fs.info(path)}
+        else:
+            objects = fs.find(path, detail=True)
+
+        self.__listings.set(key, objects)
+        return objects
+
+    def __list_files(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        partition_filter: Optional[PartitionFilter],
+        filters: Optional[Filters],
+    ) -> List[File]:
+        """Paths of dataset files with their partition values"""
+        objects = self.__list_objects(fs, path)
+
+        if not objects:
+            raise ValueError(f"Nothing found by {path}")
+        if list(objects) == [path]:
+            return [(path, {})]
+
+        files = []
+        for file_path in sorted(objects):
+            relative_path = file_path[len(path) :]
+            name = relative_path.rsplit("/", 1)[-1]
+
+            if name.startswith(("_", ".")) or format_by_extension(name) is None:
+                continue
+
+            partitions = hive_partitions(relative_path)
+            if partition_filter is not None and not partition_filter(partitions):
+                continue
+            if not match_partitions(partitions, filters):
+                continue
+
+            files.append((file_path, partitions))
+
+        if not files:
+            extensions = ", ".join(supported_extensions())
+            raise ValueError(f"No {extensions} files in {path}")
+
+        return files
+
+    @staticmethod
+    def __file_columns(
+        columns: Optional[List[str]],
+        file_filters: Optional[Filters],
+        partitions: Dict[str, str],
+    ) -> Optional[List[str]]:
+        """Columns which must be read from file for projection and filtering"""
+        if columns is None:
+            return None
+
+        needed = list(dict.fromkeys([*columns, *filter_columns(file_filters)]))
+        return [c for c in needed if c not in partitions]
+
+    @staticmethod
+    def __finalize(
+        dataframe: pd.DataFrame,
+        partitions: Dict[str, str],
+        columns: Optional[List[str]],
+        file_filters: Optional[Filters],
+    ) -> pd.DataFrame:
+        dataframe = filter_dataframe(dataframe, file_filters)
+        if partitions:
+            # assign copies dataframe, memory-mapped columns are kept otherwise
+            dataframe = dataframe.assign(**partitions)
+
+        return dataframe if columns is None else dataframe[columns]
+
+    def __detect(
+        self, fs: AbstractFileSystem, path: str
+    ) -> Tuple[FileFormat, Optional[str]]:
+        """Format and compression of file, first bytes of file are read only
+        when format can't be detected by extension"""
+        file_format = format_by_extension(path)
+        compression = compression_by_extension(path)
+
+        if file_format is None:
+            head = fs.cat_file(path, start=0, end=SNIFF_BYTES)
+            compression = compression or compression_by_magic(head)
+
+            if compression is not None:
+                with fs.open(path) as file, decompress(file, compression) as stream:
+                    head = stream.read(SNIFF_BYTES)
+
+            file_format = format_by_magic(head)
+
+        if file_format is None:
+            raise ValueError(f"Unsupported file format {path}")
+
+        return file_format, compression
+
+    @contextmanager
+    def __open(
+        self, fs: AbstractFileSystem, path: str
+    ) -> Iterator[Tuple[FileFormat, Source]]:
+        """Detect format of file and open it for reader
+
+        Local uncompressed files are passed to readers by path to be memory-mapped.
+        """
+        file_format, compression = self.__detect(fs, path)
+
+        if compression is None and self.__is_local(fs):
+            yield file_format, path
+            return
+
+        with fs.open(path) as file:
+            if compression is None:
+                yield file_format, file
+                return
+
+            with decompress(file, compression) as stream:
+                if file_format.random_access:
+                    yield file_format, buffer(stream)
+                else:
+                    yield file_format, stream
+
+    def __read_file(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        partitions: Dict[str, str],
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+        column_types: Optional[ColumnTypes] = None,
+    ) -> pd.DataFrame:
+        file_filters = bind_partitions(filters, partitions)
+        file_columns = self.__file_columns(columns, file_filters, partitions)
+
+        with self.__open(fs, path) as (file_format, source):
+            if (
+                file_filters
+                and file_format.iter_chunks
+                and not file_format.filter_pushdown
+            ):
+                # rows are filtered by chunks, so filtered out rows aren't kept in memory
+                chunks = [
+                    self.__finalize(chunk, partitions, columns, file_filters)
+                    for chunk in file_format.chunks(
+                        source,
+                        file_columns,
+                        file_filters,
+                        CSV_FILTER_CHUNKSIZE,
+                        column_types,
+                    )
+                ]
+                return _concat(chunks) if chunks else pd.DataFrame()
+
+            dataframe = file_format.to_dataframe(
+                source, file_columns, file_filters, column_types
+            )
+
+        return self.__finalize(dataframe, partitions, columns, file_filters)
+
+    def __read_table(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        partitions: Dict[str, str],
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+    ) -> pa.Table:
+        file_filters = bind_partitions(filters, partitions)
+        file_columns = self.__file_columns(columns, file_filters, partitions)
+
+        with self.__open(fs, path) as (file_format, source):
+            table = file_format.to_table(source, file_columns, file_filters)
+
+        if not file_format.filter_pushdown:
+            table = filter_table(table, file_filters)
+
+        table = append_partitions(table, partitions)
+        return table if columns is None else table.select(columns)
+
+    def __read_file_chunks(
+        self,
+        fs: AbstractFileSystem,
+        path: str,
+        chunksize: int,
+        partitions: Dict[str, str],
+        columns: Optional[List[str]],
+        filters: Optional[Filters],
+        column_types: Optional[ColumnTypes] = None,
+    ) -> Iterator[pd.DataFrame]:
+        file_filters = bind_partitions(filters, partitions)
+        file_columns = self.__file_columns(columns, file_filters, partitions)
+
+        with self.__open(fs, path) as (file_format, source):
+            for chunk in file_format.chunks(
+                source, file_columns, file_filters, chunksize, column_types
+            ):
+                yield self.__finalize(chunk, partitions, columns, file_filters)
@@ -1,54 +1,42 @@
-import boto3
-import pandas as pd
-from s3path import S3Path
+import s3fs
 
-from odd_ml.dataset_storage.dataset_storage import DatasetStorage
+from odd_ml.dataset_storage.fsspec_storage import FsspecStorage
 from odd_ml.domain.aws_config import AwsConfig
-from odd_ml.domain.data_entity import DataEntity
-from odd_ml.helpers.get_s3_path import get_s3_path
 
 
-class S3Storage(DatasetStorage):
-    """Load s3 file from DataEntity metadata"""
+class S3Storage(FsspecStorage):
+    """Load s3 file from DataEntity metadata
 
-    def __init__(self, config: AwsConfig) -> None:
-        self.__config = config
+    All reads share one s3 filesystem with pooled connections,
+    listings of dataset folders are cached for listings_ttl seconds.
+
+    Args:
+        config (AwsConfig): aws credentials
+        max_workers (int): number of files of one dataset read simultaneously
+        listings_ttl (float): seconds to reuse listing of dataset files
+    """
 
-        self.__setup_boto_session()
+    def __init__(
+        self, config: AwsConfig, max_workers: int = 8, listings_ttl: float = 60.0
+    ) -> None:
+        self.__config = config
+        fs = self.__create_filesystem(max_workers)
 
-    def __setup_boto_session(self):
-        """Create boto3 session"""
-        boto3.setup_default_session(
-            region_name=self.__config.aws_region,
-            aws_access_key_id=self.__config.aws_access_key_id.get_secret_value(),
-            aws_secret_access_key=self.__config.aws_secret_access_key.get_secret_value(),
+        super().__init__(
+            filesystems={"s3": fs, "s3a": fs},
+            max_workers=max_workers,
+            listings_ttl=listings_ttl,
         )
 
-    def get_dataframe(self, data_entity: DataEntity) -> pd.DataFrame:
-        return self.__read_path(get_s3_path(data_entity))
-
-    def __read_path(self, uri: str):
-        path = S3Path.from_uri(uri)
-
-        if path.is_file():
-            return self.__read_file(uri)
-        elif path.is_dir():
-            files = iter(path.iterdir())
-            return self.__read_file(next(files).as_uri())
-        else:
-            raise ValueError("Unsupported path format")
-
-    def __read_file(self, s3_uri: str):
-        storage_options = {
-            "key": self.__config.aws_access_key_id.get_secret_value(),
-            "secret": self.__config.aws_secret_access_key.get_secret_value(),
-        }
-
-        args = {"filepath_or_buffer": s3_uri, "storage_options": storage_options}
-
-        if s3_uri.endswith(".csv"):
-            return pd.read_csv(**args)
-        elif s3_uri.endswith(".parquet"):
-            return pd.read_parquet(**args)
-        else:
-            raise ValueError(f"Unsupported file format {s3_uri}")
+    def __create_filesystem(self, max_workers: int) -> s3fs.S3FileSystem:
+        """Create s3 filesystem, credentials are not shared with global boto3 session"""
+        return s3fs.S3FileSystem(
+            key=self.__config.aws_access_key_id.get_secret_value(),
+            secret=self.__config.aws_secret_access_key.get_secret_value(),
+            client_kwargs={
+                "region_name": self.__config.aws_region,
+                "endpoint_url": self.__config.aws_endpoint_url,
+            },
+            config_kwargs={"max_pool_connections": max(max_workers, 10)},
+            skip_instance_cache=True,
+        )
@@ -2,4 +2,6 @@ from odd_ml.domain.aws_config import AwsConfig
 from odd_ml.domain.data_entities import DataEntities
 from odd_ml.domain.data_entity import DataEntity
 from odd_ml.domain.data_source import DataSource
+from odd_ml.domain.dataset_structure import DatasetStructure
+from odd_ml.domain.lineage import LineageGraph
 from odd_ml.domain.namespace import Namespace
@@ -14,6 +14,7 @@ class AwsConfig(BaseSettings):
         aws_secret_access_key (str, optional): aws secret access key.
         aws_access_key_id (str, optional): aws access key id.
         aws_region (str, optional): aws region
+        aws_endpoint_url (str, optional): endpoint of s3 compatible storage, i.e minio
         _env_file (str, optional): relative path to local .env file
 
     Examples:
@@ -30,6 +31,7 @@ class AwsConfig(BaseSettings):
     aws_secret_access_key: Optional[SecretStr]
     aws_access_key_id: Optional[SecretStr]
     aws_region: Optional[str]
+    aws_endpoint_url: Optional[str]
 
     class Config:
         @classmethod
@@ -1,14 +1,17 @@
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
 
 from pydantic import BaseModel
 
-from odd_ml.helpers.asci_renderer import show_table
+from odd_ml.helpers.asci_renderer import PAGE_SIZE, show_table
 from odd_ml.utils import datetime_to_str
 
 from .data_entity import DataEntity, EntityClass
 from .data_source import DataSource
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class SearchFilterState(BaseModel):
     entity_id: int
@@ -54,19 +57,133 @@ class SearchResultItem(BaseModel):
         return [ec.name for ec in self.entity_classes]
 
 
+ITEMS_FRAME_COLUMNS = [
+    "id",
+    "name",
+    "oddrn",
+    "entity_classes",
+    "data_source_id",
+    "data_source",
+    "namespace",
+    "created_at",
+    "updated_at",
+]
+
+
+def _items_frame(rows: List[tuple]) -> "pd.DataFrame":
+    import pandas as pd
+
+    return pd.DataFrame.from_records(rows, columns=ITEMS_FRAME_COLUMNS)
+
+
+class PageInfo(BaseModel):
+    total: Optional[int]
+    has_next: Optional[bool]
+
+
 class DataEntities(BaseModel):
     """Response from ODD platform /search endpoint
 
     Args:
         items: (list of str) - list of result items
+        page_info: (PageInfo, optional) - pagination info of result page
     """
 
     items: List[SearchResultItem]
-
-    def show_list(self):
-        """Show items list as a table"""
-
-        key_value: Dict[str, Callable[[DataEntity], Any]] = {
+    page_info: Optional[PageInfo]
+
+    def to_dataframe(self) -> "pd.DataFrame":
+        """Items as a table with one row per data entity"""
+        rows = [
+            (
+                i.id,
+                i.name,
+                i.oddrn,
+                ", ".join(i.entity_classes_names),
+                i.data_source.id,
+                i.data_source.name,
+                i.data_source.namespace.name if i.data_source.namespace else None,
+                i.created_at,
+                i.updated_at,
+            )
+            for i in self.items
+        ]
+
+        return _items_frame(rows)
+
+    @staticmethod
+    def items_to_dataframe(items: List[Dict[str, Any]]) -> "pd.DataFrame":
+        """Raw items of search response as a table, without building models
+
+        Args:
+            items (list of dict): decoded "items" of search response
+
+        Returns:
+            pandas.DataFrame: same table as DataEntities.to_dataframe
+        """
+        import pandas as pd
+
+        rows = [
+            (
+                i["id"],
+                i.get("internal_name") or i["external_name"],
+                i["oddrn"],
+                ", ".join(ec["name"] for ec in i.get("entity_classes") or []),
+                i["data_source"]["id"],
+                i["data_source"]["name"],
+                (i["data_source"].get("namespace") or {}).get("name"),
+                i.get("created_at"),
+                i.get("updated_at"),
+            )
+            for i in items
+        ]
+
+        frame = _items_frame(rows)
+        for column in ("created_at", "updated_at"):
+            frame[column] = pd.to_datetime(frame[column], utc=True)
+
+        return frame
+
+    def show_list(
+        self,
+        page: int = 1,
+        page_size: Optional[int] = PAGE_SIZE,
+        as_html: Optional[bool] = None,
+    ):
+        """Show items list as a table
+
+        Args:
+            page (int): shown page of items starting from 1
+            page_size (int, optional): items per page, all items if None
+            as_html (bool, optional): render html table, by default only in Jupyter
+        """
+        self.show_items(
+            self.items, page, page_size, total=len(self.items), as_html=as_html
+        )
+
+    @staticmethod
+    def show_items(
+        items: Iterable[SearchResultItem],
+        page: int = 1,
+        page_size: Optional[int] = PAGE_SIZE,
+        total: Optional[int] = None,
+        offset: int = 0,
+        as_html: Optional[bool] = None,
+    ):
+        """Show page of items as a table, only items of shown page are formatted
+
+        Items may be read lazily, i.e. from Client.iter_data_entities.
+
+        Args:
+            items (iterable of SearchResultItem): items, list or lazy iterable
+            page (int): shown page of items starting from 1
+            page_size (int, optional): items per page, all items if None
+            total (int, optional): number of items if known
+            offset (int): number of items preceding the first one of items
+            as_html (bool, optional): render html table, by default only in Jupyter
+        """
+
+        key_value: Dict[str, Callable[[SearchResultItem], Any]] = {
             "Id": lambda x: x.id,
             "Name": lambda x: x.name,
             "Type": lambda x: ", ".join(x.entity_classes_names),
@@ -79,6 +196,15 @@ class DataEntities(BaseModel):
         }
 
         headers = key_value.keys()
-        rows = [[key_value[k](i) for k in headers] for i in self.items]
-
-        show_table(headers, rows, "Data entities")
+        rows = ([key_value[k](i) for k in headers] for i in items)
+
+        show_table(
+            headers,
+            rows,
+            "Data entities",
+            page=page,
+            page_size=page_size,
+            total=total,
+            offset=offset,
+            as_html=as_html,
+        )
@@ -4,7 +4,7 @@ from typing import Any, List, Optional
 
 from pydantic import BaseModel, Field
 
-from odd_ml.helpers.asci_renderer import show_table
+from odd_ml.helpers.asci_renderer import PAGE_SIZE, show_table
 
 from .data_source import DataSource
 
@@ -115,9 +115,24 @@ class DataEntity(BaseModel):
         self.show_metadata()
         self.show_relatives()
 
-    def show_metadata(self):
-        rows = [[v.field.name, v.value] for v in self.metadata_field_values]
-        show_table(["Field", "Value"], rows, "Metadata")
+    def show_metadata(
+        self,
+        page: int = 1,
+        page_size: Optional[int] = PAGE_SIZE,
+        as_html: Optional[bool] = None,
+    ):
+        values = self.metadata_field_values
+        rows = ([v.field.name, v.value] for v in values)
+
+        show_table(
+            ["Field", "Value"],
+            rows,
+            "Metadata",
+            page=page,
+            page_size=page_size,
+            total=len(values),
+            as_html=as_html,
+        )
 
     def show_relatives(self):
         field_names = ["Id", "Name", "Class"]
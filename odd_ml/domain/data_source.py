@@ -6,7 +6,7 @@ from prettytable import PrettyTable
 from pydantic import BaseModel
 
 from odd_ml.domain.namespace import Namespace
-from odd_ml.helpers.asci_renderer import show_table
+from odd_ml.helpers.asci_renderer import PAGE_SIZE, show_table
 
 
 class DataSource(BaseModel):
@@ -37,7 +37,12 @@ class GetDataSourcesResult(BaseModel):
 
         return ds
 
-    def show_table(self):
+    def show_table(
+        self,
+        page: int = 1,
+        page_size: Optional[int] = PAGE_SIZE,
+        as_html: Optional[bool] = None,
+    ):
         key_value: Dict[str, Callable[[Any], Any]] = {
             "Id": lambda x: x.id,
             "Name": lambda x: x.name,
@@ -45,6 +50,14 @@ class GetDataSourcesResult(BaseModel):
         }
 
         headers = key_value.keys()
-        rows = [[key_value[header](item) for header in headers] for item in self.items]
-
-        show_table(headers, rows, title="Data sources")
+        rows = ([key_value[header](item) for header in headers] for item in self.items)
+
+        show_table(
+            headers,
+            rows,
+            title="Data sources",
+            page=page,
+            page_size=page_size,
+            total=len(self.items),
+            as_html=as_html,
+        )
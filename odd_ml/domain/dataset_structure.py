@@ -0,0 +1,100 @@
+import datetime
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from odd_ml.helpers.asci_renderer import show_table
+from odd_ml.helpers.column_types import MAX_CATEGORIES, ColumnTypes, field_dtype
+
+
+class DatasetFieldType(BaseModel):
+    type: str
+    logical_type: Optional[str]
+    is_nullable: Optional[bool] = True
+
+
+class DatasetField(BaseModel):
+    id: int
+    parent_field_id: Optional[int]
+    name: str
+    oddrn: Optional[str]
+    type: DatasetFieldType
+    is_primary_key: Optional[bool]
+    is_sort_key: Optional[bool]
+    internal_description: Optional[str]
+    external_description: Optional[str]
+    enum_value_count: Optional[int]
+    stats: Optional[Dict[str, Any]]
+
+    @property
+    def unique_count(self) -> Optional[int]:
+        """Number of unique values from stats of field type, i.e. string_stats"""
+        for stats in (self.stats or {}).values():
+            if isinstance(stats, dict) and stats.get("unique_count") is not None:
+                return stats["unique_count"]
+        return None
+
+    def dtype(self, max_categories: int = MAX_CATEGORIES) -> Optional[str]:
+        return field_dtype(
+            self.type.type,
+            self.type.logical_type,
+            nullable=self.type.is_nullable is not False,
+            unique_count=self.unique_count,
+            enum_value_count=self.enum_value_count,
+            max_categories=max_categories,
+        )
+
+
+class DatasetVersion(BaseModel):
+    id: int
+    dataset_id: Optional[int]
+    version: Optional[int]
+    created_at: Optional[datetime.datetime]
+
+
+class DatasetStructure(BaseModel):
+    dataset_version: DatasetVersion
+    field_list: List[DatasetField]
+
+    @property
+    def columns(self) -> List[DatasetField]:
+        """Top level fields, nested fields of structs and lists are skipped"""
+        return [f for f in self.field_list if f.parent_field_id is None]
+
+    def column_types(self, max_categories: int = MAX_CATEGORIES) -> ColumnTypes:
+        """pandas dtypes of columns for reading dataset without type inference
+
+        Args:
+            max_categories (int): string columns with at most this many unique
+                values in field stats, or with enum values, are categories
+        """
+        column_types = ColumnTypes()
+
+        for field in self.columns:
+            if field.type.type == "TYPE_DATETIME":
+                column_types.dates.append(field.name)
+                continue
+
+            dtype = field.dtype(max_categories)
+            if dtype is not None:
+                column_types.dtypes[field.name] = dtype
+
+        return column_types
+
+    def show_table(self):
+        rows = [
+            [
+                f.name,
+                f.type.type.replace("TYPE_", ""),
+                f.type.logical_type,
+                f.type.is_nullable,
+                "datetime64[ns]" if f.type.type == "TYPE_DATETIME" else f.dtype(),
+            ]
+            for f in self.columns
+        ]
+
+        show_table(
+            ["Name", "Type", "Logical type", "Nullable", "Dtype"],
+            rows,
+            f"Structure, version {self.dataset_version.version}",
+        )
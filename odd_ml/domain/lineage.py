@@ -0,0 +1,97 @@
+from collections import deque
+from typing import Dict, List, Literal, Optional, Set
+
+from pydantic import BaseModel
+
+from odd_ml.helpers.asci_renderer import show_table
+
+from .data_entity import DataEntity
+
+Direction = Literal["upstream", "downstream", "both"]
+
+
+class LineageGraph(BaseModel):
+    """Lineage of data entity expanded for several hops
+
+    Edges are kept in adjacency sets in both directions, so sources and
+    targets of any node are looked up without scanning all edges.
+
+    Attributes:
+        root_id (int): id of data entity lineage was expanded from
+        nodes (dict): fetched data entities by id
+        sources (dict): ids of direct upstream nodes by node id
+        targets (dict): ids of direct downstream nodes by node id
+    """
+
+    root_id: int
+    nodes: Dict[int, DataEntity] = {}
+    sources: Dict[int, Set[int]] = {}
+    targets: Dict[int, Set[int]] = {}
+
+    def add_edge(self, source_id: int, target_id: int) -> None:
+        self.targets.setdefault(source_id, set()).add(target_id)
+        self.sources.setdefault(target_id, set()).add(source_id)
+
+    @property
+    def edges(self) -> List[tuple]:
+        """All (source_id, target_id) pairs"""
+        return [
+            (source_id, target_id)
+            for source_id, target_ids in self.targets.items()
+            for target_id in target_ids
+        ]
+
+    def upstream(
+        self, id: Optional[int] = None, depth: Optional[int] = None
+    ) -> Set[int]:
+        """Ids of all nodes the node depends on
+
+        Args:
+            id (int, optional): node id, root by default
+            depth (int, optional): max number of hops, unlimited by default
+        """
+        return self.__walk(self.sources, id, depth)
+
+    def downstream(
+        self, id: Optional[int] = None, depth: Optional[int] = None
+    ) -> Set[int]:
+        """Ids of all nodes depending on the node, i.e. impacted by its changes
+
+        Args:
+            id (int, optional): node id, root by default
+            depth (int, optional): max number of hops, unlimited by default
+        """
+        return self.__walk(self.targets, id, depth)
+
+    def show_table(self):
+        rows = [
+            [
+                id,
+                entity.internal_name or entity.external_name,
+                len(self.sources.get(id, ())),
+                len(self.targets.get(id, ())),
+            ]
+            for id, entity in self.nodes.items()
+        ]
+
+        show_table(["Id", "Name", "Sources", "Targets"], rows, title="Lineage")
+
+    def __walk(
+        self, adjacency: Dict[int, Set[int]], id: Optional[int], depth: Optional[int]
+    ) -> Set[int]:
+        start = self.root_id if id is None else id
+        visited = {start}
+        queue = deque([(start, 0)])
+
+        while queue:
+            node, hops = queue.popleft()
+            if depth is not None and hops >= depth:
+                continue
+
+            for next_node in adjacency.get(node, ()):
+                if next_node not in visited:
+                    visited.add(next_node)
+                    queue.append((next_node, hops + 1))
+
+        visited.discard(start)
+        return visited
@@ -1 +1,12 @@
+from odd_ml.helpers.arrow_tables import table_to_dataframe
+from odd_ml.helpers.dataframe_filters import (
+    Filters,
+    bind_partitions,
+    filter_columns,
+    filter_dataframe,
+    filter_table,
+    match_partitions,
+)
+from odd_ml.helpers.hive_partitions import hive_partitions
 from odd_ml.helpers.oddrn_to_s3_path import oddrn_to_s3_path
+from odd_ml.helpers.oddrn_to_uri import oddrn_to_uri, register_oddrn_mapper
@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING, Dict, List
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+DTYPE_BACKENDS = ("numpy", "pyarrow")
+
+
+def table_to_dataframe(
+    table: "pa.Table", dtype_backend: str = "numpy"
+) -> "pd.DataFrame":
+    """Convert Arrow table to DataFrame, buffers are released while converting
+
+    Args:
+        table (pyarrow.Table): table to convert, must not be used afterwards
+        dtype_backend (str): "numpy" for default pandas dtypes with strings as
+            python objects, "pyarrow" to keep strings in Arrow memory as
+            string[pyarrow] dtype, which is several times more compact
+
+    Returns:
+        pandas.DataFrame
+    """
+    import pandas as pd
+    import pyarrow as pa
+
+    if dtype_backend not in DTYPE_BACKENDS:
+        raise ValueError(f"Unknown dtype backend {dtype_backend}")
+
+    types_mapper = None
+    if dtype_backend == "pyarrow":
+        string_dtype = pd.StringDtype("pyarrow")
+        types_mapper = {pa.string(): string_dtype, pa.large_string(): string_dtype}.get
+
+    return table.to_pandas(
+        split_blocks=True, self_destruct=True, types_mapper=types_mapper
+    )
+
+
+def concat_tables(tables: List["pa.Table"]) -> "pa.Table":
+    """Concatenate tables of dataset files, missing columns are filled with nulls"""
+    import pyarrow as pa
+
+    if len(tables) == 1:
+        return tables[0]
+
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except TypeError:
+        # pyarrow < 14 only supports promotion of nulls and missing columns
+        return pa.concat_tables(tables, promote=True)
+
+
+def append_partitions(table: "pa.Table", partitions: Dict[str, str]) -> "pa.Table":
+    """Add partition values as string columns, same as strings of files, so
+    dtypes of partitions in pandas depend only on dtype backend"""
+    import numpy as np
+    import pyarrow as pa
+
+    for name, value in partitions.items():
+        indices = pa.array(np.zeros(table.num_rows, dtype=np.int32))
+        table = table.append_column(name, pa.array([value]).take(indices))
+
+    return table
@@ -1,14 +1,162 @@
+import html
+import itertools
+import sys
+import uuid
 from pprint import pprint
-from typing import List, Optional
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
 
 from prettytable import PrettyTable
 
+# rows shown at once
+PAGE_SIZE = 50
+
+# rows put into html table, which is paged in browser
+MAX_HTML_ROWS = 1000
+
+_PAGER_SCRIPT = """
+(function() {
+  var root = document.getElementById("%(id)s");
+  var rows = root.querySelectorAll("tbody tr");
+  var size = %(size)d, first = %(first)d, page = 0;
+  var pages = Math.max(1, Math.ceil(rows.length / size));
+  function show(p) {
+    page = Math.min(Math.max(p, 0), pages - 1);
+    rows.forEach(function(row, i) {
+      row.style.display = Math.floor(i / size) === page ? "" : "none";
+    });
+    root.querySelector(".odd-page").textContent =
+      "Page " + (first + page) + " (" + (page + 1) + " of " + pages + ")%(more)s";
+  }
+  root.querySelector(".odd-prev").onclick = function() { show(page - 1); };
+  root.querySelector(".odd-next").onclick = function() { show(page + 1); };
+  show(0);
+})();
+"""
+
 
 def show_table(
-    field_names: List[str], rows: List[List[str]], title: Optional[str] = None
+    field_names: Iterable[str],
+    rows: Iterable[Sequence[Any]],
+    title: Optional[str] = None,
+    page: int = 1,
+    page_size: Optional[int] = None,
+    total: Optional[int] = None,
+    offset: int = 0,
+    as_html: Optional[bool] = None,
 ) -> None:
+    """Show page of rows as a table
+
+    All rows are shown unless page_size is set. Paged rows are taken from
+    iterable only up to shown page, so lazy rows, i.e. generator formatting
+    items or search results read page by page, are formatted and fetched only
+    for visible rows. In Jupyter paged rows are rendered as html table paged
+    in browser, up to MAX_HTML_ROWS rows from page.
+
+    Args:
+        field_names (list of str): column names
+        rows (iterable): row values, list or lazy iterable
+        title (str, optional): table title
+        page (int): shown page starting from 1
+        page_size (int, optional): rows per page, all rows if None
+        total (int, optional): number of rows, len of rows by default
+        offset (int): number of rows preceding the first row of rows,
+            for lazy sources already starting from shown page
+        as_html (bool, optional): render html table, by default only in Jupyter
+    """
+    field_names = list(field_names)
+    if total is None and hasattr(rows, "__len__"):
+        total = len(rows)
+
+    if as_html is None:
+        as_html = _in_notebook()
+
+    if page_size is None:
+        page, first, as_html = 1, 0, False
+        visible, has_more = list(rows), False
+    else:
+        first = (page - 1) * page_size
+        count = MAX_HTML_ROWS if as_html else page_size
+        visible, has_more = _take(rows, max(first - offset, 0), count)
+
+    if as_html:
+        from IPython.display import HTML, display
+
+        markup = _html_table(field_names, visible, title, page, page_size, has_more)
+        display(HTML(markup))
+        return
+
     tbl = PrettyTable(title=title)
     tbl.field_names = field_names
     tbl.align = "l"
-    tbl.add_rows(rows)
+    tbl.add_rows(visible)
     pprint(tbl)
+
+    if page > 1 or has_more:
+        print(_footer(first, len(visible), total, page, has_more))
+
+
+def _take(
+    rows: Iterable[Sequence[Any]], start: int, count: int
+) -> Tuple[List[Sequence[Any]], bool]:
+    """Rows from start and whether there are more, one row is read ahead"""
+    taken = list(itertools.islice(rows, start, start + count + 1))
+    return taken[:count], len(taken) > count
+
+
+def _footer(
+    first: int, shown: int, total: Optional[int], page: int, has_more: bool
+) -> str:
+    text = f"Rows {first + 1}-{first + shown}" if shown else "No rows on this page"
+    if total is not None:
+        text += f" of {total}"
+    if has_more:
+        text += f", next page={page + 1}"
+    return text
+
+
+def _html_table(
+    field_names: List[str],
+    rows: List[Sequence[Any]],
+    title: Optional[str],
+    page: int,
+    page_size: int,
+    has_more: bool,
+) -> str:
+    id = f"odd-table-{uuid.uuid4().hex}"
+
+    def cells(values: Sequence[Any], tag: str) -> str:
+        return "".join(f"<{tag}>{html.escape(str(v))}</{tag}>" for v in values)
+
+    body = "".join(
+        # rows beyond first page are hidden until pager script shows them
+        f"<tr{'' if i < page_size else ' style=display:none'}>{cells(row, 'td')}</tr>"
+        for i, row in enumerate(rows)
+    )
+    caption = f"<caption>{html.escape(title)}</caption>" if title else ""
+    script = _PAGER_SCRIPT % {
+        "id": id,
+        "size": page_size,
+        "first": page,
+        "more": f", more than {len(rows)} rows" if has_more else "",
+    }
+
+    return (
+        f'<div id="{id}">'
+        f'<table style="text-align:left">{caption}'
+        f"<thead><tr>{cells(field_names, 'th')}</tr></thead>"
+        f"<tbody>{body}</tbody></table>"
+        '<div><button class="odd-prev">&lsaquo;</button> '
+        '<span class="odd-page"></span> '
+        '<button class="odd-next">&rsaquo;</button></div>'
+        f"<script>{script}</script></div>"
+    )
+
+
+def _in_notebook() -> bool:
+    # IPython is not imported if it is not already running
+    ipython = sys.modules.get("IPython")
+    if ipython is None:
+        return False
+
+    shell = ipython.get_ipython()
+    return type(shell).__name__ == "ZMQInteractiveShell"
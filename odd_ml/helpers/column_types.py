@@ -0,0 +1,137 @@
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# logical types of source systems with known width,
+# integer stats are not used as values beyond them would silently overflow
+INTEGER_DTYPES = {
+    "tinyint": "int8",
+    "byte": "int8",
+    "smallint": "int16",
+    "short": "int16",
+    "int2": "int16",
+    "int16": "int16",
+    "int": "int32",
+    "integer": "int32",
+    "int4": "int32",
+    "int32": "int32",
+    "mediumint": "int32",
+    "bigint": "int64",
+    "long": "int64",
+    "int64": "int64",
+}
+FLOAT_DTYPES = {"real": "float32", "float4": "float32", "float32": "float32"}
+
+# string fields with at most this many unique values are read as categories
+MAX_CATEGORIES = 1000
+
+# nullable dtypes are slow to parse in pandas parsers,
+# columns are parsed as numbers or objects and converted after
+MASKED_DTYPES = {
+    *(f"{sign}Int{bits}" for sign in ("", "U") for bits in (8, 16, 32, 64)),
+    "boolean",
+}
+
+# 64 bit integers do not fit float64 exactly, text parsers read them as strings,
+# which are converted to integers without going through floats
+EXACT_DTYPES = {"Int64", "UInt64"}
+
+
+@dataclass
+class ColumnTypes:
+    """pandas dtypes of dataset columns known before reading
+
+    Text formats (csv, jsonl) are parsed with these dtypes instead of inferring
+    them, columns missing in file are ignored. Nullable integers, booleans and
+    datetimes are converted after parsing, as it's faster than in parser.
+
+    Attributes:
+        dtypes (dict): dtype by column name, i.e. {"country": "category"}
+        dates (list of str): columns parsed as datetimes
+    """
+
+    dtypes: Dict[str, Any] = field(default_factory=dict)
+    dates: List[str] = field(default_factory=list)
+
+    @property
+    def parser_dtypes(self) -> Dict[str, Any]:
+        """dtypes passed to parser"""
+        return {c: d for c, d in self.dtypes.items() if str(d) not in MASKED_DTYPES}
+
+    @property
+    def text_dtypes(self) -> Dict[str, Any]:
+        """dtypes passed to parsers keeping values as read, i.e. csv parser"""
+        text = {c: str for c, d in self.dtypes.items() if str(d) in EXACT_DTYPES}
+        return {**self.parser_dtypes, **text}
+
+    def convert(self, dataframe: "pd.DataFrame") -> "pd.DataFrame":
+        """Convert parsed columns to nullable dtypes and datetimes"""
+        import pandas as pd
+
+        for column, dtype in self.dtypes.items():
+            if str(dtype) not in MASKED_DTYPES or column not in dataframe.columns:
+                continue
+
+            values = dataframe[column]
+            if str(dtype) in EXACT_DTYPES and values.dtype == object:
+                dataframe[column] = pd.array(values.to_numpy(), dtype=dtype)
+            else:
+                dataframe[column] = values.astype(dtype)
+
+        for column in self.dates:
+            if column in dataframe.columns:
+                dataframe[column] = pd.to_datetime(dataframe[column])
+
+        return dataframe
+
+
+def _base_type(logical_type: str) -> str:
+    """Logical type without size and modifiers, i.e. int for "INT(11) UNSIGNED" """
+    return re.split(r"[\s(]", logical_type.strip().lower(), 1)[0]
+
+
+def field_dtype(
+    field_type: str,
+    logical_type: Optional[str] = None,
+    nullable: bool = True,
+    unique_count: Optional[int] = None,
+    enum_value_count: Optional[int] = None,
+    max_categories: int = MAX_CATEGORIES,
+) -> Optional[str]:
+    """pandas dtype of dataset field by its type in ODD platform
+
+    Args:
+        field_type (str): platform type, i.e. "TYPE_INTEGER"
+        logical_type (str, optional): type in source system, i.e. "smallint"
+        nullable (bool): field may have nulls, nullable pandas dtypes are used
+        unique_count (int, optional): number of unique values from field stats
+        enum_value_count (int, optional): number of enum values defined in platform
+        max_categories (int): strings with fewer unique values are categories
+
+    Returns:
+        str or None if type must be inferred, datetimes are not dtypes,
+        see ColumnTypes.dates
+    """
+    logical_type = logical_type or ""
+    base_type = _base_type(logical_type)
+
+    if field_type == "TYPE_INTEGER":
+        dtype = INTEGER_DTYPES.get(base_type, "int64")
+        if "unsigned" in logical_type.lower():
+            dtype = f"u{dtype}"
+        # nullable integer dtypes are Int64, UInt64, ...
+        return dtype.title().replace("Uint", "UInt") if nullable else dtype
+    if field_type == "TYPE_NUMBER":
+        return FLOAT_DTYPES.get(base_type, "float64")
+    if field_type == "TYPE_BOOLEAN":
+        return "boolean" if nullable else "bool"
+    if field_type in ("TYPE_STRING", "TYPE_CHAR"):
+        if enum_value_count or (unique_count and unique_count <= max_categories):
+            return "category"
+        # keeps values like zip codes as strings
+        return "object"
+
+    return None
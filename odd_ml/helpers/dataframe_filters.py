@@ -0,0 +1,207 @@
+import datetime
+import operator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import unquote
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+Predicate = Tuple[str, str, Any]
+Filters = Union[List[Predicate], List[List[Predicate]]]
+"""Filters in disjunctive normal form, same as pyarrow and fastparquet use
+
+Examples:
+    [("year", ">=", 2021), ("country", "in", ["UA", "PL"])]  # year >= 2021 AND ...
+    [[("a", "==", 1)], [("b", "==", 2)]]  # a == 1 OR b == 2
+"""
+
+# partition values of boolean columns
+BOOLEANS = {"true": True, "false": False, "1": True, "0": False}
+
+OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+# pyarrow.compute functions of comparison operators
+ARROW_OPERATORS: Dict[str, str] = {
+    "=": "equal",
+    "==": "equal",
+    "!=": "not_equal",
+    "<": "less",
+    "<=": "less_equal",
+    ">": "greater",
+    ">=": "greater_equal",
+}
+
+
+def normalize_filters(filters: Filters) -> List[List[Predicate]]:
+    """Represent filters as list of conjunctions"""
+    if not filters:
+        return []
+
+    if isinstance(filters[0], tuple):
+        return [list(filters)]
+
+    return [list(conjunction) for conjunction in filters]
+
+
+def filter_columns(filters: Optional[Filters]) -> Set[str]:
+    """Names of columns used in filters"""
+    return {
+        column
+        for conjunction in normalize_filters(filters)
+        for column, _, _ in conjunction
+    }
+
+
+def filter_table(table: "pa.Table", filters: Optional[Filters]) -> "pa.Table":
+    """Keep rows of Arrow table matching filters, rows with nulls in compared
+    columns don't match"""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    conjunctions = normalize_filters(filters)
+    if not conjunctions:
+        return table
+
+    mask = None
+    for conjunction in conjunctions:
+        matches = None
+        for column, op, value in conjunction:
+            left = table[column]
+
+            if op in ("in", "not in"):
+                values = pa.array(list(value), type=left.type)
+                condition = pc.is_in(left, value_set=values)
+                if op == "not in":
+                    condition = pc.invert(condition)
+            elif op in ARROW_OPERATORS:
+                condition = getattr(pc, ARROW_OPERATORS[op])(left, value)
+            else:
+                raise ValueError(f"Unsupported filter operator {op}")
+
+            matches = condition if matches is None else pc.and_(matches, condition)
+        mask = matches if mask is None else pc.or_(mask, matches)
+
+    return table.filter(mask)
+
+
+def filter_dataframe(
+    dataframe: "pd.DataFrame", filters: Optional[Filters]
+) -> "pd.DataFrame":
+    """Keep rows matching filters"""
+    import pandas as pd
+
+    conjunctions = normalize_filters(filters)
+    if not conjunctions:
+        return dataframe
+
+    mask = pd.Series(False, index=dataframe.index)
+    for conjunction in conjunctions:
+        matches = pd.Series(True, index=dataframe.index)
+        for column, op, value in conjunction:
+            matches &= _evaluate(dataframe[column], op, value)
+        mask |= matches
+
+    return dataframe[mask]
+
+
+def bind_partitions(
+    filters: Optional[Filters], partitions: Dict[str, str]
+) -> Optional[List[List[Predicate]]]:
+    """Evaluate predicates on partition columns with partition values of file
+
+    Returns:
+        None if all rows of file match filters,
+        empty list if no rows match,
+        otherwise filters left for columns stored in file
+    """
+    conjunctions = normalize_filters(filters)
+    if not conjunctions:
+        return None
+
+    bound = []
+    for conjunction in conjunctions:
+        if not all(
+            _evaluate(_cast(partitions[column], value), op, value)
+            for column, op, value in conjunction
+            if column in partitions
+        ):
+            continue
+
+        rest = [p for p in conjunction if p[0] not in partitions]
+        if not rest:
+            return None
+
+        bound.append(rest)
+
+    return bound
+
+
+def match_partitions(partitions: Dict[str, str], filters: Optional[Filters]) -> bool:
+    """Check if file with partition values may contain rows matching filters"""
+    return bind_partitions(filters, partitions) != []
+
+
+def _cast(partition_value: str, value: Any) -> Any:
+    """Partition values are strings, cast them to type of filter value"""
+    sample = next(iter(value), None) if isinstance(value, (list, set, tuple)) else value
+
+    if sample is None or isinstance(sample, str):
+        return partition_value
+
+    try:
+        if isinstance(sample, bool):
+            return BOOLEANS[partition_value.lower()]
+        if isinstance(sample, datetime.datetime):
+            return _timestamp(partition_value, sample.tzinfo)
+        if isinstance(sample, datetime.date):
+            return _timestamp(partition_value).date()
+        return type(sample)(partition_value)
+    except (KeyError, TypeError, ValueError):
+        return partition_value
+
+
+def _timestamp(partition_value: str, tz: Optional[datetime.tzinfo] = None) -> Any:
+    import pandas as pd
+
+    # writers escape colons of datetimes in directory names
+    timestamp = pd.Timestamp(unquote(partition_value))
+    if tz is not None and timestamp.tzinfo is None:
+        timestamp = timestamp.tz_localize(tz)
+    return timestamp
+
+
+def _evaluate(left: Any, op: str, value: Any) -> Any:
+    if op in ("in", "not in"):
+        values: Sequence[Any] = list(value)
+
+        # partition values are plain strings, columns are pandas Series
+        if hasattr(left, "isin"):
+            matches = left.isin(values)
+            return ~matches if op == "not in" else matches
+
+        return (left in values) != (op == "not in")
+
+    if op not in OPERATORS:
+        raise ValueError(f"Unsupported filter operator {op}")
+
+    return OPERATORS[op](left, value)
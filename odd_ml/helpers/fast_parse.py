@@ -0,0 +1,77 @@
+import json
+from datetime import datetime
+from functools import lru_cache
+from inspect import isclass
+from typing import Any, Callable, Dict, List, Tuple, Type, TypeVar, Union
+
+from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_LIST, ModelField
+
+try:
+    import orjson
+
+    loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+except ImportError:
+    loads = json.loads
+
+T = TypeVar("T", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+
+def construct_model(model: Type[T], data: Dict[str, Any]) -> T:
+    """Build model from trusted data without validation of fields
+
+    Nested models, lists of models and datetimes are converted,
+    other values are set as is.
+    """
+    values = {}
+    fields_set = set()
+
+    for name, alias, convert, field in _plan(model):
+        if alias in data:
+            raw = data[alias]
+            values[name] = raw if raw is None or convert is None else convert(raw)
+            fields_set.add(name)
+        else:
+            values[name] = field.get_default()
+
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+
+    return instance
+
+
+def parse_model(model: Type[T], text: Union[str, bytes], validate: bool = True) -> T:
+    """Parse response text to model, validation is skipped for trusted responses"""
+    if validate:
+        return model.parse_obj(loads(text))
+
+    return construct_model(model, loads(text))
+
+
+@lru_cache(maxsize=None)
+def _plan(model: Type[BaseModel]) -> List[Tuple[str, str, Any, ModelField]]:
+    """Field names, aliases and converters of model, computed once per model"""
+    plan = []
+
+    for name, field in model.__fields__.items():
+        convert = None
+
+        if isclass(field.type_) and issubclass(field.type_, BaseModel):
+            convert = _model_converter(field.type_, field.shape == SHAPE_LIST)
+        elif field.type_ is datetime:
+            convert = parse_datetime
+
+        plan.append((name, field.alias, convert, field))
+
+    return plan
+
+
+def _model_converter(model: Type[BaseModel], many: bool) -> Converter:
+    if many:
+        return lambda items: [construct_model(model, item) for item in items]
+
+    return lambda item: construct_model(model, item)
@@ -0,0 +1,8 @@
+from typing import Dict
+
+
+def hive_partitions(relative_path: str) -> Dict[str, str]:
+    """Get partition values from Hive-style path, i.e year=2022/month=01/file.csv"""
+    directories = relative_path.strip("/").split("/")[:-1]
+
+    return dict(d.split("=", 1) for d in directories if "=" in d)
@@ -0,0 +1,61 @@
+from typing import Callable, Dict, Optional
+
+from odd_ml.helpers.oddrn_to_s3_path import oddrn_to_s3_path
+
+OddrnMapper = Callable[[str], str]
+
+
+def oddrn_scheme(oddrn: str) -> str:
+    """Storage part of oddrn, i.e. "s3" for //s3/cloud/aws/..."""
+    if not oddrn.startswith("//"):
+        raise ValueError(f"Unsupported oddrn format {oddrn}, must start with //")
+
+    return oddrn[2:].split("/", 1)[0]
+
+
+def oddrn_to_gcs_path(oddrn: str) -> str:
+    """Convert //gcs/.../buckets/{bucket}/keys/{keys} oddrn to gcs path"""
+    _, bucket, _, keys = oddrn.split("/")[-4:]
+    return f"gs://{bucket}/{keys.replace(':', '/')}"
+
+
+def oddrn_to_local_path(oddrn: str) -> str:
+    """Convert //local/host/{host}/path/{path} oddrn to local file uri
+
+    Folders of path are joined with ":", i.e. //local/host/nas/path/data:orders.csv
+    is file:///data/orders.csv
+    """
+    _, path = oddrn.rsplit("/path/", 1)
+    return f"file:///{path.replace(':', '/').lstrip('/')}"
+
+
+ODDRN_MAPPERS: Dict[str, OddrnMapper] = {
+    "s3": oddrn_to_s3_path,
+    "gcs": oddrn_to_gcs_path,
+    "local": oddrn_to_local_path,
+}
+
+
+def register_oddrn_mapper(scheme: str, mapper: OddrnMapper) -> None:
+    """Register conversion of oddrns of other storages to fsspec uris
+
+    Example:
+        register_oddrn_mapper("hdfs", lambda oddrn: "hdfs://" + oddrn.split("/path/")[1])
+    """
+    ODDRN_MAPPERS[scheme] = mapper
+
+
+def oddrn_to_uri(oddrn: str, mappers: Optional[Dict[str, OddrnMapper]] = None) -> str:
+    """Convert oddrn to fsspec uri by mapper of oddrn scheme
+
+    Args:
+        oddrn (str): oddrn of dataset
+        mappers (dict, optional): mappers by scheme, registered ones by default
+    """
+    mappers = ODDRN_MAPPERS if mappers is None else mappers
+    scheme = oddrn_scheme(oddrn)
+
+    if scheme not in mappers:
+        raise ValueError(f"Unsupported oddrn {oddrn}, no mapper for {scheme}")
+
+    return mappers[scheme](oddrn)
@@ -0,0 +1,174 @@
+import asyncio
+import json
+from functools import wraps
+from typing import Optional, Type
+
+from odd_ml.domain.data_entities import DataEntities
+from odd_ml.domain.data_entity import DataEntity
+from odd_ml.domain.data_source import GetDataSourcesResult
+from odd_ml.helpers.fast_parse import parse_model
+from odd_ml.http.http_client import (
+    HttpConfig,
+    SearchConfig,
+    T,
+    build_search_form_data,
+)
+from odd_ml.utils import TtlCache, instrumentation
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError(
+        "AsyncHttpClient requires aiohttp, install it with `pip install odd-ml[async]`"
+    ) from e
+
+
+def map_async_response_to(mapper: Type[T]):
+    def inner(func):
+        @wraps(func)
+        async def wrapped(self, *args, **kwargs):
+            return parse_model(
+                mapper,
+                await func(self, *args, **kwargs),
+                self.config.validate_responses,
+            )
+
+        return wrapped
+
+    return inner
+
+
+class AsyncHttpClient:
+    """Asyncio counterpart of HttpClient
+
+    Number of simultaneously running requests is limited by max_concurrency.
+
+    Args:
+        platform_url (str): url to odd-platform
+        config (HttpConfig, optional): connection pool, timeouts and retries settings
+        max_concurrency (int): max number of requests in flight
+    """
+
+    def __init__(
+        self,
+        platform_url: str,
+        config: Optional[HttpConfig] = None,
+        max_concurrency: int = 10,
+    ) -> None:
+        self.__url = platform_url
+        self.__config = config or HttpConfig()
+        self.__max_concurrency = max_concurrency
+        self.__search_ids: TtlCache[str] = TtlCache(self.__config.search_id_ttl)
+        self.__session: Optional[aiohttp.ClientSession] = None
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def config(self) -> HttpConfig:
+        return self.__config
+
+    async def close(self) -> None:
+        """Close all pooled connections"""
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    @map_async_response_to(DataEntities)
+    async def search(self, search_config: SearchConfig) -> DataEntities:
+        """Search any data entity
+
+        Args:
+            search_config (SearchConfig): search parameters
+
+        Returns:
+            DataEntities
+        """
+        search_id = await self.__get_search_id(build_search_form_data(search_config))
+        return await self.__get(
+            f"{self.__url}/api/search/{search_id}/results?page={search_config.page}&size={search_config.size}"
+        )
+
+    @map_async_response_to(GetDataSourcesResult)
+    async def get_data_sources(
+        self, page: int = 1, size: int = 100
+    ) -> GetDataSourcesResult:
+        """List of all DataSources
+
+        Returns:
+            GetDataSourcesResult
+        """
+        return await self.__get(f"{self.__url}/api/datasources?page={page}&size={size}")
+
+    @map_async_response_to(DataEntity)
+    async def get_data_entity_by_id(self, id: int) -> DataEntity:
+        """Getting data entity id
+
+        Args:
+            id (int): id of data entity
+
+        Returns:
+            DataEntity
+        """
+        return await self.__get(f"{self.__url}/api/dataentities/{id}")
+
+    async def __get_search_id(self, form_data: str) -> str:
+        search_id = self.__search_ids.get(form_data)
+        if search_id is not None:
+            return search_id
+
+        text = await self.__request(
+            "POST",
+            f"{self.__url}/api/search",
+            data=form_data,
+            headers={"Content-Type": "application/json"},
+        )
+
+        search_id = json.loads(text).get("search_id")
+        self.__search_ids.set(form_data, search_id)
+
+        return search_id
+
+    async def __get(self, url: str) -> str:
+        return await self.__request("GET", url)
+
+    async def __request(self, method: str, url: str, **kwargs) -> str:
+        """Send request retrying on configured statuses with exponential backoff"""
+        session = self.__get_session()
+
+        for attempt in range(self.__config.retries + 1):
+            async with self.__semaphore:
+                timer = instrumentation.timer("http.request", method=method, url=url)
+                with timer:
+                    async with session.request(method, url, **kwargs) as res:
+                        body = await res.read()
+
+                instrumentation.count("http.requests")
+                instrumentation.count("http.bytes", len(body))
+                if res.status >= 400:
+                    instrumentation.count("http.errors", status=res.status)
+
+                retry = (
+                    res.status in self.__config.status_forcelist
+                    and attempt < self.__config.retries
+                )
+                if not retry:
+                    res.raise_for_status()
+                    return await res.text()
+
+            await asyncio.sleep(self.__config.backoff_factor * (2**attempt))
+
+    def __get_session(self) -> aiohttp.ClientSession:
+        """Session must be created inside running event loop"""
+        if self.__session is None:
+            connector = aiohttp.TCPConnector(limit=self.__config.pool_maxsize)
+            timeout = aiohttp.ClientTimeout(
+                sock_connect=self.__config.connect_timeout,
+                sock_read=self.__config.read_timeout,
+            )
+            self.__session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=timeout,
+                headers={"Accept-Encoding": "gzip, deflate"},
+            )
+            self.__semaphore = asyncio.Semaphore(self.__max_concurrency)
+
+        return self.__session
@@ -1,19 +1,27 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from functools import wraps
-from typing import Optional, Type, TypeVar
+from typing import Any, Dict, Iterator, Optional, Tuple, Type, TypeVar, Union
 
 import requests
 from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from odd_ml.domain.data_entities import (
     DataEntities,
     SearchFilterState,
     SearchFormData,
     SearchFormDataFilters,
+    SearchResultItem,
 )
 from odd_ml.domain.data_entity import DataEntity
 from odd_ml.domain.data_source import GetDataSourcesResult
+from odd_ml.domain.dataset_structure import DatasetStructure
+from odd_ml.helpers.fast_parse import loads, parse_model
+from odd_ml.http.response_cache import ResponseCache
+from odd_ml.utils import TtlCache, instrumentation
 
 T = TypeVar("T", bound=BaseModel)
 
@@ -26,11 +34,74 @@ class SearchConfig:
     size: int = 30
 
 
+@dataclass
+class HttpConfig:
+    """Connection settings for requests to odd-platform
+
+    Attributes:
+        pool_connections (int): number of connection pools to cache
+        pool_maxsize (int): max number of kept-alive connections per pool
+        connect_timeout (float): seconds to wait for establishing connection
+        read_timeout (float): seconds to wait for server response
+        retries (int): number of retries for failed requests
+        backoff_factor (float): factor for exponential delay between retries
+        status_forcelist (tuple of int): response codes which are retried
+        search_id_ttl (float): seconds to reuse search id for the same search form
+        validate_responses (bool): validate responses by pydantic models, if False
+            trusted responses are parsed faster without per-field validation
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    retries: int = 3
+    backoff_factor: float = 0.5
+    status_forcelist: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    search_id_ttl: float = 300.0
+    validate_responses: bool = True
+
+
+def build_search_form_data(search_config: SearchConfig) -> str:
+    """Serialized search form, same form gets the same search id"""
+    filters = SearchFormDataFilters()
+
+    # TODO: Add more filter
+    if search_config.data_source_id:
+        filters.datasources = [
+            SearchFilterState(entity_id=search_config.data_source_id, selected=True)
+        ]
+
+    data = SearchFormData(
+        query=search_config.query,
+        filters=filters,
+    )
+
+    return data.json()
+
+
+def has_next_page(result: Union[DataEntities, Dict[str, Any]], size: int) -> bool:
+    """Check if there is next page of search results, parsed or raw"""
+    if isinstance(result, dict):
+        items = result.get("items") or []
+        has_next = (result.get("page_info") or {}).get("has_next")
+    else:
+        items = result.items
+        has_next = result.page_info.has_next if result.page_info else None
+
+    if has_next is not None:
+        return has_next
+
+    return len(items) >= size > 0
+
+
 def map_response_to(mapper: Type[T]):
     def inner(func):
         @wraps(func)
-        def wrapped(*args, **kwargs):
-            return mapper.parse_raw(func(*args, **kwargs))
+        def wrapped(self, *args, **kwargs):
+            text = func(self, *args, **kwargs)
+            with instrumentation.timer("http.parse", model=mapper.__name__):
+                return parse_model(mapper, text, self.config.validate_responses)
 
         return wrapped
 
@@ -38,23 +109,121 @@ def map_response_to(mapper: Type[T]):
 
 
 class HttpClient:
-    def __init__(self, platform_url: str) -> None:
+    def __init__(
+        self,
+        platform_url: str,
+        config: Optional[HttpConfig] = None,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
         self.__url = platform_url
+        self.__config = config or HttpConfig()
+        self.__cache = cache
+        self.__session = self.__create_session()
+        self.__search_ids: TtlCache[str] = TtlCache(self.__config.search_id_ttl)
 
-    @map_response_to(DataEntities)
-    def search(self, search_config: SearchConfig) -> DataEntities:
+    @property
+    def config(self) -> HttpConfig:
+        return self.__config
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.__session.close()
+
+    def search(
+        self, search_config: SearchConfig, raw: bool = False
+    ) -> Union[DataEntities, Dict[str, Any]]:
         """Search any data entity
 
         Args:
             query (str): searching text
             datasource_id (int, optional): datasource id for narrowing search. Defaults to None.
+            raw (bool): return decoded json instead of DataEntities
 
         Returns:
             SearchResult
         """
-        search_id = self.__get_search_id(search_config)
-        url = f"{self.__url}/api/search/{search_id}/results?page={search_config.page}&size={search_config.size}"
-        return self.__get(url)
+        return self.__search_page(search_config, search_config.page, raw)
+
+    def iter_search(self, search_config: SearchConfig) -> Iterator[SearchResultItem]:
+        """Iterate over all search results starting from search_config.page
+
+        Next page is requested in background while current one is consumed.
+
+        Args:
+            search_config (SearchConfig): search parameters, size is used as page size
+
+        Yields:
+            SearchResultItem
+        """
+        for page in self.iter_search_pages(search_config):
+            yield from page.items
+
+    def iter_search_pages(
+        self, search_config: SearchConfig, raw: bool = False
+    ) -> Iterator[Union[DataEntities, Dict[str, Any]]]:
+        """Iterate over pages of search results starting from search_config.page
+
+        Next page is requested in background while current one is consumed.
+
+        Args:
+            search_config (SearchConfig): search parameters, size is used as page size
+            raw (bool): yield decoded json instead of DataEntities
+
+        Yields:
+            DataEntities or dict
+        """
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            page = search_config.page
+            future = executor.submit(self.__search_page, search_config, page, raw)
+
+            while True:
+                result = future.result()
+
+                has_next = has_next_page(result, search_config.size)
+                if has_next:
+                    page += 1
+                    future = executor.submit(
+                        self.__search_page, search_config, page, raw
+                    )
+
+                yield result
+
+                if not has_next:
+                    break
+
+    def __search_page(
+        self, search_config: SearchConfig, page: int, raw: bool = False
+    ) -> Union[DataEntities, Dict[str, Any]]:
+        """Fetch one page of results, search id is requested again if expired on platform"""
+        form_data = build_search_form_data(search_config)
+
+        try:
+            text = self.__get_search_results(form_data, page, search_config.size)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+
+            self.__search_ids.invalidate(form_data)
+            text = self.__get_search_results(form_data, page, search_config.size)
+
+        with instrumentation.timer("http.parse", model=DataEntities.__name__):
+            if raw:
+                result = loads(text)
+                items = len(result.get("items") or [])
+            else:
+                result = parse_model(
+                    DataEntities, text, self.__config.validate_responses
+                )
+                items = len(result.items)
+
+        instrumentation.count("http.items_decoded", items)
+        return result
+
+    def __get_search_results(self, form_data: str, page: int, size: int) -> str:
+        search_id = self.__get_search_id(form_data)
+        return self.__get(
+            f"{self.__url}/api/search/{search_id}/results?page={page}&size={size}"
+        )
 
     @map_response_to(GetDataSourcesResult)
     def get_data_sources(self, page: int = 1, size: int = 100) -> GetDataSourcesResult:
@@ -63,7 +232,9 @@ class HttpClient:
         Returns:
             GetDataSourcesResult
         """
-        return self.__get(f"{self.__url}/api/datasources?page={page}&size={size}")
+        return self.__get_cached(
+            f"{self.__url}/api/datasources?page={page}&size={size}"
+        )
 
     @map_response_to(DataEntity)
     def get_data_entity_by_id(self, id: int) -> DataEntity:
@@ -76,40 +247,137 @@ class HttpClient:
             DataEntity
         """
 
-        return self.__get(f"{self.__url}/api/dataentities/{id}")
+        return self.__get_cached(f"{self.__url}/api/dataentities/{id}")
 
-    def __get_search_id(self, search_config: SearchConfig) -> str:
+    @map_response_to(DatasetStructure)
+    def get_dataset_structure(
+        self, data_entity_id: int, version_id: Optional[int] = None
+    ) -> DatasetStructure:
+        """Getting structure of dataset
+
+        Args:
+            data_entity_id (int): id of dataset
+            version_id (int, optional): id of structure version, latest by default
+
+        Returns:
+            DatasetStructure
+        """
+        version = "latest" if version_id is None else version_id
+        return self.__get_cached(
+            f"{self.__url}/api/datasets/{data_entity_id}/structure/{version}"
+        )
+
+    def __get_search_id(self, form_data: str) -> str:
         """Each search request needs hashed search id from platform
 
+        Search ids are reused for the same search form until ttl expired.
+
             str: if successfully, else raises HTTPError
 
         Raises:
             HTTPError: in case of server returned error
         """
-        filters = SearchFormDataFilters()
+        search_id = self.__search_ids.get(form_data)
+        if search_id is not None:
+            return search_id
 
-        # TODO: Add more filter
-        if search_config.data_source_id:
-            filters.datasources = [
-                SearchFilterState(entity_id=search_config.data_source_id, selected=True)
-            ]
+        url = f"{self.__url}/api/search"
+        with instrumentation.timer("http.request", method="POST", url=url):
+            res = self.__session.post(
+                url=url,
+                data=form_data,
+                headers={"Content-Type": "application/json"},
+                timeout=self.__timeout,
+            )
+        self.__count_response(res)
+        res.raise_for_status()
 
-        data = SearchFormData(
-            query=search_config.query,
-            filters=filters,
-        )
+        search_id = json.loads(res.text).get("search_id")
+        self.__search_ids.set(form_data, search_id)
 
-        res = requests.post(
-            url=f"{self.__url}/api/search",
-            data=data.json(),
-            headers={"Content-Type": "application/json"},
-        )
+        return search_id
+
+    def __get(self, url) -> str:
+        res = self.__request(url)
         res.raise_for_status()
+        return res.text
+
+    def __request(
+        self, url, headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        with instrumentation.timer("http.request", method="GET", url=url):
+            res = self.__session.get(url, headers=headers, timeout=self.__timeout)
 
-        return json.loads(res.text).get("search_id")
+        self.__count_response(res)
+        return res
 
     @staticmethod
-    def __get(url) -> str:
-        res = requests.get(url)
+    def __count_response(res: requests.Response) -> None:
+        if instrumentation.enabled:
+            instrumentation.count("http.requests")
+            instrumentation.count("http.bytes", len(res.content))
+            if res.status_code >= 400:
+                instrumentation.count("http.errors", status=res.status_code)
+
+    def __get_cached(self, url) -> str:
+        """Get response from cache if it set, stale responses are revalidated"""
+        if self.__cache is None:
+            return self.__get(url)
+
+        cached = self.__cache.get(url)
+        if cached is not None and self.__cache.is_fresh(cached):
+            self.__cache.hit(url)
+            instrumentation.count("http.cache_hits")
+            return cached.body
+
+        headers = {}
+        if cached is not None and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached is not None and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+        res = self.__request(url, headers)
+
+        if cached is not None and res.status_code == 304:
+            self.__cache.hit(url, revalidated=True)
+            instrumentation.count("http.cache_revalidated")
+            return cached.body
+
+        instrumentation.count("http.cache_misses")
         res.raise_for_status()
+        self.__cache.set(
+            url,
+            res.text,
+            etag=res.headers.get("ETag"),
+            last_modified=res.headers.get("Last-Modified"),
+        )
+
         return res.text
+
+    @property
+    def __timeout(self) -> Tuple[float, float]:
+        return self.__config.connect_timeout, self.__config.read_timeout
+
+    def __create_session(self) -> requests.Session:
+        """Create session sharing kept-alive connections between requests"""
+        retry = Retry(
+            total=self.__config.retries,
+            backoff_factor=self.__config.backoff_factor,
+            status_forcelist=self.__config.status_forcelist,
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.__config.pool_connections,
+            pool_maxsize=self.__config.pool_maxsize,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        )
+
+        return session
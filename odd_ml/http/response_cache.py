@@ -0,0 +1,160 @@
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+
+@dataclass
+class CachedResponse:
+    body: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+
+class ResponseCache:
+    """On-disk cache of odd-platform responses keyed by url
+
+    Fresh responses (younger than ttl) are returned without request,
+    stale ones are revalidated by HttpClient using ETag/Last-Modified.
+    Least recently used responses are evicted when cache has more than max_entries.
+
+    Example:
+        cache = ResponseCache('~/.cache/odd_ml/responses.sqlite', ttl=600)
+        client = Client('http://localhost:8080', cache=cache)
+
+    Args:
+        path (str): path to sqlite database file
+        ttl (float): seconds while response is returned without revalidation
+        max_entries (int): max number of stored responses
+    """
+
+    def __init__(
+        self,
+        path: str = "~/.cache/odd_ml/responses.sqlite",
+        ttl: float = 600.0,
+        max_entries: int = 10_000,
+    ) -> None:
+        self.__path = os.path.expanduser(path)
+        self.__ttl = ttl
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+        self.__hits = 0
+        self.__misses = 0
+        self.__revalidated = 0
+
+        if self.__path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.__path)), exist_ok=True)
+
+        self.__db = sqlite3.connect(self.__path, check_same_thread=False)
+        self.__db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        self.__db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+        self.__db.commit()
+
+    @property
+    def hits(self) -> int:
+        """Number of responses returned from cache, including revalidated"""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """Number of responses downloaded from platform"""
+        return self.__misses
+
+    @property
+    def revalidated(self) -> int:
+        """Number of stale responses confirmed by platform as not modified"""
+        return self.__revalidated
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.__hits,
+            "misses": self.__misses,
+            "revalidated": self.__revalidated,
+            "entries": len(self),
+        }
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Get stored response regardless of its freshness"""
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        return CachedResponse(*row) if row else None
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        return time.time() - response.stored_at < self.__ttl
+
+    def hit(self, url: str, revalidated: bool = False) -> None:
+        """Mark stored response as used, revalidated response becomes fresh again"""
+        now = time.time()
+
+        with self.__lock:
+            self.__hits += 1
+            if revalidated:
+                self.__revalidated += 1
+                self.__db.execute(
+                    "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE url = ?",
+                    (now, now, url),
+                )
+            else:
+                self.__db.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url)
+                )
+            self.__db.commit()
+
+    def set(
+        self,
+        url: str,
+        body: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Store downloaded response and evict least recently used ones"""
+        now = time.time()
+
+        with self.__lock:
+            self.__misses += 1
+            self.__db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (url, body, etag, last_modified, now, now),
+            )
+            self.__db.execute(
+                """
+                DELETE FROM responses WHERE url IN (
+                    SELECT url FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (self.__max_entries,),
+            )
+            self.__db.commit()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__db.execute("DELETE FROM responses")
+            self.__db.commit()
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__db.close()
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -1,2 +1,27 @@
-from odd_ml.profiler.pandas_profiler import PandasProfiler
-from odd_ml.profiler.profiler import Profiler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from odd_ml.profiler.pandas_profiler import PandasProfiler
+    from odd_ml.profiler.profile_cache import ProfileCache
+    from odd_ml.profiler.profiler import Profiler
+    from odd_ml.profiler.streaming_profiler import StreamingProfiler
+
+# profilers depend on heavy libraries, they are imported on first access
+_EXPORTS = {
+    "PandasProfiler": "odd_ml.profiler.pandas_profiler",
+    "ProfileCache": "odd_ml.profiler.profile_cache",
+    "Profiler": "odd_ml.profiler.profiler",
+    "StreamingProfiler": "odd_ml.profiler.streaming_profiler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
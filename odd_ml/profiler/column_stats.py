@@ -0,0 +1,261 @@
+import datetime
+import decimal
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class ColumnStats:
+    """Mergeable statistics of one column
+
+    Mean and variance are kept as moments of numeric values only, as dtype of chunks
+    read from csv may differ, distinct count as HyperLogLog registers,
+    quantiles are estimated by bottom-k sample of values with random priorities,
+    top values by value counts trimmed to top_capacity.
+    """
+
+    hll_precision: int = 12
+    sample_size: int = 2048
+    top_capacity: int = 1000
+    count: int = 0
+    numeric_count: int = 0
+    nulls: int = 0
+    kind: Optional[str] = None
+    min: Any = None
+    max: Any = None
+    mean: float = 0.0
+    m2: float = 0.0
+    registers: np.ndarray = None
+    sample: np.ndarray = None
+    priorities: np.ndarray = None
+    top: Dict[Any, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        if self.registers is None:
+            self.registers = np.zeros(2**self.hll_precision, dtype=np.uint8)
+        if self.sample is None:
+            self.sample = np.empty(0, dtype=np.float64)
+            self.priorities = np.empty(0, dtype=np.float64)
+
+    def update(self, column: pd.Series, rng: np.random.Generator) -> "ColumnStats":
+        values = column.dropna()
+        self.nulls += len(column) - len(values)
+
+        if values.empty:
+            return self
+
+        kind = self.__kind(values)
+        self.kind = self.kind or kind
+
+        if values.dtype == object and _unhashable(values):
+            # nested records, i.e. dicts and lists read from jsonl, are counted by repr
+            values = values.map(repr)
+
+        self.__update_registers(values)
+        self.__update_top(values)
+
+        if kind == "numeric":
+            numbers = values.to_numpy(dtype=np.float64)
+            self.__merge_moments(
+                len(numbers), numbers.mean(), numbers.var() * len(numbers)
+            )
+            self.__merge_sample(numbers, rng.random(len(numbers)))
+            self.__merge_bounds(numbers.min(), numbers.max())
+            self.numeric_count += len(numbers)
+        elif kind == "datetime":
+            self.__merge_bounds(values.min(), values.max())
+
+        self.count += len(values)
+        return self
+
+    def merge(self, other: "ColumnStats") -> "ColumnStats":
+        self.nulls += other.nulls
+
+        if other.count == 0:
+            return self
+
+        self.kind = self.kind or other.kind
+        if other.numeric_count:
+            self.__merge_moments(other.numeric_count, other.mean, other.m2)
+            self.numeric_count += other.numeric_count
+        self.__merge_sample(other.sample, other.priorities)
+        np.maximum(self.registers, other.registers, out=self.registers)
+        self.__merge_top(other.top)
+
+        if other.min is not None:
+            self.__merge_bounds(other.min, other.max)
+
+        self.count += other.count
+        return self
+
+    @property
+    def distinct(self) -> int:
+        """HyperLogLog estimation of distinct values count"""
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.power(2.0, -self.registers.astype(float)))
+
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * np.log(m / zeros)
+
+        return int(round(min(estimate, self.count)))
+
+    @property
+    def variance(self) -> Optional[float]:
+        if self.numeric_count < 2:
+            return None
+        return self.m2 / (self.numeric_count - 1)
+
+    def quantiles(self, q: Sequence[float]) -> Dict[float, float]:
+        if len(self.sample) == 0:
+            return {}
+        return dict(zip(q, np.quantile(self.sample, q).tolist()))
+
+    def most_common(self, k: int) -> List[tuple]:
+        return sorted(self.top.items(), key=lambda x: x[1], reverse=True)[:k]
+
+    def to_dict(self, quantiles: Sequence[float], top_k: int) -> Dict[str, Any]:
+        result = {
+            "type": self.kind,
+            "count": self.count,
+            "nulls": self.nulls,
+            "distinct": self.distinct,
+            "min": _to_python(self.min),
+            "max": _to_python(self.max),
+            "top": [[_to_python(v), c] for v, c in self.most_common(top_k)],
+        }
+
+        if self.kind == "numeric":
+            variance = self.variance
+            result["mean"] = self.mean
+            result["std"] = float(np.sqrt(variance)) if variance is not None else None
+            result["quantiles"] = {
+                str(k): v for k, v in self.quantiles(quantiles).items()
+            }
+
+        return result
+
+    @staticmethod
+    def __kind(values: pd.Series) -> str:
+        if pd.api.types.is_bool_dtype(values):
+            return "categorical"
+        if pd.api.types.is_numeric_dtype(values):
+            return "numeric"
+        if pd.api.types.is_datetime64_any_dtype(values):
+            return "datetime"
+        return "categorical"
+
+    def __update_registers(self, values: pd.Series) -> None:
+        p = self.hll_precision
+        hashes = pd.util.hash_array(values.to_numpy())
+
+        index = (hashes >> np.uint64(64 - p)).astype(np.intp)
+        rest = hashes & np.uint64((1 << (64 - p)) - 1)
+
+        # rank is position of the leftmost 1-bit in remaining 64 - p bits
+        with np.errstate(divide="ignore"):
+            bit_length = np.floor(np.log2(rest.astype(np.float64))) + 1
+        bit_length[rest == 0] = 0
+        rank = (64 - p - bit_length + 1).astype(np.uint8)
+
+        np.maximum.at(self.registers, index, rank)
+
+    def __update_top(self, values: pd.Series) -> None:
+        # only most frequent values of chunk are merged, as in heavy hitters sketches
+        counts = values.value_counts().head(self.top_capacity)
+        self.__merge_top(counts.to_dict())
+
+    def __merge_top(self, counts: Dict[Any, int]) -> None:
+        top = self.top
+        for value, count in counts.items():
+            top[value] = top.get(value, 0) + int(count)
+
+        if len(top) > self.top_capacity:
+            self.top = dict(self.most_common(self.top_capacity))
+
+    def __merge_moments(self, count: int, mean: float, m2: float) -> None:
+        total = self.numeric_count + count
+        delta = mean - self.mean
+
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.numeric_count * count / total
+
+    def __merge_sample(self, values: np.ndarray, priorities: np.ndarray) -> None:
+        sample = np.concatenate([self.sample, values])
+        priorities = np.concatenate([self.priorities, priorities])
+
+        if len(sample) > self.sample_size:
+            keep = np.argpartition(priorities, self.sample_size)[: self.sample_size]
+            sample, priorities = sample[keep], priorities[keep]
+
+        self.sample, self.priorities = sample, priorities
+
+    def __merge_bounds(self, min_value: Any, max_value: Any) -> None:
+        self.min = min_value if self.min is None else min(self.min, min_value)
+        self.max = max_value if self.max is None else max(self.max, max_value)
+
+
+def _unhashable(values: pd.Series) -> bool:
+    return any(t.__hash__ is None for t in set(map(type, values.to_numpy())))
+
+
+def _to_python(value: Any) -> Any:
+    """Value of summary as json serializable one"""
+    if isinstance(value, np.generic):
+        return _to_python(value.item())
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (datetime.timedelta, decimal.Decimal)):
+        return str(value)
+    return value
+
+
+@dataclass
+class DatasetStats:
+    """Mergeable statistics of all columns of dataset"""
+
+    hll_precision: int = 12
+    sample_size: int = 2048
+    top_capacity: int = 1000
+    rows: int = 0
+    columns: Dict[str, ColumnStats] = field(default_factory=dict)
+
+    def update(
+        self, dataframe: pd.DataFrame, rng: np.random.Generator
+    ) -> "DatasetStats":
+        self.rows += len(dataframe)
+
+        for name in dataframe.columns:
+            self.__column(str(name)).update(dataframe[name], rng)
+
+        return self
+
+    def merge(self, other: "DatasetStats") -> "DatasetStats":
+        self.rows += other.rows
+
+        for name, stats in other.columns.items():
+            self.__column(name).merge(stats)
+
+        return self
+
+    def to_dict(self, quantiles: Sequence[float], top_k: int) -> Dict[str, Any]:
+        return {
+            "rows": self.rows,
+            "columns": {
+                name: stats.to_dict(quantiles, top_k)
+                for name, stats in self.columns.items()
+            },
+        }
+
+    def __column(self, name: str) -> ColumnStats:
+        if name not in self.columns:
+            self.columns[name] = ColumnStats(
+                hll_precision=self.hll_precision,
+                sample_size=self.sample_size,
+                top_capacity=self.top_capacity,
+            )
+        return self.columns[name]
@@ -1,16 +1,76 @@
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import pandas as pd
-from pandas_profiling import ProfileReport
 
 from odd_ml.profiler.profiler import Profiler
+from odd_ml.profiler.sampling import sample_dataframe
+from odd_ml.utils import instrumentation
+
+if TYPE_CHECKING:
+    from pandas_profiling import ProfileReport
 
 
 class PandasProfiler(Profiler):
+    """Profiler based on pandas-profiling
+
+    Dataframes larger than max_rows are profiled by random sample,
+    tables wider than minimal_columns are profiled in minimal mode
+    without correlations and interactions.
+
+    Args:
+        max_rows (int, optional): max number of profiled rows, None to profile all rows
+        stratify_by (str, optional): column whose value proportions are kept in sample
+        minimal_columns (int, optional): number of columns since which minimal mode used
+        random_state (int, optional): seed for reproducible samples
+    """
+
+    def __init__(
+        self,
+        max_rows: Optional[int] = 100_000,
+        stratify_by: Optional[str] = None,
+        minimal_columns: Optional[int] = 50,
+        random_state: Optional[int] = 42,
+    ) -> None:
+        self.__max_rows = max_rows
+        self.__stratify_by = stratify_by
+        self.__minimal_columns = minimal_columns
+        self.__random_state = random_state
+
     def profile_to_notebook(self, dataframe: pd.DataFrame) -> Any:
-        profile = ProfileReport(dataframe, title="Pandas Profiling Report")
-        return profile.to_notebook_iframe()
+        with instrumentation.timer("profiler.profile", profiler="pandas"):
+            profile = self.__report(dataframe)
+            return profile.to_notebook_iframe()
 
     def profile(self, dataframe: pd.DataFrame) -> Any:
-        profile = ProfileReport(dataframe, title="Pandas Profiling Report")
-        return profile.to_json()
+        with instrumentation.timer("profiler.profile", profiler="pandas"):
+            profile = self.__report(dataframe)
+            return profile.to_json()
+
+    def __report(self, dataframe: pd.DataFrame) -> "ProfileReport":
+        # pandas-profiling pulls in scipy, matplotlib and seaborn, so it is
+        # imported on first report
+        from pandas_profiling import ProfileReport
+
+        title = "Pandas Profiling Report"
+        sample = dataframe
+
+        if self.__max_rows is not None:
+            sample = sample_dataframe(
+                dataframe,
+                self.__max_rows,
+                stratify_by=self.__stratify_by,
+                random_state=self.__random_state,
+            )
+
+        if len(sample) < len(dataframe):
+            fraction = len(sample) / len(dataframe)
+            title += f" (sample of {len(sample):,} from {len(dataframe):,} rows, {fraction:.2%})"
+
+        instrumentation.count("profiler.rows", len(sample))
+
+        minimal = (
+            self.__minimal_columns is not None
+            and len(dataframe.columns) >= self.__minimal_columns
+        )
+
+        return ProfileReport(sample, title=title, minimal=minimal)
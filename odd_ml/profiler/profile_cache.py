@@ -0,0 +1,82 @@
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+class ProfileCache:
+    """On-disk cache of dataset profiles
+
+    Profiles are stored as json files keyed by data entity id and dataset version,
+    so changed dataset gets new key. Least recently used profiles are removed
+    when cache has more than max_entries profiles.
+
+    Example:
+        client = Client('http://localhost:8080', storage, profile_cache=ProfileCache())
+        client.get_profile(data_entity)
+
+    Args:
+        cache_dir (str): directory for cached profiles
+        max_entries (int): max number of stored profiles
+    """
+
+    def __init__(
+        self, cache_dir: str = "~/.cache/odd_ml/profiles", max_entries: int = 1000
+    ) -> None:
+        self.__dir = Path(cache_dir).expanduser()
+        self.__max_entries = max_entries
+        self.__lock = threading.Lock()
+
+        self.__dir.mkdir(parents=True, exist_ok=True)
+
+    def get(self, data_entity_id: int, version: str) -> Optional[Dict[str, Any]]:
+        path = self.__path(data_entity_id, version)
+
+        try:
+            with open(path) as file:
+                profile = json.load(file)
+        except FileNotFoundError:
+            return None
+
+        # modification time is used as last access time for eviction
+        os.utime(path)
+        return profile
+
+    def set(self, data_entity_id: int, version: str, profile: Dict[str, Any]) -> None:
+        path = self.__path(data_entity_id, version)
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+
+        try:
+            with open(tmp_path, "w") as file:
+                # values of custom profilers are stored as strings
+                json.dump(profile, file, default=str)
+
+            with self.__lock:
+                # older versions of the same dataset are not needed anymore
+                for old in self.__dir.glob(f"{data_entity_id}-*.json"):
+                    old.unlink(missing_ok=True)
+
+                os.replace(tmp_path, path)
+                self.__evict()
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    def clear(self) -> None:
+        with self.__lock:
+            for file in self.__dir.glob("*.json"):
+                file.unlink(missing_ok=True)
+
+    def __len__(self) -> int:
+        return len(list(self.__dir.glob("*.json")))
+
+    def __path(self, data_entity_id: int, version: str) -> Path:
+        return self.__dir / f"{data_entity_id}-{version}.json"
+
+    def __evict(self) -> None:
+        files = sorted(self.__dir.glob("*.json"), key=lambda f: f.stat().st_mtime)
+
+        for file in files[: max(len(files) - self.__max_entries, 0)]:
+            file.unlink(missing_ok=True)
@@ -1,13 +1,15 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class Profiler(ABC):
     @abstractmethod
-    def profile(self, dataframe: pd.DataFrame) -> None:
+    def profile(self, dataframe: "pd.DataFrame") -> None:
         raise NotImplementedError
 
     @abstractmethod
-    def profile_to_notebook(self, dataframe: pd.DataFrame) -> None:
+    def profile_to_notebook(self, dataframe: "pd.DataFrame") -> None:
         raise NotImplementedError
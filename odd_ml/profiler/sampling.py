@@ -0,0 +1,38 @@
+from typing import Optional
+
+import pandas as pd
+
+
+def sample_dataframe(
+    dataframe: pd.DataFrame,
+    max_rows: int,
+    stratify_by: Optional[str] = None,
+    random_state: Optional[int] = None,
+) -> pd.DataFrame:
+    """Random sample of at most max_rows rows
+
+    Args:
+        dataframe (pandas.DataFrame): data to sample
+        max_rows (int): max number of rows in sample
+        stratify_by (str, optional): column whose value proportions are kept in sample
+        random_state (int, optional): seed for reproducible samples
+
+    Returns:
+        pandas.DataFrame: dataframe itself if it is not larger than max_rows
+    """
+    if len(dataframe) <= max_rows:
+        return dataframe
+
+    if stratify_by is None:
+        return dataframe.sample(n=max_rows, random_state=random_state)
+
+    fraction = max_rows / len(dataframe)
+    sample = dataframe.groupby(stratify_by, dropna=False, group_keys=False).sample(
+        frac=fraction, random_state=random_state
+    )
+
+    # rounding in each stratum can overshoot the cap by a few rows
+    if len(sample) > max_rows:
+        sample = sample.sample(n=max_rows, random_state=random_state)
+
+    return sample
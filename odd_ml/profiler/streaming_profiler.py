@@ -0,0 +1,234 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from odd_ml.profiler.column_stats import ColumnStats, DatasetStats
+from odd_ml.profiler.profiler import Profiler
+from odd_ml.utils import instrumentation
+
+# name, dtype, offset and length of column buffer in shared memory
+BufferSpec = Tuple[str, str, int, int]
+
+
+def _profile_columns(
+    shm_name: Optional[str],
+    buffers: List[BufferSpec],
+    columns: Dict[str, pd.Series],
+    settings: Dict[str, int],
+    seed: int,
+) -> Dict[str, ColumnStats]:
+    """Compute statistics of columns group in worker process
+
+    Numeric columns are read from shared memory without copying,
+    other columns are passed pickled.
+    """
+    rng = np.random.default_rng(seed)
+    result = {
+        name: ColumnStats(**settings).update(column, rng)
+        for name, column in columns.items()
+    }
+
+    if shm_name is None:
+        return result
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        for name, dtype, offset, length in buffers:
+            values = np.ndarray(length, dtype=dtype, buffer=shm.buf, offset=offset)
+            result[name] = ColumnStats(**settings).update(pd.Series(values), rng)
+            del values
+    finally:
+        shm.close()
+
+    return result
+
+
+class StreamingProfiler(Profiler):
+    """Profiler computing per-column statistics in one pass over chunks
+
+    Statistics of chunks are mergeable, so dataset can be profiled chunk by chunk
+    from storage or by several workers whose partial results are merged.
+
+    Example:
+        profiler = StreamingProfiler()
+        summary = profiler.profile_chunks(client.iter_dataframe_chunks(entity))
+
+        # on workers
+        stats = profiler.partial(chunk)
+        # on coordinator
+        summary = profiler.summary(profiler.merge(stats_list))
+
+    With n_jobs > 1 columns of each chunk are profiled in parallel processes.
+    Buffers of numeric columns are passed through shared memory, so wide tables
+    are profiled faster with more CPU cores.
+
+    Args:
+        quantiles (list of float): quantiles estimated for numeric columns
+        top_k (int): number of most frequent values in summary
+        sample_size (int): size of sample used for quantiles estimation
+        hll_precision (int): HyperLogLog precision, relative error is ~1.04 / 2**(p/2)
+        random_state (int, optional): seed for reproducible quantiles estimation
+        n_jobs (int): number of processes profiling columns in parallel
+    """
+
+    def __init__(
+        self,
+        quantiles: Sequence[float] = (0.05, 0.25, 0.5, 0.75, 0.95),
+        top_k: int = 10,
+        sample_size: int = 2048,
+        hll_precision: int = 12,
+        random_state: Optional[int] = None,
+        n_jobs: int = 1,
+    ) -> None:
+        self.__quantiles = tuple(quantiles)
+        self.__top_k = top_k
+        self.__sample_size = sample_size
+        self.__hll_precision = hll_precision
+        self.__rng = np.random.default_rng(random_state)
+        self.__n_jobs = n_jobs
+        self.__executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self) -> None:
+        """Stop worker processes"""
+        if self.__executor is not None:
+            self.__executor.shutdown()
+            self.__executor = None
+
+    def profile(self, dataframe: pd.DataFrame) -> Dict[str, Any]:
+        return self.profile_chunks([dataframe])
+
+    def profile_to_notebook(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        return self.to_dataframe(self.profile(dataframe))
+
+    def profile_chunks(self, chunks: Iterable[pd.DataFrame]) -> Dict[str, Any]:
+        """Profile dataset by chunks, only one chunk is kept in memory"""
+        with instrumentation.timer("profiler.profile", profiler="streaming"):
+            stats = self.empty()
+
+            for chunk in chunks:
+                stats.merge(self.partial(chunk))
+
+            return self.summary(stats)
+
+    def empty(self) -> DatasetStats:
+        return DatasetStats(
+            hll_precision=self.__hll_precision,
+            sample_size=self.__sample_size,
+            top_capacity=max(self.__top_k * 100, 1000),
+        )
+
+    def partial(self, chunk: pd.DataFrame) -> DatasetStats:
+        """Statistics of one chunk which can be merged with others"""
+        instrumentation.count("profiler.rows", len(chunk))
+
+        with instrumentation.timer("profiler.partial", profiler="streaming"):
+            if self.__n_jobs <= 1 or len(chunk.columns) < 2:
+                return self.empty().update(chunk, self.__rng)
+
+            return self.__parallel_partial(chunk)
+
+    def __parallel_partial(self, chunk: pd.DataFrame) -> DatasetStats:
+        stats = self.empty()
+        settings = {
+            "hll_precision": stats.hll_precision,
+            "sample_size": stats.sample_size,
+            "top_capacity": stats.top_capacity,
+        }
+
+        columns = {str(name): chunk[name] for name in chunk.columns}
+        # columns of extension dtypes, e.g. categorical of ints, are pickled
+        # to be profiled the same way as in one process
+        shared = {
+            name: column.to_numpy()
+            for name, column in columns.items()
+            if isinstance(column.dtype, np.dtype) and column.dtype.kind in "biufmM"
+        }
+        total_bytes = sum(values.nbytes for values in shared.values())
+
+        shm = shared_memory.SharedMemory(create=True, size=max(total_bytes, 1))
+        try:
+            specs: Dict[str, BufferSpec] = {}
+            offset = 0
+            for name, values in shared.items():
+                target = np.ndarray(
+                    len(values), dtype=values.dtype, buffer=shm.buf, offset=offset
+                )
+                target[:] = values
+                del target
+                specs[name] = (name, values.dtype.str, offset, len(values))
+                offset += values.nbytes
+
+            futures = [
+                self.__get_executor().submit(
+                    _profile_columns,
+                    shm.name if any(name in specs for name in group) else None,
+                    [specs[name] for name in group if name in specs],
+                    {name: columns[name] for name in group if name not in specs},
+                    settings,
+                    int(self.__rng.integers(2**32)),
+                )
+                for group in self.__split_columns(columns)
+            ]
+
+            results: Dict[str, ColumnStats] = {}
+            for future in futures:
+                results.update(future.result())
+        finally:
+            shm.close()
+            shm.unlink()
+
+        stats.rows = len(chunk)
+        stats.columns = {name: results[name] for name in columns}
+        return stats
+
+    def __split_columns(self, columns: Dict[str, pd.Series]) -> List[List[str]]:
+        """Split columns into groups of close size, largest columns first"""
+        groups: List[List[str]] = [[] for _ in range(self.__n_jobs)]
+        sizes = [0] * self.__n_jobs
+
+        by_size = sorted(
+            columns, key=lambda n: columns[n].memory_usage(deep=False), reverse=True
+        )
+        for name in by_size:
+            smallest = sizes.index(min(sizes))
+            groups[smallest].append(name)
+            sizes[smallest] += columns[name].memory_usage(deep=False)
+
+        return [group for group in groups if group]
+
+    def __get_executor(self) -> ProcessPoolExecutor:
+        if self.__executor is None:
+            self.__executor = ProcessPoolExecutor(max_workers=self.__n_jobs)
+        return self.__executor
+
+    def merge(self, stats: Iterable[DatasetStats]) -> DatasetStats:
+        result = self.empty()
+
+        for s in stats:
+            result.merge(s)
+
+        return result
+
+    def summary(self, stats: DatasetStats) -> Dict[str, Any]:
+        return stats.to_dict(self.__quantiles, self.__top_k)
+
+    @staticmethod
+    def to_dataframe(summary: Dict[str, Any]) -> pd.DataFrame:
+        """Summary as table with one row per column"""
+        rows = []
+        for name, column in summary["columns"].items():
+            row = {k: v for k, v in column.items() if k not in ("quantiles", "top")}
+            row.update({f"q{q}": v for q, v in column.get("quantiles", {}).items()})
+            row["top"] = ", ".join(f"{v} ({c})" for v, c in column["top"][:3])
+            rows.append(row)
+
+        return pd.DataFrame(rows, index=list(summary["columns"]))
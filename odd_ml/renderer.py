@@ -1,8 +1,3 @@
-from functools import partial
-
-from IPython.display import IFrame
-
-
 class IFrameRenderer:
     """
     Renders ODD UI to JupiterNotebook through IFrame.
@@ -20,7 +15,8 @@ class IFrameRenderer:
             height (int, optional): IFrame height. Defaults to 768.
         """
         self.__url = f"{platform_url}/embedded"
-        self.__draw = partial(IFrame, width=width, height=height)
+        self.__width = width
+        self.__height = height
 
     def show_overview(self, data_entity_id: int):
         """Show overview page for DataEntity
@@ -72,3 +68,9 @@ class IFrameRenderer:
             IFrame: html markup for overview page
         """
         return self.__draw(src=f"{self.__url}/search/{search_id}")
+
+    def __draw(self, src: str):
+        # IPython is imported on first render, it is not needed outside notebooks
+        from IPython.display import IFrame
+
+        return IFrame(src=src, width=self.__width, height=self.__height)
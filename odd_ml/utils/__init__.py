@@ -1,2 +1,4 @@
 from odd_ml.utils.datetime_to_str import datetime_to_str
+from odd_ml.utils.instrumentation import Event, Instrumentation, instrumentation
 from odd_ml.utils.log import log
+from odd_ml.utils.ttl_cache import TtlCache
@@ -0,0 +1,148 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+
+@dataclass
+class Event:
+    """One measurement passed to hooks
+
+    Attributes:
+        name (str): metric name, i.e. "http.request"
+        value (float): seconds for timings, increment for counters
+        kind (str): "timing" or "count"
+        tags (dict): details of measurement, i.e. url or file uri
+    """
+
+    name: str
+    value: float
+    kind: str
+    tags: Dict[str, Any] = field(default_factory=dict)
+
+
+Hook = Callable[[Event], None]
+
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    def __init__(self, instrumentation: "Instrumentation", name: str, tags) -> None:
+        self.__instrumentation = instrumentation
+        self.__name = name
+        self.__tags = tags
+
+    def __enter__(self):
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        duration = time.perf_counter() - self.__start
+        self.__instrumentation.record(self.__name, duration, "timing", self.__tags)
+        return False
+
+
+class Instrumentation:
+    """Registry of timings and counters of odd-ml operations
+
+    Disabled by default, when disabled timers and counters return immediately.
+    Hooks get each measurement, i.e. to export it to metrics or tracing system.
+
+    Example:
+        from odd_ml.utils import instrumentation
+
+        instrumentation.enable()
+        instrumentation.add_hook(lambda event: statsd.timing(event.name, event.value))
+        ...
+        client.stats()
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.__lock = threading.Lock()
+        self.__counters: Dict[str, float] = {}
+        self.__timings: Dict[str, List[float]] = {}
+        self.__hooks: List[Hook] = []
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def add_hook(self, hook: Hook) -> None:
+        self.__hooks.append(hook)
+
+    def remove_hook(self, hook: Hook) -> None:
+        self.__hooks.remove(hook)
+
+    def timer(self, name: str, **tags):
+        """Context manager measuring duration of the block"""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, tags)
+
+    def count(self, name: str, value: float = 1, **tags) -> None:
+        if self.enabled:
+            self.record(name, value, "count", tags)
+
+    def record(
+        self, name: str, value: float, kind: str, tags: Optional[Dict] = None
+    ) -> None:
+        with self.__lock:
+            if kind == "timing":
+                # [calls, total, min, max]
+                timing = self.__timings.get(name)
+                if timing is None:
+                    self.__timings[name] = [1, value, value, value]
+                else:
+                    timing[0] += 1
+                    timing[1] += value
+                    timing[2] = min(timing[2], value)
+                    timing[3] = max(timing[3], value)
+            else:
+                self.__counters[name] = self.__counters.get(name, 0) + value
+
+        if self.__hooks:
+            event = Event(name, value, kind, tags or {})
+            for hook in list(self.__hooks):
+                hook(event)
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters and timing summaries recorded since last reset
+
+        Returns:
+            dict: {"counters": {name: value}, "timings": {name: {"calls", "total",
+                "mean", "min", "max"}}}, durations in seconds
+        """
+        with self.__lock:
+            return {
+                "counters": dict(self.__counters),
+                "timings": {
+                    name: {
+                        "calls": calls,
+                        "total": total,
+                        "mean": total / calls,
+                        "min": min_,
+                        "max": max_,
+                    }
+                    for name, (calls, total, min_, max_) in self.__timings.items()
+                },
+            }
+
+    def reset(self) -> None:
+        with self.__lock:
+            self.__counters = {}
+            self.__timings = {}
+
+
+instrumentation = Instrumentation()
@@ -0,0 +1,47 @@
+import threading
+import time
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TtlCache(Generic[V]):
+    """Thread safe in-memory cache which forgets values after ttl seconds
+
+    Args:
+        ttl (float): time to live of each value in seconds
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.__ttl = ttl
+        self.__items: Dict[Hashable, Tuple[float, V]] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        with self.__lock:
+            item = self.__items.get(key)
+
+            if item is None:
+                return None
+
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self.__items[key]
+                return None
+
+            return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        with self.__lock:
+            self.__items[key] = (time.monotonic() + self.__ttl, value)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self.__lock:
+            self.__items.pop(key, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__items.clear()
+
+    def __len__(self) -> int:
+        return len(self.__items)
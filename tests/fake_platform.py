@@ -0,0 +1,97 @@
+import json
+from typing import Callable, Dict, List, Tuple
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+Handler = Callable[[PreparedRequest], tuple]
+
+
+class FakePlatformAdapter(BaseAdapter):
+    """Transport adapter answering requests with registered handlers"""
+
+    def __init__(self, routes: Dict[Tuple[str, str], Handler]) -> None:
+        super().__init__()
+        self.routes = routes
+        self.requests: List[PreparedRequest] = []
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        self.requests.append(request)
+        path = request.path_url.split("?")[0]
+
+        for (method, prefix), handler in self.routes.items():
+            if request.method == method and path.startswith(prefix):
+                status, body, *headers = handler(request)
+                break
+        else:
+            status, body, headers = 404, {}, []
+
+        response = Response()
+        response.status_code = status
+        response._content = json.dumps(body).encode()
+        response.url = request.url
+        response.request = request
+        response.headers.update(*headers)
+        return response
+
+    def close(self) -> None:
+        pass
+
+    def count(self, method: str) -> int:
+        return sum(1 for r in self.requests if r.method == method)
+
+
+def data_source(id: int = 1) -> dict:
+    return {"id": id, "oddrn": f"//ds/{id}", "name": f"ds_{id}", "active": True}
+
+
+def search_item(id: int) -> dict:
+    return {
+        "id": id,
+        "oddrn": f"//entity/{id}",
+        "external_name": f"entity_{id}",
+        "entity_classes": [{"id": 1, "name": "DATA_SET"}],
+        "data_source": data_source(),
+    }
+
+
+def data_entity(id: int) -> dict:
+    return {
+        "id": id,
+        "oddrn": f"//entity/{id}",
+        "external_name": f"entity_{id}",
+        "data_source": data_source(),
+        "entity_classes": [],
+        "type": {"id": 1, "name": "TABLE"},
+        "tags": [],
+        "metadata_field_values": [],
+    }
+
+
+def dataset_field(id: int, name: str, type: str, logical_type: str, **extra) -> dict:
+    return {
+        "id": id,
+        "name": name,
+        "type": {"type": type, "logical_type": logical_type, "is_nullable": True},
+        **extra,
+    }
+
+
+def dataset_structure(version: int = 1) -> dict:
+    return {
+        "dataset_version": {"id": version, "dataset_id": 7, "version": version},
+        "field_list": [
+            dataset_field(1, "zip", "TYPE_STRING", "varchar(5)"),
+            dataset_field(
+                2,
+                "country",
+                "TYPE_STRING",
+                "varchar",
+                stats={"string_stats": {"unique_count": 2}},
+            ),
+            dataset_field(3, "age", "TYPE_INTEGER", "smallint"),
+            dataset_field(4, "created", "TYPE_DATETIME", "timestamp"),
+            dataset_field(5, "address", "TYPE_STRUCT", "struct"),
+            dataset_field(6, "city", "TYPE_STRING", "varchar", parent_field_id=5),
+        ],
+    }
@@ -0,0 +1,21 @@
+from typing import Optional
+
+import pandas as pd
+
+from odd_ml.dataset_storage.dataset_storage import DatasetStorage
+
+
+class FakeStorage(DatasetStorage):
+    def __init__(self, version: Optional[str] = "v1") -> None:
+        self.version = version
+        self.reads = 0
+
+    def get_dataframe(self, data_entity, partition_filter=None, **kwargs):
+        self.reads += 1
+        return pd.DataFrame({"a": range(10), "b": [str(i) for i in range(10)]})
+
+    def iter_dataframe_chunks(self, data_entity, chunksize=100_000, **kwargs):
+        yield self.get_dataframe(data_entity)
+
+    def get_version(self, data_entity, partition_filter=None, filters=None):
+        return self.version
@@ -0,0 +1,66 @@
+from odd_ml.helpers.asci_renderer import MAX_HTML_ROWS, show_table
+
+
+def counted_rows(count: int, consumed: list):
+    for i in range(count):
+        consumed.append(i)
+        yield [i, f"name_{i}"]
+
+
+def test_only_rows_of_page_are_consumed(capsys):
+    consumed = []
+
+    show_table(["Id", "Name"], counted_rows(10_000, consumed), page=3, page_size=10)
+
+    output = capsys.readouterr().out
+    # rows of page and one row to know there are more
+    assert consumed == list(range(31))
+    assert "name_20" in output and "name_29" in output
+    assert "name_19" not in output and "name_30" not in output
+    assert "Rows 21-30, next page=4" in output
+
+
+def test_footer_with_total_and_small_tables(capsys):
+    show_table(["Id"], [[i] for i in range(25)], page=3, page_size=10)
+    assert "Rows 21-25 of 25" in capsys.readouterr().out
+
+    show_table(["Id"], [[1], [2]])
+    assert "Rows" not in capsys.readouterr().out
+
+    # tables without paging arguments are not paged
+    show_table(["Id"], ([i] for i in range(100)))
+    output = capsys.readouterr().out
+    assert "| 99 " in output and "Rows" not in output
+
+
+def test_offset_of_lazy_source(capsys):
+    consumed = []
+
+    show_table(
+        ["Id", "Name"], counted_rows(100, consumed), page=3, page_size=10, offset=20
+    )
+
+    assert consumed == list(range(11))
+    assert "Rows 21-30" in capsys.readouterr().out
+
+
+def test_html_table_is_escaped_and_paged_in_browser(monkeypatch):
+    from IPython import display
+
+    shown = []
+    monkeypatch.setattr(display, "display", shown.append)
+
+    show_table(
+        ["Id", "Name"],
+        ([i, "<b>"] for i in range(MAX_HTML_ROWS * 2)),
+        title="Items",
+        page_size=20,
+        as_html=True,
+    )
+
+    markup = shown[0].data
+    assert markup.count("<tr") == MAX_HTML_ROWS + 1
+    assert markup.count("display:none") == MAX_HTML_ROWS - 20
+    assert "&lt;b&gt;" in markup and "<b>" not in markup
+    assert "<caption>Items</caption>" in markup
+    assert f"more than {MAX_HTML_ROWS} rows" in markup
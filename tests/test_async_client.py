@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+
+from tests.fake_platform import data_entity
+
+web = pytest.importorskip("aiohttp.web")
+
+from odd_ml.async_client import AsyncClient  # noqa: E402
+
+
+async def fetch_concurrently(ids, max_concurrency):
+    in_flight, peak = 0, 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return web.json_response(data_entity(int(request.match_info["id"])))
+
+    app = web.Application()
+    app.router.add_get("/api/dataentities/{id}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    try:
+        async with AsyncClient(
+            f"http://127.0.0.1:{port}", max_concurrency=max_concurrency
+        ) as client:
+            entities = await asyncio.gather(
+                *(client.get_data_entity_by_id(id) for id in ids)
+            )
+    finally:
+        await runner.cleanup()
+
+    return entities, peak
+
+
+def test_fetches_entities_concurrently_within_limit():
+    ids = list(range(20))
+    entities, peak = asyncio.run(fetch_concurrently(ids, max_concurrency=5))
+
+    assert [e.id for e in entities] == ids
+    assert 1 < peak <= 5
@@ -0,0 +1,94 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+from odd_ml.dataset_storage.cached_storage import CachedStorage
+from tests.fake_storage import FakeStorage
+
+entity = SimpleNamespace(oddrn="//s3/buckets/bucket/keys/file.csv")
+
+
+def test_reads_unchanged_dataset_from_cache(tmp_path):
+    fake = FakeStorage()
+    storage = CachedStorage(fake, cache_dir=str(tmp_path))
+
+    first = storage.get_dataframe(entity)
+    second = storage.get_dataframe(entity)
+
+    pd.testing.assert_frame_equal(first, second)
+    assert fake.reads == 1
+    assert storage.stats()["hits"] == 1
+
+
+def test_reads_again_when_version_changed(tmp_path):
+    fake = FakeStorage()
+    storage = CachedStorage(fake, cache_dir=str(tmp_path))
+
+    storage.get_dataframe(entity)
+    fake.version = "v2"
+    storage.get_dataframe(entity)
+
+    assert fake.reads == 2
+
+
+def test_not_cached_without_version(tmp_path):
+    fake = FakeStorage(version=None)
+    storage = CachedStorage(fake, cache_dir=str(tmp_path))
+
+    storage.get_dataframe(entity)
+    storage.get_dataframe(entity)
+
+    assert fake.reads == 2
+    assert storage.stats()["entries"] == 0
+
+
+def test_evicts_least_recently_used(tmp_path):
+    first, second, third = (
+        SimpleNamespace(oddrn=f"//s3/buckets/bucket/keys/{name}.csv")
+        for name in ("first", "second", "third")
+    )
+    sizing = CachedStorage(FakeStorage(), cache_dir=str(tmp_path / "sizing"))
+    sizing.get_dataframe(first)
+    entry_bytes = sizing.stats()["bytes"]
+
+    fake = FakeStorage()
+    storage = CachedStorage(
+        fake, cache_dir=str(tmp_path / "cache"), max_bytes=entry_bytes * 5 // 2
+    )
+    storage.get_dataframe(first)
+    storage.get_dataframe(second)
+    storage.get_dataframe(first)
+    storage.get_dataframe(third)
+    reads = fake.reads
+
+    storage.get_dataframe(first)
+    storage.get_dataframe(third)
+    assert storage.stats()["entries"] == 2
+    assert fake.reads == reads
+
+    storage.get_dataframe(second)
+    assert fake.reads == reads + 1
+
+
+def test_chunks_from_cache(tmp_path):
+    fake = FakeStorage()
+    storage = CachedStorage(fake, cache_dir=str(tmp_path))
+
+    storage.get_dataframe(entity)
+    chunks = list(storage.iter_dataframe_chunks(entity, chunksize=4))
+
+    assert [len(c) for c in chunks] == [4, 4, 2]
+    assert fake.reads == 1
+
+
+def test_tables_cached_apart_from_dataframes(tmp_path):
+    fake = FakeStorage()
+    storage = CachedStorage(fake, cache_dir=str(tmp_path))
+
+    storage.get_dataframe(entity)
+    first = storage.get_table(entity)
+    second = storage.get_table(entity)
+
+    assert first.equals(second)
+    assert fake.reads == 2
+    assert storage.stats()["entries"] == 2
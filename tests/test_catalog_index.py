@@ -0,0 +1,58 @@
+import time
+
+from odd_ml.catalog import CatalogIndex
+from odd_ml.catalog.catalog_index import record_from_item, tokenize
+from tests.fake_platform import search_item
+
+
+def record(id: int, name: str, tags=(), data_source_id=1, updated_at="t1") -> dict:
+    item = {**search_item(id), "external_name": name, "updated_at": updated_at}
+    item["data_source"]["id"] = data_source_id
+    return record_from_item(item, list(tags))
+
+
+def test_tokenize_splits_names():
+    assert tokenize("Sales.daily_Orders-v2") == ["sales", "daily", "orders", "v2"]
+
+
+def test_search_by_prefix_and_filters():
+    index = CatalogIndex(path=None)
+    index.update(
+        [
+            record(1, "daily_orders", tags=["Finance"]),
+            record(2, "orders_archive", data_source_id=2),
+            record(3, "customers", tags=["finance"]),
+        ]
+    )
+
+    assert [e.id for e in index.search("ord")] == [1, 2]
+    assert [e.id for e in index.search("ord da")] == [1]
+    assert [e.id for e in index.search(tag="finance")] == [1, 3]
+    assert [e.id for e in index.search("ord", data_source_id=2)] == [2]
+    assert [e.id for e in index.search(entity_class="data_set", limit=2)] == [1, 2]
+    assert index.get_by_oddrn("//entity/3").name == "customers"
+    assert index.search("missing") == []
+
+
+def test_update_replaces_and_removes_entries():
+    index = CatalogIndex(path=None)
+    index.update([record(1, "orders"), record(2, "customers")])
+
+    index.update([record(1, "payments", updated_at="t2")], present_ids=[1])
+
+    assert index.search("orders") == []
+    assert [e.id for e in index.search("pay")] == [1]
+    assert index.updated_at(1) == "t2"
+    assert len(index) == 1
+
+
+def test_index_is_persisted(tmp_path):
+    path = str(tmp_path / "catalog.json")
+    CatalogIndex(path).update([record(1, "orders", tags=["finance"])], {1: "ds_1"})
+
+    index = CatalogIndex(path, max_age=60)
+
+    assert [e.id for e in index.search("orders", tag="finance")] == [1]
+    assert index.data_sources == {1: "ds_1"}
+    assert not index.is_stale
+    assert CatalogIndex(path, max_age=0).synced_at <= time.time()
@@ -0,0 +1,243 @@
+from types import SimpleNamespace
+
+from odd_ml.catalog import CatalogIndex
+from odd_ml.client import Client
+from odd_ml.dataset_storage.fsspec_storage import FsspecStorage
+from odd_ml.domain import DataEntity
+from odd_ml.http.http_client import SearchConfig
+from odd_ml.profiler import ProfileCache
+from tests.fake_platform import (
+    FakePlatformAdapter,
+    data_entity,
+    data_source,
+    dataset_structure,
+    search_item,
+)
+from tests.fake_storage import FakeStorage
+
+
+def fake_client(routes) -> Client:
+    client = Client("http://platform")
+    adapter = FakePlatformAdapter(routes)
+    client._Client__http._HttpClient__session.mount("http://", adapter)
+    return client
+
+
+def get_entity(request):
+    id = int(request.path_url.rsplit("/", 1)[1])
+    if id == 404:
+        return 404, {}
+    return 200, data_entity(id)
+
+
+def test_get_data_entities_by_ids_keeps_order_and_errors():
+    client = fake_client({("GET", "/api/dataentities/"): get_entity})
+
+    result = client.get_data_entities_by_ids([3, 1, 404, 3, 2], max_workers=4)
+
+    assert list(result.keys()) == [3, 1, 404, 2]
+    assert all(isinstance(result[id], DataEntity) for id in (3, 1, 2))
+    assert isinstance(result[404], Exception)
+
+
+def test_get_profile_from_cache_while_dataset_not_changed(tmp_path):
+    storage = FakeStorage()
+    client = Client(
+        "http://platform", storage, profile_cache=ProfileCache(str(tmp_path))
+    )
+    entity = SimpleNamespace(id=1, oddrn="//s3/buckets/bucket/keys/file.csv")
+
+    first = client.get_profile(entity)
+    second = client.get_profile(entity)
+    storage.version = "v2"
+    client.get_profile(entity)
+
+    assert first == second
+    assert first["rows"] == 10
+    assert storage.reads == 2
+
+
+def test_get_profile_by_content_fingerprint(tmp_path):
+    storage = FakeStorage(version=None)
+    client = Client(
+        "http://platform", storage, profile_cache=ProfileCache(str(tmp_path))
+    )
+    entity = SimpleNamespace(id=1, oddrn="//s3/buckets/bucket/keys/file.csv")
+
+    client.get_profile(entity)
+    client.get_profile(entity)
+
+    # fingerprint is computed on each call, profiling only on first one
+    assert storage.reads == 3
+
+
+# 1 -> 2 -> 3 -> 4, 5 -> 3
+LINEAGE = {1: [], 2: [1], 3: [2, 5], 4: [3], 5: []}
+
+
+def relative(id: int) -> dict:
+    return {"id": id, "entity_classes": [], "external_name": f"entity_{id}"}
+
+
+def get_lineage_entity(request):
+    id = int(request.path_url.rsplit("/", 1)[1])
+    targets = [t for t, sources in LINEAGE.items() if id in sources]
+    return 200, {
+        **data_entity(id),
+        "source_list": [relative(s) for s in LINEAGE[id]],
+        "target_list": [relative(t) for t in targets],
+    }
+
+
+def test_get_lineage_expands_hops_and_fetches_each_entity_once():
+    client = fake_client({("GET", "/api/dataentities/"): get_lineage_entity})
+    adapter = client._Client__http._HttpClient__session.get_adapter("http://")
+
+    graph = client.get_lineage(3, depth=2, direction="both")
+
+    assert set(graph.nodes) == {1, 2, 3, 4, 5}
+    assert adapter.count("GET") == 5
+    assert graph.upstream() == {1, 2, 5}
+    assert graph.upstream(depth=1) == {2, 5}
+    assert graph.downstream() == {4}
+    assert graph.downstream(1) == {2, 3, 4}
+
+
+def test_get_lineage_in_one_direction():
+    client = fake_client({("GET", "/api/dataentities/"): get_lineage_entity})
+
+    graph = client.get_lineage(2, depth=5, direction="downstream")
+
+    assert set(graph.nodes) == {2, 3, 4}
+    assert sorted(graph.edges) == [(2, 3), (3, 4)]
+    assert graph.upstream() == set()
+
+
+def test_sync_catalog_reindexes_only_changed_entities():
+    items = {1: "t1", 2: "t1"}
+
+    def search_results(request):
+        page = [
+            {**search_item(id), "updated_at": updated_at}
+            for id, updated_at in items.items()
+        ]
+        return 200, {"items": page}
+
+    def get_tagged_entity(request):
+        id = int(request.path_url.rsplit("/", 1)[1])
+        return 200, {**data_entity(id), "tags": [{"id": 1, "name": f"tag_{id}"}]}
+
+    client = Client("http://platform", catalog=CatalogIndex(path=None, max_age=0))
+    adapter = FakePlatformAdapter(
+        {
+            ("POST", "/api/search"): lambda r: (200, {"search_id": "abc"}),
+            ("GET", "/api/search/"): search_results,
+            ("GET", "/api/dataentities/"): get_tagged_entity,
+            ("GET", "/api/datasources"): lambda r: (200, {"items": [data_source()]}),
+        }
+    )
+    client._Client__http._HttpClient__session.mount("http://", adapter)
+
+    assert client.sync_catalog(with_tags=True) == 2
+
+    items[2] = "t2"
+    items[3] = "t1"
+    del items[1]
+
+    assert client.sync_catalog(with_tags=True) == 2
+    assert [e.id for e in client.find_data_entities(tag="tag_2")] == [2]
+    assert [e.id for e in client.find_data_entities("entity")] == [2, 3]
+
+
+def test_get_dataframe_with_dataset_structure(tmp_path):
+    (tmp_path / "users.csv").write_text("zip,country,age\n01234,UA,30\n02000,PL,\n")
+    client = fake_client(
+        {
+            ("GET", "/api/datasets/7/structure/latest"): lambda r: (
+                200,
+                dataset_structure(),
+            )
+        }
+    )
+    client.storage = FsspecStorage()
+    entity = SimpleNamespace(
+        id=7,
+        oddrn=f"//local/host/nas/path/{str(tmp_path / 'users.csv').replace('/', ':')}",
+        entity_class_names=["DATA_SET"],
+    )
+
+    inferred = client.get_dataframe(entity)
+    typed = client.get_dataframe(entity, use_structure=True)
+
+    assert inferred["zip"].tolist() == [1234, 2000]
+    assert typed["zip"].tolist() == ["01234", "02000"]
+    assert typed.dtypes.astype(str).to_dict() == {
+        "zip": "object",
+        "country": "category",
+        "age": "Int16",
+    }
+
+
+def test_show_data_entities_requests_only_pages_of_shown_rows(capsys):
+    pages = []
+
+    def search_results(request):
+        query = dict(p.split("=") for p in request.path_url.split("?")[1].split("&"))
+        page, size = int(query["page"]), int(query["size"])
+        pages.append(page)
+        ids = range((page - 1) * size + 1, page * size + 1)
+        return 200, {
+            "items": [search_item(i) for i in ids],
+            "page_info": {"total": 10_000, "has_next": True},
+        }
+
+    client = fake_client(
+        {
+            ("POST", "/api/search"): lambda r: (200, {"search_id": "abc"}),
+            ("GET", "/api/search/"): search_results,
+        }
+    )
+
+    client.show_data_entities(SearchConfig(size=100), page=5, page_size=30)
+
+    output = capsys.readouterr().out
+    # rows 121-150 are on the second search page, the next one is prefetched
+    assert pages[0] == 2 and len(pages) <= 2
+    assert "entity_121" in output and "entity_150" in output
+    assert "entity_120" not in output and "entity_151" not in output
+    assert "Rows 121-150, next page=6" in output
+
+
+def test_sync_catalog_retries_tags_of_failed_entities():
+    failing = {2}
+
+    def get_tagged_entity(request):
+        id = int(request.path_url.rsplit("/", 1)[1])
+        if id in failing:
+            return 500, {}
+        return 200, {**data_entity(id), "tags": [{"id": 1, "name": f"tag_{id}"}]}
+
+    catalog = CatalogIndex(path=None)
+    client = Client("http://platform", catalog=catalog)
+    adapter = FakePlatformAdapter(
+        {
+            ("POST", "/api/search"): lambda r: (200, {"search_id": "abc"}),
+            ("GET", "/api/search/"): lambda r: (
+                200,
+                {"items": [{**search_item(id), "updated_at": "t1"} for id in (1, 2)]},
+            ),
+            ("GET", "/api/dataentities/"): get_tagged_entity,
+            ("GET", "/api/datasources"): lambda r: (200, {"items": [data_source()]}),
+        }
+    )
+    client._Client__http._HttpClient__session.mount("http://", adapter)
+
+    assert client.sync_catalog(with_tags=True) == 2
+    assert [e.id for e in catalog.search("entity")] == [1, 2]
+    assert catalog.search(tag="tag_2") == []
+
+    failing.clear()
+
+    assert client.sync_catalog(with_tags=True) == 1
+    assert [e.id for e in catalog.search(tag="tag_2")] == [2]
+    assert client.sync_catalog(with_tags=True) == 0
@@ -0,0 +1,75 @@
+import datetime
+
+import pandas as pd
+
+from odd_ml.helpers import (
+    bind_partitions,
+    filter_dataframe,
+    filter_table,
+    match_partitions,
+)
+
+df = pd.DataFrame({"a": [1, 2, 3, 4], "b": ["x", "y", "x", "z"]})
+
+
+def test_conjunction():
+    result = filter_dataframe(df, [("a", ">", 1), ("b", "==", "x")])
+    assert result["a"].tolist() == [3]
+
+
+def test_disjunction():
+    result = filter_dataframe(df, [[("a", "==", 1)], [("b", "in", ["z"])]])
+    assert result["a"].tolist() == [1, 4]
+
+
+def test_not_in():
+    result = filter_dataframe(df, [("b", "not in", {"x", "y"})])
+    assert result["a"].tolist() == [4]
+
+
+def test_no_filters():
+    assert filter_dataframe(df, None) is df
+
+
+def test_partition_values_are_cast_to_filter_type():
+    assert match_partitions({"year": "2022"}, [("year", ">=", 2021)])
+    assert not match_partitions({"year": "2020"}, [("year", ">=", 2021)])
+    assert match_partitions({"year": "2020"}, [("a", ">", 1)])
+
+
+def test_boolean_partition_values():
+    filters = [("flag", "==", False)]
+
+    assert match_partitions({"flag": "false"}, filters)
+    assert match_partitions({"flag": "0"}, filters)
+    assert not match_partitions({"flag": "true"}, filters)
+    assert not match_partitions({"flag": "True"}, filters)
+
+
+def test_date_and_datetime_partition_values():
+    day = [("day", ">=", datetime.date(2022, 1, 2))]
+    hour = [("hour", "<", datetime.datetime(2022, 1, 1, 12))]
+    utc = [("hour", "==", pd.Timestamp("2022-01-01 10:00", tz="UTC"))]
+
+    assert match_partitions({"day": "2022-01-02"}, day)
+    assert not match_partitions({"day": "2022-01-01"}, day)
+    assert match_partitions({"hour": "2022-01-01 10%3A00%3A00"}, hour)
+    assert not match_partitions({"hour": "2022-01-01 12:00:00"}, hour)
+    assert match_partitions({"hour": "2022-01-01 10:00:00"}, utc)
+
+
+def test_bind_partitions_leaves_file_predicates():
+    filters = [[("year", "==", 2022), ("a", ">", 1)], [("year", "==", 2021)]]
+
+    assert bind_partitions(filters, {"year": "2022"}) == [[("a", ">", 1)]]
+    assert bind_partitions(filters, {"year": "2021"}) is None
+    assert bind_partitions(filters, {"year": "2020"}) == []
+
+
+def test_filter_table_matches_dataframe():
+    import pyarrow as pa
+
+    filters = [[("a", ">", 2)], [("b", "not in", ["x", "z"])]]
+    result = filter_table(pa.Table.from_pandas(df), filters)
+
+    assert result.column("a").to_pylist() == filter_dataframe(df, filters)["a"].tolist()
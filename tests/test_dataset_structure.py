@@ -0,0 +1,81 @@
+import pandas as pd
+
+from odd_ml.domain import DatasetStructure
+from odd_ml.helpers.column_types import ColumnTypes, field_dtype
+from odd_ml.helpers.fast_parse import parse_model
+from tests.fake_platform import dataset_structure
+
+CSV = "zip,country,age,created\n01234,UA,30,2022-01-02\n99999,PL,,2022-03-04\n"
+
+
+def test_field_dtypes():
+    assert field_dtype("TYPE_INTEGER", "INT(11) UNSIGNED") == "UInt32"
+    assert field_dtype("TYPE_INTEGER", "tinyint", nullable=False) == "int8"
+    assert field_dtype("TYPE_INTEGER", None) == "Int64"
+    assert field_dtype("TYPE_NUMBER", "real") == "float32"
+    assert field_dtype("TYPE_STRING", "enum", enum_value_count=3) == "category"
+    assert field_dtype("TYPE_STRING", "text", unique_count=10**6) == "object"
+    assert field_dtype("TYPE_MAP", "map") is None
+
+
+def test_column_types_of_top_level_fields():
+    structure = DatasetStructure.parse_obj(dataset_structure())
+
+    column_types = structure.column_types()
+
+    assert column_types.dtypes == {
+        "zip": "object",
+        "country": "category",
+        "age": "Int16",
+    }
+    assert column_types.dates == ["created"]
+    assert parse_model(DatasetStructure, structure.json(), validate=False) == structure
+
+
+def test_read_csv_with_column_types(tmp_path):
+    from odd_ml.dataset_storage.file_formats import FILE_FORMATS
+
+    (tmp_path / "users.csv").write_text(CSV)
+    column_types = DatasetStructure.parse_obj(dataset_structure()).column_types()
+
+    df = FILE_FORMATS["csv"].to_dataframe(
+        str(tmp_path / "users.csv"), None, None, column_types
+    )
+    chunks = list(
+        FILE_FORMATS["csv"].chunks(
+            str(tmp_path / "users.csv"), ["age"], None, 1, column_types
+        )
+    )
+
+    assert df["zip"].tolist() == ["01234", "99999"]
+    assert df["country"].dtype == "category"
+    assert df["age"].dtype == pd.Int16Dtype()
+    assert df["created"].dtype == "datetime64[ns]"
+    assert [c["age"].dtype for c in chunks] == [pd.Int16Dtype()] * 2
+
+
+def test_columns_missing_in_file_are_skipped():
+    df = pd.DataFrame({"a": ["2022-01-01"], "n": [1.0]})
+    column_types = ColumnTypes(dtypes={"n": "Int8", "m": "Int8"}, dates=["a", "b"])
+
+    result = column_types.convert(df)
+
+    assert column_types.parser_dtypes == {}
+    assert list(result.columns) == ["a", "n"]
+    assert result.dtypes.astype(str).to_dict() == {"a": "datetime64[ns]", "n": "Int8"}
+
+
+def test_64_bit_integers_next_to_nulls_are_read_exactly(tmp_path):
+    from odd_ml.dataset_storage.file_formats import FILE_FORMATS
+
+    path = tmp_path / "ids.csv"
+    path.write_text("id,uid\n9007199254740993,18446744073709551615\n,\n-1,1\n")
+    column_types = ColumnTypes(dtypes={"id": "Int64", "uid": "UInt64"})
+
+    df = FILE_FORMATS["csv"].to_dataframe(str(path), None, None, column_types)
+    chunks = list(FILE_FORMATS["csv"].chunks(str(path), None, None, 2, column_types))
+
+    assert df["id"].tolist() == [9007199254740993, pd.NA, -1]
+    assert df["uid"].tolist() == [18446744073709551615, pd.NA, 1]
+    assert df.dtypes.astype(str).to_dict() == {"id": "Int64", "uid": "UInt64"}
+    assert pd.concat(chunks)["id"].tolist() == df["id"].tolist()
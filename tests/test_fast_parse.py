@@ -0,0 +1,32 @@
+import json
+from datetime import datetime
+
+from odd_ml.domain import DataEntities, DataEntity
+from odd_ml.helpers.fast_parse import parse_model
+from tests.fake_platform import data_entity, search_item
+
+
+def test_trusted_parsing_builds_nested_models():
+    raw = {**data_entity(1), "created_at": "2022-06-01T10:00:00.123Z"}
+    raw["source_list"] = [{"id": 2, "entity_classes": [], "external_name": "upstream"}]
+    text = json.dumps(raw)
+
+    trusted = parse_model(DataEntity, text, validate=False)
+    validated = parse_model(DataEntity, text)
+
+    assert trusted == validated
+    assert isinstance(trusted.created_at, datetime)
+    assert trusted.source_list[0].name == "upstream"
+    assert trusted.data_source.name == "ds_1"
+
+
+def test_items_to_dataframe_matches_models():
+    page = {"items": [search_item(1), search_item(2)]}
+
+    from_models = parse_model(DataEntities, json.dumps(page)).to_dataframe()
+    from_raw = DataEntities.items_to_dataframe(page["items"])
+
+    assert from_raw["id"].tolist() == [1, 2]
+    assert from_raw.drop(columns=["created_at", "updated_at"]).equals(
+        from_models.drop(columns=["created_at", "updated_at"])
+    )
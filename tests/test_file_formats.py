@@ -0,0 +1,57 @@
+import pandas as pd
+import pytest
+
+from odd_ml.dataset_storage.file_formats import (
+    FILE_FORMATS,
+    FileFormat,
+    compression_by_extension,
+    compression_by_magic,
+    format_by_extension,
+    format_by_magic,
+    register_file_format,
+)
+
+
+def test_format_by_extension_ignores_compression():
+    assert format_by_extension("orders.csv.gz").name == "csv"
+    assert format_by_extension("events.NDJSON").name == "jsonl"
+    assert format_by_extension("part-0.snappy.parquet").name == "parquet"
+    assert format_by_extension("_SUCCESS") is None
+    assert compression_by_extension("orders.csv.zst") == "zstd"
+
+
+def test_format_by_magic():
+    assert format_by_magic(b"PAR1\x15\x04").name == "parquet"
+    assert format_by_magic(b"ARROW1\x00\x00").name == "arrow"
+    assert format_by_magic(b"id,name\n") is None
+    assert compression_by_magic(b"\x1f\x8b\x08\x00") == "gzip"
+
+
+@pytest.fixture
+def tsv_format():
+    tsv = FileFormat(
+        name="tsv",
+        extensions=(".tsv",),
+        read=lambda source, columns, filters: pd.read_csv(
+            source, sep="\t", usecols=columns
+        ),
+    )
+    register_file_format(tsv)
+    yield tsv
+    FILE_FORMATS.pop("tsv")
+
+
+def test_registered_format_is_detected_and_converted(tsv_format, tmp_path):
+    (tmp_path / "a.tsv").write_text("a\tb\n1\tx\n2\ty\n")
+
+    assert format_by_extension("a.tsv.gz") is tsv_format
+    table = tsv_format.to_table(str(tmp_path / "a.tsv"), ["b"], None)
+    chunks = list(tsv_format.chunks(str(tmp_path / "a.tsv"), None, None, 1))
+
+    assert table.column("b").to_pylist() == ["x", "y"]
+    assert [len(c) for c in chunks] == [1, 1]
+
+
+def test_format_must_have_reader():
+    with pytest.raises(ValueError):
+        FileFormat(name="empty", extensions=(".empty",))
@@ -0,0 +1,182 @@
+import gzip
+import io
+from types import SimpleNamespace
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pyarrow import orc
+
+from odd_ml.dataset_storage.fsspec_storage import FsspecStorage
+from odd_ml.helpers.arrow_tables import table_to_dataframe
+from odd_ml.helpers.oddrn_to_uri import oddrn_to_uri
+
+
+def dataset(oddrn: str) -> SimpleNamespace:
+    return SimpleNamespace(id=1, oddrn=oddrn, entity_class_names=["DATA_SET"])
+
+
+def local_dataset(path) -> SimpleNamespace:
+    return dataset(f"//local/host/nas/path/{str(path).replace('/', ':')}")
+
+
+@pytest.fixture
+def partitioned(tmp_path):
+    for year in (2021, 2022):
+        folder = tmp_path / "orders" / f"year={year}"
+        folder.mkdir(parents=True)
+        df = pd.DataFrame({"id": [1, 2, 3], "amount": [10.0, 20.0, year]})
+        df.to_parquet(folder / "part.parquet")
+        df.to_feather(folder / "part.feather")
+    (tmp_path / "orders" / "_SUCCESS").touch()
+
+    return tmp_path / "orders"
+
+
+def test_oddrn_to_uri_by_scheme():
+    assert oddrn_to_uri("//local/host/nas/path/data:a.csv") == "file:///data/a.csv"
+    assert (
+        oddrn_to_uri("//gcs/cloud/gcp/buckets/bucket/keys/folder:a.csv")
+        == "gs://bucket/folder/a.csv"
+    )
+    with pytest.raises(ValueError):
+        oddrn_to_uri("//unknown/path")
+
+
+def test_read_local_partitioned_dataset(partitioned):
+    storage = FsspecStorage()
+    entity = local_dataset(partitioned)
+
+    df = storage.get_dataframe(entity, filters=[("year", "==", 2022)])
+    chunks = list(storage.iter_dataframe_chunks(entity, chunksize=2))
+
+    # parquet and feather files of each partition
+    assert len(df) == 6
+    assert set(df["year"]) == {"2022"}
+    assert [len(c) for c in chunks] == [2, 1] * 4
+    assert df.loc[df["amount"] > 100, "amount"].tolist() == [2022.0, 2022.0]
+
+
+@pytest.mark.parametrize("name", ["orders.csv", "orders.parquet", "orders.jsonl"])
+def test_chunks_of_file_are_bounded_and_reassemble(tmp_path, name):
+    df = pd.DataFrame({"id": range(10), "amount": [i * 1.5 for i in range(10)]})
+    path = tmp_path / name
+    if name.endswith(".csv"):
+        df.to_csv(path, index=False)
+    elif name.endswith(".jsonl"):
+        df.to_json(path, orient="records", lines=True)
+    else:
+        df.to_parquet(path, row_group_size=4)
+
+    chunks = list(FsspecStorage().iter_dataframe_chunks(local_dataset(path), 3))
+
+    assert all(0 < len(c) <= 3 for c in chunks)
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), df)
+
+
+def test_chunks_of_partitioned_folder_reassemble(partitioned):
+    storage = FsspecStorage()
+    entity = local_dataset(partitioned)
+    columns = ["id", "amount", "year"]
+
+    chunks = list(storage.iter_dataframe_chunks(entity, chunksize=2, columns=columns))
+    df = storage.get_dataframe(entity, columns=columns)
+
+    assert all(0 < len(c) <= 2 for c in chunks)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks).sort_values(columns).reset_index(drop=True),
+        df.sort_values(columns).reset_index(drop=True),
+    )
+
+
+def test_local_version_changes_with_files(partitioned):
+    storage = FsspecStorage(listings_ttl=0)
+    entity = local_dataset(partitioned)
+
+    version = storage.get_version(entity)
+    assert storage.get_version(entity) == version
+
+    pd.DataFrame({"id": [4]}).to_parquet(partitioned / "year=2023.parquet")
+    assert storage.get_version(entity) != version
+
+
+def test_custom_mapper_and_filesystem():
+    storage = FsspecStorage(
+        mappers={"mem": lambda oddrn: "memory://" + oddrn.split("/path/")[1]}
+    )
+    fs = storage.get_filesystem("memory")
+    with fs.open("/data/file.csv", "w") as file:
+        file.write("a,b\n1,2\n3,4\n")
+
+    df = storage.get_dataframe(dataset("//mem/path/data/file.csv"), columns=["b"])
+
+    assert df.to_dict("list") == {"b": [2, 4]}
+
+
+def test_read_local_dataset_as_table(partitioned):
+    storage = FsspecStorage()
+    entity = local_dataset(partitioned)
+
+    table = storage.get_table(
+        entity, columns=["id", "year"], filters=[("year", "==", 2022), ("id", ">", 1)]
+    )
+
+    assert table.column_names == ["id", "year"]
+    assert table.num_rows == 4
+    assert set(table.column("year").to_pylist()) == {"2022"}
+
+
+def test_partitions_have_same_dtype_in_dtype_backends(partitioned):
+    storage = FsspecStorage()
+    entity = local_dataset(partitioned)
+
+    numpy_df = storage.get_dataframe(entity)
+    table_df = table_to_dataframe(storage.get_table(entity))
+    pyarrow_df = table_to_dataframe(storage.get_table(entity), dtype_backend="pyarrow")
+
+    # partitions are strings as other string columns of each backend
+    assert numpy_df["year"].dtype == table_df["year"].dtype == object
+    assert pyarrow_df["year"].dtype == pd.StringDtype("pyarrow")
+    assert sorted(numpy_df["year"]) == sorted(table_df["year"])
+    assert sorted(numpy_df["year"]) == sorted(pyarrow_df["year"])
+
+
+def test_read_csv_with_pyarrow_strings(tmp_path):
+    (tmp_path / "users.csv").write_text("name,age\nann,30\nbob,40\n")
+    storage = FsspecStorage()
+    entity = local_dataset(tmp_path / "users.csv")
+
+    table = storage.get_table(entity, filters=[("age", ">", 35)])
+    df = table_to_dataframe(table, dtype_backend="pyarrow")
+
+    assert df["name"].dtype == pd.StringDtype("pyarrow")
+    assert df["name"].tolist() == ["bob"]
+
+
+def test_read_compressed_files(tmp_path):
+    df = pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]})
+    df.to_csv(tmp_path / "users.csv.gz", index=False)
+    df.to_json(tmp_path / "users.jsonl.xz", orient="records", lines=True)
+    # format and compression of file without extension are detected by content
+    df.to_parquet(tmp_path / "users", compression=None)
+    orc.write_table(pa.Table.from_pandas(df), str(tmp_path / "users.orc"))
+    storage = FsspecStorage()
+
+    for name in ("users.csv.gz", "users.jsonl.xz", "users", "users.orc"):
+        entity = local_dataset(tmp_path / name)
+        filtered = storage.get_dataframe(entity, filters=[("id", ">", 1)])
+        table = storage.get_table(entity, columns=["name"])
+
+        assert filtered["name"].tolist() == ["b", "c"], name
+        assert table.column("name").to_pylist() == ["a", "b", "c"], name
+
+
+def test_read_gzip_compressed_parquet_by_content(tmp_path):
+    buf = io.BytesIO()
+    pd.DataFrame({"id": range(5)}).to_parquet(buf)
+    (tmp_path / "data").write_bytes(gzip.compress(buf.getvalue()))
+    entity = local_dataset(tmp_path / "data")
+
+    chunks = list(FsspecStorage().iter_dataframe_chunks(entity, chunksize=2))
+
+    assert [c["id"].tolist() for c in chunks] == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,16 @@
+from odd_ml.helpers import hive_partitions
+
+
+def test_partitions_from_path():
+    path = "year=2022/month=05/part-0001.parquet"
+    assert hive_partitions(path) == {"year": "2022", "month": "05"}
+
+
+def test_not_partitioned_path():
+    assert hive_partitions("april/data.csv") == {}
+    assert hive_partitions("data.csv") == {}
+
+
+def test_equal_sign_in_value_and_file_name():
+    path = "/date=2022-05-01=x/id=1.csv"
+    assert hive_partitions(path) == {"date": "2022-05-01=x"}
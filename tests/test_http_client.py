@@ -0,0 +1,76 @@
+from typing import Tuple
+
+from odd_ml.http.http_client import HttpClient, HttpConfig, SearchConfig
+from tests.fake_platform import FakePlatformAdapter, search_item
+
+
+def test_session_uses_configured_pool():
+    config = HttpConfig(pool_maxsize=32, retries=5, backoff_factor=0.1)
+    client = HttpClient("http://localhost:8080", config)
+
+    adapter = client._HttpClient__session.get_adapter("http://localhost:8080")
+
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 5
+    assert adapter.max_retries.backoff_factor == 0.1
+    assert 503 in adapter.max_retries.status_forcelist
+
+    client.close()
+
+
+def test_same_session_for_http_and_https():
+    client = HttpClient("https://localhost:8080")
+    session = client._HttpClient__session
+
+    assert session.get_adapter("http://x") is session.get_adapter("https://x")
+
+
+def paginated_search(total: int):
+    def handler(request):
+        query = dict(p.split("=") for p in request.path_url.split("?")[1].split("&"))
+        page, size = int(query["page"]), int(query["size"])
+        ids = range((page - 1) * size + 1, min(page * size, total) + 1)
+        return 200, {
+            "items": [search_item(i) for i in ids],
+            "page_info": {"total": total, "has_next": page * size < total},
+        }
+
+    return handler
+
+
+def fake_client(routes) -> Tuple[HttpClient, FakePlatformAdapter]:
+    client = HttpClient("http://platform")
+    adapter = FakePlatformAdapter(routes)
+    client._HttpClient__session.mount("http://", adapter)
+    return client, adapter
+
+
+def test_search_id_is_reused_for_same_search():
+    client, adapter = fake_client(
+        {
+            ("POST", "/api/search"): lambda r: (200, {"search_id": "abc"}),
+            ("GET", "/api/search/abc"): paginated_search(total=100),
+        }
+    )
+
+    client.search(SearchConfig(query="a", page=1))
+    client.search(SearchConfig(query="a", page=2))
+    client.search(SearchConfig(query="b", page=1))
+
+    assert adapter.count("POST") == 2
+    assert adapter.count("GET") == 3
+
+
+def test_iter_search_walks_all_pages():
+    client, adapter = fake_client(
+        {
+            ("POST", "/api/search"): lambda r: (200, {"search_id": "abc"}),
+            ("GET", "/api/search/abc"): paginated_search(total=25),
+        }
+    )
+
+    ids = [item.id for item in client.iter_search(SearchConfig(size=10))]
+
+    assert ids == list(range(1, 26))
+    assert adapter.count("POST") == 1
+    assert adapter.count("GET") == 3
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ["pandas", "pandas_profiling", "IPython", "s3fs", "pyarrow"]
+
+
+def imported_modules(code: str) -> set:
+    script = f"{code}\nimport sys\nprint(' '.join(sys.modules))"
+    output = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+
+    return set(output.split())
+
+
+def test_metadata_client_does_not_import_heavy_dependencies():
+    modules = imported_modules(
+        "from odd_ml import Client\n"
+        "from odd_ml.domain import DataEntity\n"
+        "Client('http://platform')"
+    )
+
+    assert modules.isdisjoint(HEAVY_MODULES)
+
+
+def test_profilers_are_imported_on_first_access():
+    modules = imported_modules("from odd_ml.profiler import ProfileCache")
+    assert "numpy" not in modules
+
+    modules = imported_modules("from odd_ml.profiler import StreamingProfiler")
+    assert "numpy" in modules
+    assert "pandas_profiling" not in modules
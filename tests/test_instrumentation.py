@@ -0,0 +1,67 @@
+import pandas as pd
+import pytest
+
+from odd_ml.client import Client
+from odd_ml.profiler import StreamingProfiler
+from odd_ml.utils import Instrumentation, instrumentation
+from tests.fake_platform import FakePlatformAdapter, data_source
+
+
+@pytest.fixture
+def enabled():
+    instrumentation.reset()
+    instrumentation.enable()
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_disabled_instrumentation_records_nothing():
+    registry = Instrumentation()
+    events = []
+    registry.add_hook(events.append)
+
+    with registry.timer("op"):
+        registry.count("calls")
+
+    assert registry.stats() == {"counters": {}, "timings": {}}
+    assert events == []
+
+
+def test_timings_counters_and_hooks():
+    registry = Instrumentation()
+    registry.enable()
+    events = []
+    registry.add_hook(events.append)
+
+    for _ in range(3):
+        with registry.timer("op", key="value"):
+            registry.count("calls", 2)
+
+    stats = registry.stats()
+    assert stats["counters"] == {"calls": 6}
+    assert stats["timings"]["op"]["calls"] == 3
+    assert stats["timings"]["op"]["min"] <= stats["timings"]["op"]["max"]
+    assert [e.kind for e in events] == ["count", "timing"] * 3
+    assert events[1].tags == {"key": "value"}
+
+
+def test_client_stats_of_requests_and_profiling(enabled):
+    client = Client("http://platform")
+    adapter = FakePlatformAdapter(
+        {("GET", "/api/datasources"): lambda r: (200, {"items": [data_source()]})}
+    )
+    client._Client__http._HttpClient__session.mount("http://", adapter)
+
+    client.get_data_sources()
+    client.get_data_sources()
+    StreamingProfiler().profile(pd.DataFrame({"a": range(10)}))
+
+    stats = client.stats(reset=True)
+    assert stats["counters"]["http.requests"] == 2
+    assert stats["counters"]["http.bytes"] > 0
+    assert stats["counters"]["profiler.rows"] == 10
+    assert stats["timings"]["http.request"]["calls"] == 2
+    assert stats["timings"]["http.parse"]["calls"] == 2
+    assert stats["timings"]["profiler.profile"]["calls"] == 1
+    assert client.stats() == {"counters": {}, "timings": {}}
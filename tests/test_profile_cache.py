@@ -0,0 +1,44 @@
+import decimal
+
+import pytest
+
+from odd_ml.profiler import ProfileCache
+
+
+def test_profile_of_same_version(tmp_path):
+    cache = ProfileCache(str(tmp_path))
+    cache.set(1, "v1", {"rows": 10})
+
+    assert cache.get(1, "v1") == {"rows": 10}
+    assert cache.get(1, "v2") is None
+
+
+def test_new_version_replaces_old(tmp_path):
+    cache = ProfileCache(str(tmp_path))
+    cache.set(1, "v1", {"rows": 10})
+    cache.set(1, "v2", {"rows": 20})
+
+    assert cache.get(1, "v1") is None
+    assert len(cache) == 1
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ProfileCache(str(tmp_path), max_entries=2)
+    cache.set(1, "v", {})
+    cache.set(2, "v", {})
+    cache.set(3, "v", {})
+
+    assert len(cache) == 2
+
+
+def test_failed_write_leaves_no_files(tmp_path):
+    cache = ProfileCache(str(tmp_path))
+    profile = {"rows": 10}
+    profile["self"] = profile
+
+    with pytest.raises(ValueError):
+        cache.set(1, "v", profile)
+
+    assert list(tmp_path.iterdir()) == []
+    cache.set(1, "v", {"top": [[decimal.Decimal("1.10"), 2]]})
+    assert cache.get(1, "v") == {"top": [["1.10", 2]]}
@@ -0,0 +1,55 @@
+import time
+
+from odd_ml.http.http_client import HttpClient
+from odd_ml.http.response_cache import ResponseCache
+from tests.fake_platform import FakePlatformAdapter, data_entity
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+
+    cache.set("a", "1")
+    cache.set("b", "2")
+    time.sleep(0.01)
+    cache.hit("a")
+    cache.set("c", "3")
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert len(cache) == 2
+
+
+def test_stale_response_is_revalidated_with_etag(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=0)
+
+    def get_entity(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, {}
+        return 200, data_entity(1), {"ETag": '"v1"'}
+
+    client = HttpClient("http://platform", cache=cache)
+    adapter = FakePlatformAdapter({("GET", "/api/dataentities/"): get_entity})
+    client._HttpClient__session.mount("http://", adapter)
+
+    first = client.get_data_entity_by_id(1)
+    second = client.get_data_entity_by_id(1)
+
+    assert first == second
+    assert adapter.requests[1].headers["If-None-Match"] == '"v1"'
+    assert cache.stats() == {"hits": 1, "misses": 1, "revalidated": 1, "entries": 1}
+
+
+def test_fresh_response_is_read_locally(tmp_path):
+    cache = ResponseCache(str(tmp_path / "cache.sqlite"), ttl=60)
+    client = HttpClient("http://platform", cache=cache)
+    adapter = FakePlatformAdapter(
+        {("GET", "/api/dataentities/"): lambda r: (200, data_entity(1))}
+    )
+    client._HttpClient__session.mount("http://", adapter)
+
+    client.get_data_entity_by_id(1)
+    client.get_data_entity_by_id(1)
+
+    assert len(adapter.requests) == 1
+    assert cache.hits == 1
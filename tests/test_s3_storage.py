@@ -0,0 +1,100 @@
+import socket
+import time
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from odd_ml.dataset_storage.s3_storage import S3Storage
+from odd_ml.domain import AwsConfig
+
+moto_server = pytest.importorskip("moto.server")
+boto3 = pytest.importorskip("boto3")
+
+BUCKET = "bucket"
+
+
+def dataset(keys: str) -> SimpleNamespace:
+    oddrn = f"//s3/cloud/aws/buckets/{BUCKET}/keys/{keys.replace('/', ':')}"
+    return SimpleNamespace(id=1, oddrn=oddrn, entity_class_names=["DATA_SET"])
+
+
+def csv(ids) -> bytes:
+    return pd.DataFrame({"id": ids}).to_csv(index=False).encode()
+
+
+@pytest.fixture(scope="module")
+def endpoint_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+
+    server = moto_server.ThreadedMotoServer(port=port)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def s3(endpoint_url):
+    client = boto3.client(
+        "s3",
+        endpoint_url=endpoint_url,
+        region_name="us-east-1",
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+    )
+    client.create_bucket(Bucket=BUCKET)
+    yield client
+
+    for obj in client.list_objects_v2(Bucket=BUCKET).get("Contents", []):
+        client.delete_object(Bucket=BUCKET, Key=obj["Key"])
+    client.delete_bucket(Bucket=BUCKET)
+
+
+def storage(endpoint_url, listings_ttl: float = 60.0) -> S3Storage:
+    config = AwsConfig(
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+        aws_region="us-east-1",
+        aws_endpoint_url=endpoint_url,
+    )
+    return S3Storage(config, listings_ttl=listings_ttl)
+
+
+def test_read_folder_and_file_without_sibling_prefixes(s3, endpoint_url):
+    s3.put_object(Bucket=BUCKET, Key="orders/year=2021/part.csv", Body=csv([1, 2]))
+    s3.put_object(Bucket=BUCKET, Key="orders/year=2022/part.csv", Body=csv([3]))
+    s3.put_object(Bucket=BUCKET, Key="orders2/part.csv", Body=csv([100]))
+    s3.put_object(Bucket=BUCKET, Key="orders.csv", Body=csv([200]))
+    s3_storage = storage(endpoint_url)
+
+    folder = s3_storage.get_dataframe(dataset("orders"))
+    file = s3_storage.get_dataframe(dataset("orders2/part.csv"))
+
+    assert sorted(folder["id"]) == [1, 2, 3]
+    assert sorted(folder["year"]) == ["2021", "2021", "2022"]
+    assert file["id"].tolist() == [100]
+
+
+def test_listing_is_cached_until_expiration(s3, endpoint_url):
+    s3.put_object(Bucket=BUCKET, Key="events/1.csv", Body=csv([1]))
+    cached, expiring = storage(endpoint_url), storage(endpoint_url, listings_ttl=0.2)
+    cached.get_dataframe(dataset("events"))
+    expiring.get_dataframe(dataset("events"))
+
+    s3.put_object(Bucket=BUCKET, Key="events/2.csv", Body=csv([2]))
+    time.sleep(0.3)
+
+    assert cached.get_dataframe(dataset("events"))["id"].tolist() == [1]
+    assert sorted(expiring.get_dataframe(dataset("events"))["id"]) == [1, 2]
+
+
+def test_chunks_of_s3_folder_reassemble(s3, endpoint_url):
+    s3.put_object(Bucket=BUCKET, Key="big/a.csv", Body=csv(range(5)))
+    s3.put_object(Bucket=BUCKET, Key="big/b.csv", Body=csv(range(5, 12)))
+
+    chunks = list(storage(endpoint_url).iter_dataframe_chunks(dataset("big"), 3))
+
+    assert all(0 < len(c) <= 3 for c in chunks)
+    assert sorted(pd.concat(chunks)["id"]) == list(range(12))
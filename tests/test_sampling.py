@@ -0,0 +1,23 @@
+import pandas as pd
+
+from odd_ml.profiler.sampling import sample_dataframe
+
+df = pd.DataFrame({"a": range(1000), "label": ["x"] * 900 + ["y"] * 100})
+
+
+def test_small_dataframe_is_not_sampled():
+    assert sample_dataframe(df, max_rows=1000) is df
+
+
+def test_random_sample_is_capped():
+    sample = sample_dataframe(df, max_rows=100, random_state=1)
+
+    assert len(sample) == 100
+    assert sample["a"].is_unique
+
+
+def test_stratified_sample_keeps_proportions():
+    sample = sample_dataframe(df, max_rows=100, stratify_by="label", random_state=1)
+
+    assert len(sample) == 100
+    assert sample["label"].value_counts().to_dict() == {"x": 90, "y": 10}
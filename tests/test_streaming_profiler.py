@@ -0,0 +1,139 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from odd_ml.profiler import StreamingProfiler
+
+rng = np.random.default_rng(0)
+df = pd.DataFrame(
+    {
+        "x": rng.normal(10, 2, 20_000),
+        "id": np.arange(20_000),
+        "label": rng.choice(["a", "b", "c"], 20_000, p=[0.6, 0.3, 0.1]),
+        "nullable": [None if i % 4 == 0 else i for i in range(20_000)],
+    }
+)
+
+
+def chunks(dataframe, size):
+    return [dataframe.iloc[i : i + size] for i in range(0, len(dataframe), size)]
+
+
+def test_statistics_of_chunks_are_exact():
+    summary = StreamingProfiler().profile_chunks(chunks(df, 3000))
+    x = summary["columns"]["x"]
+
+    assert summary["rows"] == 20_000
+    assert x["count"] == 20_000
+    assert x["mean"] == pytest.approx(df["x"].mean())
+    assert x["std"] == pytest.approx(df["x"].std())
+    assert x["min"] == df["x"].min()
+    assert x["max"] == df["x"].max()
+    assert summary["columns"]["nullable"]["nulls"] == 5000
+
+
+def test_approximate_statistics():
+    summary = StreamingProfiler(random_state=1).profile_chunks(chunks(df, 3000))
+
+    assert summary["columns"]["id"]["distinct"] == pytest.approx(20_000, rel=0.05)
+    assert summary["columns"]["label"]["distinct"] == 3
+    assert summary["columns"]["x"]["quantiles"]["0.5"] == pytest.approx(10, abs=0.2)
+    assert [v for v, _ in summary["columns"]["label"]["top"]] == ["a", "b", "c"]
+
+
+def test_merge_of_partial_results():
+    profiler = StreamingProfiler()
+    partials = [profiler.partial(chunk) for chunk in chunks(df, 7000)]
+
+    merged = profiler.summary(profiler.merge(partials))
+    single = profiler.profile(df)
+
+    for key in ("count", "nulls", "min", "max", "distinct"):
+        assert merged["columns"]["id"][key] == single["columns"]["id"][key]
+    assert merged["columns"]["label"]["top"] == single["columns"]["label"]["top"]
+    assert merged["columns"]["x"]["mean"] == pytest.approx(
+        single["columns"]["x"]["mean"]
+    )
+    assert merged["columns"]["x"]["std"] == pytest.approx(single["columns"]["x"]["std"])
+
+
+def test_moments_of_mixed_dtype_chunks_use_numeric_values_only():
+    numeric = pd.DataFrame({"x": [10.0, 20.0, 30.0, 40.0]})
+    mixed = [numeric, pd.DataFrame({"x": list("abcd")})]
+    profiler = StreamingProfiler()
+
+    streamed = profiler.profile_chunks(mixed)["columns"]["x"]
+    partials = [profiler.partial(chunk) for chunk in mixed]
+    merged = profiler.summary(profiler.merge(partials))["columns"]["x"]
+
+    for x in (streamed, merged):
+        assert x["count"] == 8
+        assert x["mean"] == pytest.approx(25.0)
+        assert x["std"] == pytest.approx(numeric["x"].std())
+
+
+def test_parallel_columns_profiling():
+    with StreamingProfiler(n_jobs=2) as profiler:
+        parallel = profiler.profile_chunks(chunks(df, 7000))
+    single = StreamingProfiler().profile_chunks(chunks(df, 7000))
+
+    assert list(parallel["columns"]) == list(df.columns)
+    for name in df.columns:
+        for key in ("count", "nulls", "min", "max", "distinct"):
+            assert parallel["columns"][name][key] == single["columns"][name][key]
+    assert parallel["columns"]["label"]["top"] == single["columns"]["label"]["top"]
+    assert parallel["columns"]["x"]["mean"] == pytest.approx(df["x"].mean())
+
+
+def test_parallel_profiling_of_extension_dtypes_is_the_same_as_sequential():
+    values = pd.DataFrame(
+        {
+            "category": pd.Categorical([1, 2, 2, 3] * 10),
+            "nullable": pd.array(range(40), dtype="Int64"),
+            "flag": pd.array([True, False] * 20, dtype="boolean"),
+        }
+    )
+
+    with StreamingProfiler(n_jobs=2, random_state=0) as profiler:
+        parallel = profiler.profile(values)
+    single = StreamingProfiler(random_state=0).profile(values)
+
+    assert parallel["columns"]["category"]["type"] == "categorical"
+    for name in values.columns:
+        assert parallel["columns"][name] == single["columns"][name]
+
+
+def test_nested_values_are_counted_by_repr():
+    nested = pd.DataFrame(
+        {
+            "record": [{"a": i % 3} for i in range(100)],
+            "items": [[i % 2] if i % 5 else None for i in range(100)],
+        }
+    )
+
+    summary = StreamingProfiler().profile_chunks(chunks(nested, 30))
+    record, items = summary["columns"]["record"], summary["columns"]["items"]
+
+    assert record["distinct"] == 3
+    assert record["top"][0] == ["{'a': 0}", 34]
+    assert items["nulls"] == 20
+    assert items["distinct"] == 2
+
+
+def test_summary_of_timedeltas_and_decimals_is_json_serializable():
+    import decimal
+    import json
+
+    values = pd.DataFrame(
+        {
+            "duration": pd.to_timedelta([1, 2, 2], unit="s"),
+            "price": [decimal.Decimal("1.10"), decimal.Decimal("2.50"), None],
+            "day": pd.to_datetime(["2022-01-01", "2022-01-02", None]),
+        }
+    )
+
+    summary = json.loads(json.dumps(StreamingProfiler().profile(values)))
+
+    assert summary["columns"]["duration"]["top"][0] == ["0 days 00:00:02", 2]
+    assert summary["columns"]["price"]["top"][0][0] in ("1.10", "2.50")
+    assert summary["columns"]["day"]["min"] == "2022-01-01T00:00:00"
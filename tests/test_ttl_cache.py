@@ -0,0 +1,28 @@
+import time
+
+from odd_ml.utils import TtlCache
+
+
+def test_returns_value_before_expiration():
+    cache = TtlCache(ttl=60)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("unknown") is None
+
+
+def test_forgets_expired_value():
+    cache = TtlCache(ttl=0.01)
+    cache.set("key", "value")
+    time.sleep(0.02)
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_invalidate():
+    cache = TtlCache(ttl=60)
+    cache.set("key", "value")
+    cache.invalidate("key")
+
+    assert cache.get("key") is None